@@ -2,12 +2,13 @@ from .security_agent import security_analysis_agent
 from .performance_agent import performance_analysis_agent
 from .bug_agent import bug_detection_agent
 from .test_agent import test_generation_agent
-from .consolidation_agent import consolidation_agent
+from .consolidation_agent import consolidation_agent, merge_chunk_results
 
 __all__ = [
     'security_analysis_agent',
     'performance_analysis_agent', 
     'bug_detection_agent',
     'test_generation_agent',
-    'consolidation_agent'
+    'consolidation_agent',
+    'merge_chunk_results'
 ]
\ No newline at end of file
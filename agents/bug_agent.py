@@ -1,109 +1,100 @@
-import ast
 import logging
 from typing import Dict, Any, List
 from models import CodeReviewState, BugAnalysis, BugReport
-from analyzers.bug_detector import BugDetector
+from analyzers.context import get_analysis_context
+from analyzers.findings import FindingCollector
 
 logger = logging.getLogger(__name__)
 
+# 중복 라인 비율이 높을 때의 코드 스멜 (청크 결과 병합 시 전체 파일 기준으로 다시 판단)
+DUPLICATION_SMELL = "High code duplication detected"
+# 기술 부채 규칙 (추가 순서, 청크 결과 병합 시 같은 순서로 정렬)
+TECHNICAL_DEBT_RULES = ("todo_comment", "magic_number")
+
 def bug_detection_agent(state: CodeReviewState) -> Dict[str, Any]:
     """버그 감지를 수행하는 에이전트"""
     logger.info("Starting bug detection analysis")
     
     try:
-        # AST 파싱을 통한 버그 패턴 분석
-        tree = ast.parse(state.code_content)
-        detector = BugDetector()
-        detector.visit(tree)
-        
-        # 코드 스멜 분석
-        code_smells: List[str] = []
+        # 공유 컨텍스트의 단일 순회 규칙 결과 사용
+        context = get_analysis_context(state)
+        detector = context.suite.bugs
+        smell_detector = context.suite.code_smells
         
-        # 함수 길이 분석
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                func_length = node.end_lineno - node.lineno if hasattr(node, 'end_lineno') else 0
-                if func_length > 30:
-                    code_smells.append(f"Long function: {node.name} ({func_length} lines)")
-        
-        # 클래스 분석
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                methods = [n for n in node.body if isinstance(n, ast.FunctionDef)]
-                if len(methods) > 15:
-                    code_smells.append(f"Large class: {node.name} ({len(methods)} methods)")
+        # 코드 스멜 분석 (긴 함수, 큰 클래스)
+        code_smells: List[str] = smell_detector.code_smells
         
         # 중복 코드 패턴 (간단한 휴리스틱)
-        lines = state.code_content.split('\n')
-        stripped_lines = [line.strip() for line in lines if line.strip()]
-        unique_lines = set(stripped_lines)
-        if len(stripped_lines) > 0 and len(unique_lines) / len(stripped_lines) < 0.8:
-            code_smells.append("High code duplication detected")
+        lines = context.lines
+        if has_high_duplication(lines):
+            code_smells.append(DUPLICATION_SMELL)
         
-        # 기술 부채 항목
-        technical_debt_items: List[str] = []
+        # 기술 부채 항목 (규칙별 상한 적용, 전체 개수/라인 범위는 그룹으로 요약)
+        technical_debt = FindingCollector(state.finding_cap, state.full_findings)
         
         # TODO/FIXME 주석 찾기
         for i, line in enumerate(lines, 1):
             if any(keyword in line.upper() for keyword in ['TODO', 'FIXME', 'HACK', 'XXX']):
-                technical_debt_items.append(f"Line {i}: {line.strip()}")
+                technical_debt.add("todo_comment", i, f"Line {i}: {line.strip()}")
         
         # 매직 넘버 감지
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
-                if node.value not in [0, 1, -1] and abs(node.value) > 1:
-                    technical_debt_items.append(f"Magic number {node.value} at line {node.lineno}")
+        for value, lineno in smell_detector.magic_numbers:
+            technical_debt.add("magic_number", lineno, f"Magic number {value} at line {lineno}")
         
         # 유지보수성 점수 계산
-        maintainability_score = 8.0
-        
-        # 버그 수에 따른 감점
-        critical_bugs = [b for b in detector.bugs if b.severity == "HIGH"]
-        medium_bugs = [b for b in detector.bugs if b.severity == "MEDIUM"]
-        
-        maintainability_score -= len(critical_bugs) * 2.0
-        maintainability_score -= len(medium_bugs) * 1.0
-        maintainability_score -= len(code_smells) * 0.5
-        maintainability_score -= len(technical_debt_items) * 0.2
-        
-        maintainability_score = max(0.0, min(10.0, maintainability_score))
+        maintainability_score = calculate_maintainability(detector.bugs, code_smells, technical_debt.total)
         
         # BugAnalysis 객체 생성
         bug_analysis = BugAnalysis(
             bugs=detector.bugs,
             code_smells=code_smells,
             maintainability_score=maintainability_score,
-            technical_debt_items=technical_debt_items
+            technical_debt_items=technical_debt.items,
+            finding_groups=technical_debt.groups(),
+            finding_details=technical_debt.details()
         )
         
-        # 상태 업데이트
-        state.bug_analysis = bug_analysis
-        state.completion_status["bug_detection"] = True
-        
         # 신뢰도 점수
         confidence = 0.85
         if len(detector.bugs) == 0 and len(code_smells) == 0:
             confidence = 0.75  # 아무것도 발견되지 않으면 약간 낮은 신뢰도
         
-        state.confidence_scores["bug_detection"] = confidence
-        state.messages.append(f"Bug detection completed: found {len(detector.bugs)} bugs and {len(code_smells)} code smells")
-        
         logger.info(f"Bug detection completed with {len(detector.bugs)} bugs found")
         
+        # 상태 변경분만 반환 (병렬 실행 시 리듀서가 병합)
         return {
             "bug_analysis": bug_analysis,
-            "completion_status": state.completion_status,
-            "confidence_scores": state.confidence_scores,
-            "messages": state.messages
+            "completion_status": {"bug_detection": True},
+            "confidence_scores": {"bug_detection": confidence},
+            "messages": [f"Bug detection completed: found {len(detector.bugs)} bugs and {len(code_smells)} code smells"]
         }
         
     except Exception as e:
         error_msg = f"Bug detection failed: {str(e)}"
         logger.error(error_msg)
-        state.error_log.append(error_msg)
-        state.completion_status["bug_detection"] = False
         
         return {
-            "error_log": state.error_log,
-            "completion_status": state.completion_status
-        }
\ No newline at end of file
+            "error_log": [error_msg],
+            "completion_status": {"bug_detection": False}
+        }
+
+def has_high_duplication(lines: List[str]) -> bool:
+    """빈 줄을 뺀 라인 중 고유 라인 비율이 0.8 미만인지"""
+    stripped_lines = [line.strip() for line in lines if line.strip()]
+    unique_lines = set(stripped_lines)
+    return len(stripped_lines) > 0 and len(unique_lines) / len(stripped_lines) < 0.8
+
+def calculate_maintainability(bugs: List[BugReport], code_smells: List[str], debt_count: int) -> float:
+    """버그 심각도, 코드 스멜 수, 기술 부채 항목 수(상한 적용 전 전체)에 따른 유지보수성 점수"""
+    maintainability_score = 8.0
+    
+    # 버그 수에 따른 감점
+    critical_bugs = [b for b in bugs if b.severity == "HIGH"]
+    medium_bugs = [b for b in bugs if b.severity == "MEDIUM"]
+    
+    maintainability_score -= len(critical_bugs) * 2.0
+    maintainability_score -= len(medium_bugs) * 1.0
+    maintainability_score -= len(code_smells) * 0.5
+    maintainability_score -= debt_count * 0.2
+    
+    return max(0.0, min(10.0, maintainability_score))
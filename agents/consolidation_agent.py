@@ -1,6 +1,16 @@
 import logging
-from typing import Dict, Any
-from models import CodeReviewState
+from typing import Dict, Any, List, Optional
+from models import (
+    CodeReviewState, SecurityAnalysis, SecurityVulnerability, PerformanceAnalysis, BugAnalysis,
+    TestGenerationResult
+)
+from analyzers.findings import FindingCollector
+from agents.security_agent import assess_vulnerabilities, combine_vulnerabilities
+from agents.performance_agent import assess_performance_issues
+from agents.bug_agent import (
+    DUPLICATION_SMELL, TECHNICAL_DEBT_RULES, has_high_duplication, calculate_maintainability
+)
+from agents.test_agent import integration_test_suggestion, estimate_coverage
 
 logger = logging.getLogger(__name__)
 
@@ -37,10 +47,12 @@ def consolidation_agent(state: CodeReviewState) -> Dict[str, Any]:
             }
         }
         
-        # 상태 업데이트
-        state.current_phase = "completed"
-        state.completion_status["consolidation"] = True
-        state.messages.append("Code review consolidation completed successfully")
+        # 상태 변경분 (리듀서가 병합)
+        consolidated_results.update({
+            "current_phase": "completed",
+            "completion_status": {**state.completion_status, "consolidation": True},
+            "messages": ["Code review consolidation completed successfully"]
+        })
         
         logger.info("Consolidation completed successfully")
         
@@ -49,12 +61,10 @@ def consolidation_agent(state: CodeReviewState) -> Dict[str, Any]:
     except Exception as e:
         error_msg = f"Consolidation failed: {str(e)}"
         logger.error(error_msg)
-        state.error_log.append(error_msg)
-        state.completion_status["consolidation"] = False
         
         return {
-            "error_log": state.error_log,
-            "completion_status": state.completion_status
+            "error_log": [error_msg],
+            "completion_status": {"consolidation": False}
         }
 
 def summarize_findings(state: CodeReviewState) -> str:
@@ -180,4 +190,96 @@ def generate_recommendations(state: CodeReviewState) -> list:
         recommendations.append("Implement unit tests for critical functions")
         recommendations.append("Add integration tests for component interactions")
     
-    return recommendations[:6]  # 상위 6개 권장사항
\ No newline at end of file
+    return recommendations[:6]  # 상위 6개 권장사항
+
+def merge_chunk_results(chunk_results: List[Dict[str, Any]], source: str,
+                        finding_cap: int = 0, full_findings: bool = False,
+                        taint_vulnerabilities: Optional[List[SecurityVulnerability]] = None) -> Dict[str, Any]:
+    """큰 모듈을 나눈 청크별 리뷰 결과(라인 순서)를 전체 파일 하나의 결과로 병합
+
+    청크는 원본 라인 번호를 유지하므로 발견 항목은 이어 붙이기만 하고, 점수/위험도/요약은 각 에이전트와
+    같은 계산을 병합된 목록에 다시 적용한다. 라인 수와 중복 코드 비율은 전체 소스 기준으로 다시 구한다.
+    청크는 규칙별 상한 없이 전체 상세까지 분석해야(finding_cap=0, full_findings=True) 개수와 라인 범위가
+    정확하며, 여기서 finding_cap/full_findings를 적용한다. 한 청크라도 실패한 에이전트는 결과가 None이다.
+    청크는 입력 흐름 분석을 하지 않으므로 모듈 전체를 한 번 분석한 흐름 분석 결과(taint_vulnerabilities)를
+    보안 에이전트와 같은 방식으로 합쳐 청크 경계를 넘는 흐름도 보고한다.
+    워크플로우의 consolidation 노드가 아니라 실행기(executor.AnalysisExecutor._run_chunks)가 청크별 최종 결과에 호출한다.
+    """
+    summary = {
+        node: all((result.get("summary") or {}).get(node, False) for result in chunk_results)
+        for node in (chunk_results[0].get("summary") or {})
+    }
+    sections = {
+        key: [result.get(key) for result in chunk_results]
+        for key in ("security", "performance", "bugs", "tests")
+    }
+    complete = {key: all(section is not None for section in values) for key, values in sections.items()}
+
+    security = None
+    if complete["security"]:
+        vulnerabilities = [v for section in sections["security"] for v in SecurityAnalysis(**section).vulnerabilities]
+        security = assess_vulnerabilities(combine_vulnerabilities(vulnerabilities, taint_vulnerabilities or []))
+
+    performance = None
+    if complete["performance"]:
+        issues = [i for section in sections["performance"] for i in PerformanceAnalysis(**section).issues]
+        performance = assess_performance_issues(issues, len(source.split('\n')))
+
+    bugs = None
+    if complete["bugs"]:
+        analyses = [BugAnalysis(**section) for section in sections["bugs"]]
+        smells = [smell for analysis in analyses for smell in analysis.code_smells if smell != DUPLICATION_SMELL]
+        # 분석기 순서대로 긴 함수 -> 큰 클래스 -> 중복 코드
+        code_smells = [smell for smell in smells if smell.startswith("Long function")]
+        code_smells += [smell for smell in smells if not smell.startswith("Long function")]
+        if has_high_duplication(source.split('\n')):
+            code_smells.append(DUPLICATION_SMELL)
+        technical_debt = FindingCollector.merged(
+            [(analysis.finding_groups, analysis.finding_details) for analysis in analyses],
+            finding_cap, full_findings, TECHNICAL_DEBT_RULES
+        )
+        bug_reports = [bug for analysis in analyses for bug in analysis.bugs]
+        bugs = BugAnalysis(
+            bugs=bug_reports,
+            code_smells=code_smells,
+            maintainability_score=calculate_maintainability(bug_reports, code_smells, technical_debt.total),
+            technical_debt_items=technical_debt.items,
+            finding_groups=technical_debt.groups(),
+            finding_details=technical_debt.details()
+        )
+
+    tests = merge_test_suggestions(
+        [TestGenerationResult(**section) for section in sections["tests"]], finding_cap, full_findings
+    ) if complete["tests"] else None
+
+    return {
+        "security": security.dict() if security else None,
+        "performance": performance.dict() if performance else None,
+        "bugs": bugs.dict() if bugs else None,
+        "tests": tests.dict() if tests else None,
+        "summary": summary
+    }
+
+def merge_test_suggestions(suggestions: List[TestGenerationResult], finding_cap: int = 0,
+                           full_findings: bool = False) -> Optional[TestGenerationResult]:
+    """청크별 테스트 제안 병합 (함수별 제안 -> 클래스 제안 -> 통합 테스트 순서, 통합 테스트는 전체 함수 수로 판단)"""
+    if not suggestions:
+        return None
+    cases = [case for suggestion in suggestions for case in suggestion.test_cases]
+    test_cases = [case for case in cases if case.test_type not in ("Class Test", "Integration Test")]
+    test_cases += [case for case in cases if case.test_type == "Class Test"]
+    if sum(1 for case in cases if case.test_type == "Unit Test") > 3:
+        test_cases.append(integration_test_suggestion())
+    mock_requirements = FindingCollector.merged(
+        [(suggestion.finding_groups, suggestion.finding_details) for suggestion in suggestions],
+        finding_cap, full_findings
+    )
+    return TestGenerationResult(
+        test_cases=test_cases,
+        mock_requirements=mock_requirements.items,
+        setup_instructions=suggestions[0].setup_instructions,
+        coverage_estimate=estimate_coverage(len(test_cases)),
+        framework_recommendations=suggestions[0].framework_recommendations,
+        finding_groups=mock_requirements.groups(),
+        finding_details=mock_requirements.details()
+    )
@@ -1,8 +1,8 @@
-import ast
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
 from models import CodeReviewState, PerformanceAnalysis, PerformanceIssue
-from analyzers.performance_analyzer import PerformancePatternAnalyzer
+from analyzers.context import get_analysis_context
+from analyzers.project import project_loop_issues
 
 logger = logging.getLogger(__name__)
 
@@ -11,92 +11,91 @@ def performance_analysis_agent(state: CodeReviewState) -> Dict[str, Any]:
     logger.info("Starting performance analysis")
     
     try:
-        # AST 파싱을 통한 성능 패턴 분석
-        tree = ast.parse(state.code_content)
-        analyzer = PerformancePatternAnalyzer()
-        analyzer.visit(tree)
+        # 공유 컨텍스트의 단일 순회 규칙 결과 사용
+        context = get_analysis_context(state)
+        analyzer = context.suite.performance
+        issues = analyzer.issues
+        # 여러 파일 리뷰이면 반복문 안에서 부르는 다른 모듈 함수의 반복문도 중첩 깊이에 포함
+        if context.project is not None:
+            issues = issues + project_loop_issues(context.tree, context.project)
         
-        # 복잡도 점수 계산 (간단한 휴리스틱)
-        complexity_score = 5.0  # 기본 점수
-        
-        # 코드 라인 수에 따른 복잡도 조정
-        lines_count = len(state.code_content.split('\n'))
-        if lines_count > 100:
-            complexity_score += 1.0
-        if lines_count > 500:
-            complexity_score += 2.0
-            
-        # 발견된 성능 이슈에 따른 복잡도 조정
-        critical_issues = [i for i in analyzer.issues if i.severity == "HIGH"]
-        medium_issues = [i for i in analyzer.issues if i.severity == "MEDIUM"]
-        
-        complexity_score += len(critical_issues) * 2.0
-        complexity_score += len(medium_issues) * 1.0
-        
-        # 메모리 효율성 점수 (0-10)
-        memory_efficiency = 8.0
-        for issue in analyzer.issues:
-            if "memory" in issue.description.lower() or "string concatenation" in issue.type.lower():
-                memory_efficiency -= 1.5
-        memory_efficiency = max(0.0, min(10.0, memory_efficiency))
-        
-        # 최적화 제안
-        optimizations = []
-        if any("nested" in issue.type.lower() for issue in analyzer.issues):
-            optimizations.append("Consider algorithm optimization for nested operations")
-        if any("string" in issue.type.lower() for issue in analyzer.issues):
-            optimizations.append("Use efficient string operations (join, f-strings)")
-        if any("loop" in issue.type.lower() for issue in analyzer.issues):
-            optimizations.append("Replace loops with list comprehensions where applicable")
-        
-        if not optimizations:
-            optimizations.append("Code shows good performance patterns")
-        
-        # 벤치마크 제안
-        benchmark_suggestions = [
-            "Add timing decorators to critical functions",
-            "Use cProfile for detailed performance profiling",
-            "Consider memory profiling with memory_profiler",
-            "Set up performance regression tests"
-        ]
-        
-        # PerformanceAnalysis 객체 생성
-        performance_analysis = PerformanceAnalysis(
-            issues=analyzer.issues,
-            complexity_score=complexity_score,
-            memory_efficiency=memory_efficiency,
-            optimizations=optimizations,
-            benchmark_suggestions=benchmark_suggestions
-        )
-        
-        # 상태 업데이트
-        state.performance_metrics = performance_analysis
-        state.completion_status["performance"] = True
+        # 복잡도/메모리 효율 점수와 최적화 제안 계산 후 PerformanceAnalysis 객체 생성
+        performance_analysis = assess_performance_issues(issues, context.line_count)
         
         # 신뢰도 점수 계산
         confidence = 0.8
-        if len(analyzer.issues) == 0:
+        if len(issues) == 0:
             confidence = 0.7  # 이슈가 없을 때는 약간 낮은 신뢰도
         
-        state.confidence_scores["performance"] = confidence
-        state.messages.append(f"Performance analysis completed: found {len(analyzer.issues)} performance issues")
-        
-        logger.info(f"Performance analysis completed with {len(analyzer.issues)} issues found")
+        logger.info(f"Performance analysis completed with {len(issues)} issues found")
         
+        # 상태 변경분만 반환 (병렬 실행 시 리듀서가 병합)
         return {
             "performance_metrics": performance_analysis,
-            "completion_status": state.completion_status,
-            "confidence_scores": state.confidence_scores,
-            "messages": state.messages
+            "completion_status": {"performance": True},
+            "confidence_scores": {"performance": confidence},
+            "messages": [f"Performance analysis completed: found {len(issues)} performance issues"]
         }
         
     except Exception as e:
         error_msg = f"Performance analysis failed: {str(e)}"
         logger.error(error_msg)
-        state.error_log.append(error_msg)
-        state.completion_status["performance"] = False
         
         return {
-            "error_log": state.error_log,
-            "completion_status": state.completion_status
-        }
\ No newline at end of file
+            "error_log": [error_msg],
+            "completion_status": {"performance": False}
+        }
+
+def assess_performance_issues(issues: List[PerformanceIssue], line_count: int) -> PerformanceAnalysis:
+    """성능 이슈 목록과 라인 수로 복잡도/메모리 효율 점수와 최적화 제안을 계산 (청크 결과 병합에서도 사용)"""
+    # 복잡도 점수 계산 (간단한 휴리스틱)
+    complexity_score = 5.0  # 기본 점수
+    
+    # 코드 라인 수에 따른 복잡도 조정
+    if line_count > 100:
+        complexity_score += 1.0
+    if line_count > 500:
+        complexity_score += 2.0
+        
+    # 발견된 성능 이슈에 따른 복잡도 조정
+    critical_issues = [i for i in issues if i.severity == "HIGH"]
+    medium_issues = [i for i in issues if i.severity == "MEDIUM"]
+    
+    complexity_score += len(critical_issues) * 2.0
+    complexity_score += len(medium_issues) * 1.0
+    
+    # 메모리 효율성 점수 (0-10)
+    memory_efficiency = 8.0
+    for issue in issues:
+        if "memory" in issue.description.lower() or "string concatenation" in issue.type.lower():
+            memory_efficiency -= 1.5
+    memory_efficiency = max(0.0, min(10.0, memory_efficiency))
+    
+    # 최적화 제안
+    optimizations = []
+    if any("nested" in issue.type.lower() for issue in issues):
+        optimizations.append("Consider algorithm optimization for nested operations")
+    if any("string" in issue.type.lower() for issue in issues):
+        optimizations.append("Use efficient string operations (join, f-strings)")
+    if any("loop" in issue.type.lower() for issue in issues):
+        optimizations.append("Replace loops with list comprehensions where applicable")
+    
+    if not optimizations:
+        optimizations.append("Code shows good performance patterns")
+    
+    # 벤치마크 제안
+    benchmark_suggestions = [
+        "Add timing decorators to critical functions",
+        "Use cProfile for detailed performance profiling",
+        "Consider memory profiling with memory_profiler",
+        "Set up performance regression tests"
+    ]
+    
+    # PerformanceAnalysis 객체 생성
+    return PerformanceAnalysis(
+        issues=issues,
+        complexity_score=complexity_score,
+        memory_efficiency=memory_efficiency,
+        optimizations=optimizations,
+        benchmark_suggestions=benchmark_suggestions
+    )
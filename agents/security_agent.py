@@ -1,8 +1,7 @@
-import ast
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
 from models import CodeReviewState, SecurityAnalysis, SecurityVulnerability
-from analyzers.security_analyzer import SecurityASTAnalyzer
+from analyzers.context import get_analysis_context
 
 logger = logging.getLogger(__name__)
 
@@ -11,78 +10,95 @@ def security_analysis_agent(state: CodeReviewState) -> Dict[str, Any]:
     logger.info("Starting security analysis")
     
     try:
-        # AST 파싱을 통한 정적 분석
-        tree = ast.parse(state.code_content)
-        analyzer = SecurityASTAnalyzer()
-        analyzer.visit(tree)
+        # 공유 컨텍스트의 단일 순회 규칙 결과 사용
+        context = get_analysis_context(state)
+        analyzer = context.suite.security
         
-        # 심각도별 분류
-        critical_vulns = [v for v in analyzer.vulnerabilities if v.severity == "CRITICAL"]
-        high_vulns = [v for v in analyzer.vulnerabilities if v.severity == "HIGH"]
-        medium_vulns = [v for v in analyzer.vulnerabilities if v.severity == "MEDIUM"]
-        low_vulns = [v for v in analyzer.vulnerabilities if v.severity == "LOW"]
+        # 입력 흐름(taint) 분석 결과와 합침 (같은 라인의 같은 유형은 흐름 분석 결과를 사용)
+        # 여러 파일 리뷰이면 import한 다른 모듈 함수의 요약으로 모듈 경계를 넘는 흐름도 찾음
+        # 청크 분석은 흐름 분석을 건너뛰고 병합 시 모듈 전체의 흐름 분석 결과와 합침
+        taint_vulns = context.analyze_taint()
+        vulnerabilities = combine_vulnerabilities(analyzer.vulnerabilities, taint_vulns)
         
-        # 전체적인 위험도 평가
-        total_vulns = len(analyzer.vulnerabilities)
-        if len(critical_vulns) > 0:
-            overall_risk = "CRITICAL"
-            security_score = 2.0
-        elif len(high_vulns) > 2:
-            overall_risk = "HIGH"
-            security_score = 3.5
-        elif len(high_vulns) > 0 or len(medium_vulns) > 3:
-            overall_risk = "MEDIUM"
-            security_score = 6.0
-        elif total_vulns > 0:
-            overall_risk = "LOW"
-            security_score = 8.0
-        else:
-            overall_risk = "MINIMAL"
-            security_score = 9.5
+        # 위험도/점수/요약 계산 후 SecurityAnalysis 객체 생성
+        security_analysis = assess_vulnerabilities(vulnerabilities)
+        summary = security_analysis.summary
+        total_vulns = len(vulnerabilities)
         
-        # 분석 결과 요약
-        summary_parts = []
-        if critical_vulns:
-            summary_parts.append(f"{len(critical_vulns)} critical vulnerabilities")
-        if high_vulns:
-            summary_parts.append(f"{len(high_vulns)} high-risk issues")
-        if medium_vulns:
-            summary_parts.append(f"{len(medium_vulns)} medium-risk issues")
-        if low_vulns:
-            summary_parts.append(f"{len(low_vulns)} low-risk issues")
-        
-        summary = f"Found {total_vulns} total security issues: " + ", ".join(summary_parts) if summary_parts else "No security vulnerabilities detected"
-        
-        # SecurityAnalysis 객체 생성
-        security_analysis = SecurityAnalysis(
-            vulnerabilities=analyzer.vulnerabilities,
-            overall_risk=overall_risk,
-            security_score=security_score,
-            summary=summary
-        )
-        
-        # 상태 업데이트
-        state.security_findings = security_analysis
-        state.completion_status["security"] = True
-        state.confidence_scores["security"] = min(0.9, 0.6 + (security_score / 10) * 0.3)
-        state.messages.append(f"Security analysis completed: {summary}")
+        # 신뢰도 점수
+        confidence = min(0.9, 0.6 + (security_analysis.security_score / 10) * 0.3)
         
         logger.info(f"Security analysis completed with {total_vulns} vulnerabilities found")
         
+        # 상태 변경분만 반환 (병렬 실행 시 리듀서가 병합)
         return {
             "security_findings": security_analysis,
-            "completion_status": state.completion_status,
-            "confidence_scores": state.confidence_scores,
-            "messages": state.messages
+            "completion_status": {"security": True},
+            "confidence_scores": {"security": confidence},
+            "messages": [f"Security analysis completed: {summary}"]
         }
         
     except Exception as e:
         error_msg = f"Security analysis failed: {str(e)}"
         logger.error(error_msg)
-        state.error_log.append(error_msg)
-        state.completion_status["security"] = False
         
         return {
-            "error_log": state.error_log,
-            "completion_status": state.completion_status
-        }
\ No newline at end of file
+            "error_log": [error_msg],
+            "completion_status": {"security": False}
+        }
+
+def combine_vulnerabilities(rule_vulns: List[SecurityVulnerability],
+                            taint_vulns: List[SecurityVulnerability]) -> List[SecurityVulnerability]:
+    """규칙 기반 결과와 입력 흐름 분석 결과를 라인 순서로 합침 (같은 라인의 같은 유형은 흐름 분석 결과를 사용)"""
+    taint_keys = {(v.type, v.line_number) for v in taint_vulns}
+    return sorted(
+        [v for v in rule_vulns if (v.type, v.line_number) not in taint_keys] + list(taint_vulns),
+        key=lambda v: v.line_number
+    )
+
+def assess_vulnerabilities(vulnerabilities: List[SecurityVulnerability]) -> SecurityAnalysis:
+    """취약점 목록으로 전체 위험도, 보안 점수, 요약을 계산 (청크 결과 병합에서도 사용)"""
+    # 심각도별 분류
+    critical_vulns = [v for v in vulnerabilities if v.severity == "CRITICAL"]
+    high_vulns = [v for v in vulnerabilities if v.severity == "HIGH"]
+    medium_vulns = [v for v in vulnerabilities if v.severity == "MEDIUM"]
+    low_vulns = [v for v in vulnerabilities if v.severity == "LOW"]
+    
+    # 전체적인 위험도 평가
+    total_vulns = len(vulnerabilities)
+    if len(critical_vulns) > 0:
+        overall_risk = "CRITICAL"
+        security_score = 2.0
+    elif len(high_vulns) > 2:
+        overall_risk = "HIGH"
+        security_score = 3.5
+    elif len(high_vulns) > 0 or len(medium_vulns) > 3:
+        overall_risk = "MEDIUM"
+        security_score = 6.0
+    elif total_vulns > 0:
+        overall_risk = "LOW"
+        security_score = 8.0
+    else:
+        overall_risk = "MINIMAL"
+        security_score = 9.5
+    
+    # 분석 결과 요약
+    summary_parts = []
+    if critical_vulns:
+        summary_parts.append(f"{len(critical_vulns)} critical vulnerabilities")
+    if high_vulns:
+        summary_parts.append(f"{len(high_vulns)} high-risk issues")
+    if medium_vulns:
+        summary_parts.append(f"{len(medium_vulns)} medium-risk issues")
+    if low_vulns:
+        summary_parts.append(f"{len(low_vulns)} low-risk issues")
+    
+    summary = f"Found {total_vulns} total security issues: " + ", ".join(summary_parts) if summary_parts else "No security vulnerabilities detected"
+    
+    # SecurityAnalysis 객체 생성
+    return SecurityAnalysis(
+        vulnerabilities=vulnerabilities,
+        overall_risk=overall_risk,
+        security_score=security_score,
+        summary=summary
+    )
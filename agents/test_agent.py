@@ -2,6 +2,8 @@ import ast
 import logging
 from typing import Dict, Any, List
 from models import CodeReviewState, TestGenerationResult, TestSuggestion
+from analyzers.context import AnalysisContext, get_analysis_context
+from analyzers.findings import FindingCollector
 
 logger = logging.getLogger(__name__)
 
@@ -10,9 +12,9 @@ def test_generation_agent(state: CodeReviewState) -> Dict[str, Any]:
     logger.info("Starting test generation analysis")
     
     try:
-        # AST 파싱을 통한 함수 추출
-        tree = ast.parse(state.code_content)
-        functions = extract_functions_from_code(tree)
+        # 공유 컨텍스트의 함수 인덱스를 이용한 함수 추출
+        context = get_analysis_context(state)
+        functions = extract_functions_from_code(context)
         
         test_cases = []
         
@@ -45,35 +47,26 @@ def test_generation_agent(state: CodeReviewState) -> Dict[str, Any]:
                 test_cases.append(edge_test)
         
         # 클래스 메서드 테스트
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                class_test = TestSuggestion(
-                    test_type="Class Test",
-                    function_name=node.name,
-                    test_code=generate_class_test_template(node.name),
-                    description=f"Test suite for {node.name} class",
-                    coverage_improvement=20.0,
-                    dependencies=["pytest", "unittest.mock"]
-                )
-                test_cases.append(class_test)
+        for node in context.classes:
+            class_test = TestSuggestion(
+                test_type="Class Test",
+                function_name=node.name,
+                test_code=generate_class_test_template(node.name),
+                description=f"Test suite for {node.name} class",
+                coverage_improvement=20.0,
+                dependencies=["pytest", "unittest.mock"]
+            )
+            test_cases.append(class_test)
         
         # 통합 테스트 제안
         if len(functions) > 3:
-            integration_test = TestSuggestion(
-                test_type="Integration Test",
-                function_name="integration_tests",
-                test_code=generate_integration_test_template(),
-                description="Integration tests for component interactions",
-                coverage_improvement=25.0,
-                dependencies=["pytest", "pytest-asyncio"]
-            )
-            test_cases.append(integration_test)
+            test_cases.append(integration_test_suggestion())
         
-        # Mock 요구사항 분석
-        mock_requirements = []
-        for line in state.code_content.split('\n'):
+        # Mock 요구사항 분석 (외부 의존성 라인마다 같은 항목이므로 규칙별 상한 적용)
+        mock_requirements = FindingCollector(state.finding_cap, state.full_findings)
+        for i, line in enumerate(context.lines, 1):
             if any(keyword in line for keyword in ['requests.', 'open(', 'database', 'redis', 'api']):
-                mock_requirements.append("External dependencies detected - consider mocking")
+                mock_requirements.add("external_dependency", i, "External dependencies detected - consider mocking")
         
         # 설정 지침
         setup_instructions = """
@@ -85,8 +78,7 @@ def test_generation_agent(state: CodeReviewState) -> Dict[str, Any]:
         """.strip()
         
         # 커버리지 추정
-        total_functions = len(functions)
-        estimated_coverage = min(85.0, 40.0 + (len(test_cases) * 8))
+        estimated_coverage = estimate_coverage(len(test_cases))
         
         # 프레임워크 추천
         framework_recommendations = [
@@ -99,42 +91,52 @@ def test_generation_agent(state: CodeReviewState) -> Dict[str, Any]:
         # TestGenerationResult 객체 생성
         test_generation = TestGenerationResult(
             test_cases=test_cases,
-            mock_requirements=mock_requirements,
+            mock_requirements=mock_requirements.items,
             setup_instructions=setup_instructions,
             coverage_estimate=estimated_coverage,
-            framework_recommendations=framework_recommendations
+            framework_recommendations=framework_recommendations,
+            finding_groups=mock_requirements.groups(),
+            finding_details=mock_requirements.details()
         )
         
-        # 상태 업데이트
-        state.test_suggestions = test_generation
-        state.completion_status["test_generation"] = True
-        state.confidence_scores["test_generation"] = 0.8
-        state.messages.append(f"Test generation completed: {len(test_cases)} test suggestions generated")
-        
         logger.info(f"Test generation completed with {len(test_cases)} test cases suggested")
         
+        # 상태 변경분만 반환 (병렬 실행 시 리듀서가 병합)
         return {
             "test_suggestions": test_generation,
-            "completion_status": state.completion_status,
-            "confidence_scores": state.confidence_scores,
-            "messages": state.messages
+            "completion_status": {"test_generation": True},
+            "confidence_scores": {"test_generation": 0.8},
+            "messages": [f"Test generation completed: {len(test_cases)} test suggestions generated"]
         }
         
     except Exception as e:
         error_msg = f"Test generation failed: {str(e)}"
         logger.error(error_msg)
-        state.error_log.append(error_msg)
-        state.completion_status["test_generation"] = False
         
         return {
-            "error_log": state.error_log,
-            "completion_status": state.completion_status
+            "error_log": [error_msg],
+            "completion_status": {"test_generation": False}
         }
 
-def extract_functions_from_code(tree):
-    """코드에서 함수 정보 추출"""
+def integration_test_suggestion() -> TestSuggestion:
+    """함수가 3개를 넘을 때 추가하는 통합 테스트 제안"""
+    return TestSuggestion(
+        test_type="Integration Test",
+        function_name="integration_tests",
+        test_code=generate_integration_test_template(),
+        description="Integration tests for component interactions",
+        coverage_improvement=25.0,
+        dependencies=["pytest", "pytest-asyncio"]
+    )
+
+def estimate_coverage(test_count: int) -> float:
+    """제안한 테스트 수로 추정한 커버리지(%)"""
+    return min(85.0, 40.0 + (test_count * 8))
+
+def extract_functions_from_code(context: AnalysisContext):
+    """공유 컨텍스트의 함수 인덱스에서 함수 정보 추출"""
     functions = []
-    for node in ast.walk(tree):
+    for node in context.functions:
         if isinstance(node, ast.FunctionDef):
             functions.append({
                 'name': node.name,
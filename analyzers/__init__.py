@@ -1,5 +1,39 @@
+from .engine import RuleEngine
+from .context import AnalysisContext, get_analysis_context, build_analysis_context
 from .security_analyzer import SecurityASTAnalyzer
 from .performance_analyzer import PerformancePatternAnalyzer
-from .bug_detector import BugDetector
+from .bug_detector import BugDetector, CodeSmellDetector
+from .suite import AnalysisSuite
+from .incremental import UnitFindingsCache, unit_findings_cache
+from .findings import FindingCollector
+from .taint import TaintAnalyzer, TaintSpec
+from .project import (
+    ProjectContext, ProjectIndex, ProjectSnapshot, ModuleSummaryCache, module_summary_cache, build_project_snapshot
+)
 
-__all__ = ['SecurityASTAnalyzer', 'PerformancePatternAnalyzer', 'BugDetector']
\ No newline at end of file
+# 분석 규칙이 바뀌면 올려서 이전 결과 캐시를 무효화
+ANALYZER_VERSION = "1.5.0"
+
+__all__ = [
+    'ANALYZER_VERSION',
+    'RuleEngine',
+    'AnalysisContext',
+    'get_analysis_context',
+    'build_analysis_context',
+    'SecurityASTAnalyzer',
+    'PerformancePatternAnalyzer',
+    'BugDetector',
+    'CodeSmellDetector',
+    'AnalysisSuite',
+    'UnitFindingsCache',
+    'unit_findings_cache',
+    'FindingCollector',
+    'TaintAnalyzer',
+    'TaintSpec',
+    'ProjectContext',
+    'ProjectIndex',
+    'ProjectSnapshot',
+    'ModuleSummaryCache',
+    'module_summary_cache',
+    'build_project_snapshot'
+]
\ No newline at end of file
@@ -1,12 +1,32 @@
 import ast
-from typing import List
+from typing import List, Tuple, Union
 from models import BugReport
+from analyzers.context import AnalysisContext
+from analyzers.engine import RuleEngine
 
-class BugDetector(ast.NodeVisitor):
+class BugDetector:
     def __init__(self):
         self.bugs: List[BugReport] = []
+        self.function_depth = 0
+
+    def register(self, engine: RuleEngine) -> None:
+        """단일 순회 엔진에 노드 타입별 규칙 등록"""
+        engine.register(ast.FunctionDef, self.enter_function, self.leave_function)
+        engine.register(ast.ExceptHandler, self.check_except_handler)
+        engine.register(ast.Compare, self.check_compare)
+
+    def visit(self, tree: ast.AST) -> None:
+        """이 분석기만 등록한 엔진으로 트리 순회"""
+        RuleEngine().add_rules(self).run(tree)
+
+    def analyze(self, context: AnalysisContext) -> List[BugReport]:
+        """공유 컨텍스트의 AST를 분석"""
+        self.visit(context.tree)
+        return self.bugs
+
+    def enter_function(self, node):
+        self.function_depth += 1
 
-    def visit_FunctionDef(self, node):
         # Function without docstring
         if not ast.get_docstring(node):
             self.bugs.append(BugReport(
@@ -41,22 +61,22 @@ class BugDetector(ast.NodeVisitor):
                 confidence=0.7
             ))
         
-        # Empty except blocks
-        for stmt in ast.walk(node):
-            if isinstance(stmt, ast.ExceptHandler) and len(stmt.body) == 1:
-                if isinstance(stmt.body[0], ast.Pass):
-                    self.bugs.append(BugReport(
-                        type="Error Handling",
-                        severity="HIGH",
-                        line_number=stmt.lineno,
-                        description="Empty except block silently ignores errors",
-                        fix_suggestion="Add proper error handling or at least logging",
-                        confidence=0.95
-                    ))
-        
-        self.generic_visit(node)
+    def leave_function(self, node):
+        self.function_depth -= 1
+
+    def check_except_handler(self, node):
+        # Empty except blocks (inside functions)
+        if self.function_depth > 0 and len(node.body) == 1 and isinstance(node.body[0], ast.Pass):
+            self.bugs.append(BugReport(
+                type="Error Handling",
+                severity="HIGH",
+                line_number=node.lineno,
+                description="Empty except block silently ignores errors",
+                fix_suggestion="Add proper error handling or at least logging",
+                confidence=0.95
+            ))
 
-    def visit_Compare(self, node):
+    def check_compare(self, node):
         # Using 'is' with strings/numbers
         if len(node.ops) == 1 and isinstance(node.ops[0], ast.Is):
             if isinstance(node.left, ast.Constant) or isinstance(node.comparators[0], ast.Constant):
@@ -89,5 +109,39 @@ class BugDetector(ast.NodeVisitor):
                     fix_suggestion="Use 'is None' or 'is not None' for None comparisons",
                     confidence=0.85
                 ))
-        
-        self.generic_visit(node)
\ No newline at end of file
+
+
+class CodeSmellDetector:
+    """함수 길이, 클래스 크기, 매직 넘버 등 코드 스멜/기술 부채 수집"""
+
+    def __init__(self):
+        self.long_functions: List[Tuple[str, int]] = []
+        self.large_classes: List[Tuple[str, int]] = []
+        self.magic_numbers: List[Tuple[Union[int, float], int]] = []
+
+    def register(self, engine: RuleEngine) -> None:
+        """단일 순회 엔진에 노드 타입별 규칙 등록"""
+        engine.register(ast.FunctionDef, self.check_function)
+        engine.register(ast.ClassDef, self.check_class)
+        engine.register(ast.Constant, self.check_constant)
+
+    def check_function(self, node):
+        func_length = node.end_lineno - node.lineno if hasattr(node, 'end_lineno') else 0
+        if func_length > 30:
+            self.long_functions.append((node.name, func_length))
+
+    def check_class(self, node):
+        methods = [n for n in node.body if isinstance(n, ast.FunctionDef)]
+        if len(methods) > 15:
+            self.large_classes.append((node.name, len(methods)))
+
+    def check_constant(self, node):
+        if isinstance(node.value, (int, float)):
+            if node.value not in [0, 1, -1] and abs(node.value) > 1:
+                self.magic_numbers.append((node.value, node.lineno))
+
+    @property
+    def code_smells(self) -> List[str]:
+        smells = [f"Long function: {name} ({length} lines)" for name, length in self.long_functions]
+        smells.extend(f"Large class: {name} ({count} methods)" for name, count in self.large_classes)
+        return smells
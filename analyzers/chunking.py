@@ -0,0 +1,103 @@
+import re
+from typing import List, NamedTuple, Tuple
+
+# 최상위 문장 경계를 찾는 어휘 토큰: 문자열과 주석은 건너뛰고, 0열에서 시작하는 정의/import 라인만 멈춤
+# 문자열 끝 판정은 raw 문자열도 같으므로(역슬래시 뒤 따옴표는 닫지 않음) 접두사는 무시한다.
+_TOKENS = re.compile(r'''
+    (?P<string>
+        """(?:[^"\\]+|\\.|"(?!""))*(?:"""|\Z)
+      | \'\'\'(?:[^'\\]+|\\.|'(?!''))*(?:\'\'\'|\Z)
+      | "(?:[^"\\\n]+|\\.)*"
+      | '(?:[^'\\\n]+|\\.)*'
+    )
+  | \#[^\n]*
+  | \n(?P<definition>@|def\s|class\s|async\s+def\s)
+  | \n(?P<import>import\s|from\s)
+''', re.S | re.X)
+# import 문 전체 (괄호로 감싼 여러 줄 이름 목록과 그 안의 주석, 역슬래시 줄 이음 포함)
+_IMPORT_STATEMENT = re.compile(r"(?:import|from)\s(?:[^\n(\\#]|\\\n)*(?:\((?:[^)#]|#[^\n]*)*\))?[^\n#]*")
+
+
+class SourceChunk(NamedTuple):
+    """큰 모듈을 나눈 분석 단위
+
+    source는 원본과 라인 수가 같고, 이 청크가 맡은 라인([start_line, end_line])과 다른 청크의
+    최상위 import 문(shared_lines)만 남기고 나머지는 빈 줄이다. 그래서 청크 분석 결과의 라인 번호와
+    설명 속 라인 번호가 원본 그대로이다. shared_lines는 파싱에만 쓰고 라인 단위 검사에서는 빈 줄로 본다.
+    """
+    index: int
+    start_line: int
+    end_line: int
+    source: str
+    shared_lines: Tuple[int, ...]
+
+
+def chunk_file_path(file_path: str, index: int) -> str:
+    """청크별 파일명 (증분 분석 캐시가 청크끼리 서로 덮어쓰지 않도록 구분)"""
+    return f"{file_path}#chunk{index}"
+
+
+def top_level_boundaries(source: str) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    """파싱 없이 어휘 수준으로 찾은 ([(정의 시작 라인, 문자 오프셋)], [(import 시작 라인, 끝 라인)])
+
+    문자열/주석 밖에서 0열로 시작하는 정의(def, class, 데코레이터)와 import 라인만 최상위 문장으로 본다
+    (이 키워드로 시작하는 라인은 괄호 안에 올 수 없다). 연속된 데코레이터와 그 뒤의 정의는 첫 데코레이터에서
+    한 번만 경계가 된다. AST 파싱보다 훨씬 싸서 분할이 병렬로 나눌 수 없는 구간을 늘리지 않는다.
+    """
+    definitions: List[Tuple[int, int]] = []
+    imports: List[Tuple[int, int]] = []
+    text = "\n" + source
+    lineno = 0
+    counted = 0
+    decorated = False
+    for match in _TOKENS.finditer(text):
+        kind = match.lastgroup
+        if kind not in ("definition", "import"):
+            continue
+        position = match.start()
+        lineno += text.count("\n", counted, position + 1)
+        counted = position + 1
+        if kind == "definition":
+            if not decorated:
+                definitions.append((lineno, position))
+            decorated = match.group(kind) == "@"
+        else:
+            statement = _IMPORT_STATEMENT.match(text, position + 1)
+            imports.append((lineno, lineno + statement.group().count("\n")))
+    return definitions, imports
+
+
+def split_module(source: str, chunks: int) -> List[SourceChunk]:
+    """모듈을 최상위 정의 경계에서 바이트 크기가 비슷한 최대 chunks개 청크로 나눔
+
+    경계는 최상위 함수/클래스(데코레이터 포함)의 시작 라인이며, 정의 하나는 나누지 않는다.
+    정의 경계가 부족하면 빈 목록을 반환하여 전체 파일을 한 번에 분석하게 한다.
+    """
+    if chunks < 2:
+        return []
+    definitions, imports = top_level_boundaries(source)
+
+    # 목표 크기를 넘는 첫 정의 시작 라인에서 자름
+    starts = [1]
+    for lineno, offset in definitions:
+        if lineno > starts[-1] and offset >= len(source) * len(starts) / chunks:
+            starts.append(lineno)
+            if len(starts) == chunks:
+                break
+    if len(starts) < 2:
+        return []
+
+    lines = source.split('\n')
+    result = []
+    for index, start_line in enumerate(starts):
+        end_line = starts[index + 1] - 1 if index + 1 < len(starts) else len(lines)
+        shared_lines = tuple(
+            lineno
+            for start, end in imports if not start_line <= start <= end_line
+            for lineno in range(start, end + 1)
+        )
+        chunk_lines = [""] * (start_line - 1) + lines[start_line - 1:end_line] + [""] * (len(lines) - end_line)
+        for lineno in shared_lines:
+            chunk_lines[lineno - 1] = lines[lineno - 1]
+        result.append(SourceChunk(index, start_line, end_line, '\n'.join(chunk_lines), shared_lines))
+    return result
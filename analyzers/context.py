@@ -0,0 +1,168 @@
+import ast
+import threading
+import time
+from typing import List, Optional, Union
+
+from analyzers.engine import RuleEngine
+
+FunctionNode = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+
+# CPython 3.11의 ast.parse는 여러 스레드에서 동시에 호출되면 내부 재귀 깊이 검사가 깨져
+# "AST constructor recursion depth mismatch" 오류를 낼 수 있으므로 파싱을 직렬화한다.
+_PARSE_LOCK = threading.Lock()
+
+
+def parse_source(source: str) -> ast.Module:
+    """스레드 안전한 ast.parse 래퍼"""
+    with _PARSE_LOCK:
+        return ast.parse(source)
+
+
+class DefinitionIndex:
+    """함수/클래스 정의 인덱스를 수집하는 규칙 묶음"""
+
+    def __init__(self):
+        self.functions: List[FunctionNode] = []
+        self.classes: List[ast.ClassDef] = []
+
+    def register(self, engine: RuleEngine) -> None:
+        engine.register(ast.FunctionDef, self.functions.append)
+        engine.register(ast.AsyncFunctionDef, self.functions.append)
+        engine.register(ast.ClassDef, self.classes.append)
+
+    def collect(self, tree: ast.AST) -> "DefinitionIndex":
+        """규칙 순회 없이 문(statement) 노드만 따라가며 인덱스 수집 (RuleEngine과 같은 순서)"""
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self.functions.append(node)
+            elif isinstance(node, ast.ClassDef):
+                self.classes.append(node)
+            children = [
+                child for child in ast.iter_child_nodes(node)
+                if isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case))
+            ]
+            stack.extend(reversed(children))
+        return self
+
+
+class AnalysisContext:
+    """리뷰 단위로 한 번만 생성되어 모든 에이전트/분석기가 공유하는 분석 컨텍스트
+
+    파싱된 AST, 라인 테이블, 라인 시작 바이트 오프셋, 함수/클래스 인덱스를 보관한다.
+    함수/클래스 인덱스와 분석기 규칙(suite)은 최초 접근 시 단일 순회로 함께 계산되며,
+    이후에는 읽기 전용으로만 사용한다. unit_cache(analyzers.incremental.UnitFindingsCache)가
+    주어지면 같은 파일의 이전 리뷰에서 바뀐 최상위 단위만 다시 분석한다. 여러 파일 리뷰에서는
+    project(analyzers.project.ProjectContext)로 import한 다른 모듈의 함수 요약을 받는다.
+    큰 모듈을 나눈 청크(analyzers.chunking.SourceChunk)를 분석할 때 shared_lines(다른 청크 소속의
+    공유 import 라인)는 AST에만 포함하고 라인 테이블에서는 빈 줄로 두어 라인 단위 검사가 중복되지 않게 한다.
+    청크는 taint=False로 만들어 입력 흐름 분석을 건너뛰고, 모듈 전체를 한 번 분석한 결과로 병합한다.
+    """
+
+    def __init__(self, source: str, file_path: str = "<unknown>", unit_cache=None, project=None,
+                 shared_lines=(), taint: bool = True):
+        self.source = source
+        self.file_path = file_path
+        self.unit_cache = unit_cache
+        self.project = project
+        # 입력 흐름(taint) 분석 수행 여부
+        self.taint = taint
+        start = time.perf_counter()
+        self.tree = parse_source(source)
+        # 파싱 소요 시간(초, 계측용)
+        self.parse_seconds = time.perf_counter() - start
+        # 입력 흐름 분석 소요 시간(초, 계측용. 분석하지 않았으면 None)
+        self.taint_seconds: Optional[float] = None
+        self.lines: List[str] = source.split('\n')
+        for lineno in shared_lines:
+            self.lines[lineno - 1] = ""
+        self._line_offsets: Optional[List[int]] = None
+        self._index: Optional[DefinitionIndex] = None
+        self._suite = None
+        self._lock = threading.Lock()
+
+    def _run_rules(self) -> None:
+        """인덱스와 모든 분석 규칙을 단일 순회로 실행 (최초 1회, 스레드 안전)"""
+        if self._suite is None:
+            with self._lock:
+                if self._suite is None:
+                    if self.unit_cache is not None:
+                        index = DefinitionIndex().collect(self.tree)
+                        suite = self.unit_cache.analyze(self.tree, self.lines, self.file_path)
+                    else:
+                        from analyzers.suite import AnalysisSuite
+                        index = DefinitionIndex()
+                        suite = AnalysisSuite().run(self.tree, index)
+                    self._index = index
+                    self._suite = suite
+
+    @property
+    def suite(self):
+        """단일 순회로 실행된 분석 규칙 결과 (analyzers.suite.AnalysisSuite)"""
+        self._run_rules()
+        return self._suite
+
+    def analyze_taint(self) -> list:
+        """입력 흐름(taint) 분석 결과 (taint=False이면 빈 목록, 소요 시간은 taint_seconds에 기록)"""
+        if not self.taint:
+            return []
+        from analyzers.taint import TaintAnalyzer
+        start = time.perf_counter()
+        vulnerabilities = TaintAnalyzer(project=self.project).analyze(self.tree)
+        self.taint_seconds = time.perf_counter() - start
+        return vulnerabilities
+
+    @property
+    def functions(self) -> List[FunctionNode]:
+        self._run_rules()
+        return self._index.functions
+
+    @property
+    def classes(self) -> List[ast.ClassDef]:
+        self._run_rules()
+        return self._index.classes
+
+    @property
+    def line_count(self) -> int:
+        return len(self.lines)
+
+    @property
+    def line_offsets(self) -> List[int]:
+        """각 라인 시작 위치의 UTF-8 바이트 오프셋 (최초 접근 시 계산)"""
+        if self._line_offsets is None:
+            offsets = [0]
+            position = 0
+            for line in self.lines[:-1]:
+                position += len(line.encode('utf-8')) + 1
+                offsets.append(position)
+            self._line_offsets = offsets
+        return self._line_offsets
+
+    def byte_offset(self, lineno: int, col_offset: int = 0) -> int:
+        """AST 위치(1-based lineno, 바이트 단위 col_offset)를 소스 전체 바이트 오프셋으로 변환"""
+        return self.line_offsets[lineno - 1] + col_offset
+
+    def get_line(self, lineno: int) -> str:
+        """1-based 라인 번호로 소스 라인 조회"""
+        if 1 <= lineno <= len(self.lines):
+            return self.lines[lineno - 1]
+        return ""
+
+
+def get_analysis_context(state) -> AnalysisContext:
+    """상태에 공유 컨텍스트가 있으면 재사용하고, 없으면 새로 생성"""
+    context = getattr(state, "analysis_context", None)
+    if context is not None:
+        return context
+    return AnalysisContext(state.code_content, state.file_path)
+
+
+def build_analysis_context(source: str, file_path: str = "<unknown>",
+                           unit_cache=None, project=None, shared_lines=(),
+                           taint: bool = True) -> Optional[AnalysisContext]:
+    """리뷰 시작 시 컨텍스트 생성. 구문 오류는 각 에이전트가 보고하도록 None 반환"""
+    try:
+        return AnalysisContext(source, file_path, unit_cache, project, shared_lines, taint)
+    except SyntaxError:
+        return None
@@ -0,0 +1,69 @@
+import ast
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+NodeHandler = Callable[[ast.AST], None]
+
+
+class RuleEngine:
+    """AST를 한 번만 순회하며 노드 타입별로 등록된 규칙만 호출하는 디스패처
+
+    규칙은 노드 타입 단위로 등록되며, 각 노드는 자신의 타입(또는 상위 타입)에
+    등록된 핸들러에만 전달된다. 타입별 핸들러 목록은 최초 조회 시 캐시되므로
+    순회 비용은 규칙 수와 무관하게 O(노드 수)를 유지한다.
+    """
+
+    def __init__(self):
+        self._enter: Dict[type, List[NodeHandler]] = {}
+        self._leave: Dict[type, List[NodeHandler]] = {}
+        self._dispatch: Dict[type, Tuple[Tuple[NodeHandler, ...], Tuple[NodeHandler, ...]]] = {}
+
+    def register(self, node_type: Type[ast.AST], on_enter: Optional[NodeHandler] = None,
+                 on_leave: Optional[NodeHandler] = None) -> None:
+        """노드 타입에 진입/이탈 핸들러 등록 (이탈 핸들러는 자식 순회가 끝난 뒤 호출)"""
+        if on_enter is not None:
+            self._enter.setdefault(node_type, []).append(on_enter)
+        if on_leave is not None:
+            self._leave.setdefault(node_type, []).append(on_leave)
+        self._dispatch.clear()
+
+    def add_rules(self, *rule_sets) -> "RuleEngine":
+        """register(engine) 메서드를 가진 규칙 묶음들을 등록"""
+        for rule_set in rule_sets:
+            rule_set.register(self)
+        return self
+
+    def _handlers_for(self, node_type: type) -> Tuple[Tuple[NodeHandler, ...], Tuple[NodeHandler, ...]]:
+        """노드 타입의 MRO를 따라 적용 가능한 핸들러를 모아 캐시"""
+        handlers = self._dispatch.get(node_type)
+        if handlers is None:
+            enter: List[NodeHandler] = []
+            leave: List[NodeHandler] = []
+            for base in node_type.__mro__:
+                enter.extend(self._enter.get(base, ()))
+                leave.extend(self._leave.get(base, ()))
+            handlers = (tuple(enter), tuple(leave))
+            self._dispatch[node_type] = handlers
+        return handlers
+
+    def run(self, tree: ast.AST) -> None:
+        """트리를 깊이 우선(전위) 순서로 한 번 순회하며 규칙 실행"""
+        handlers_for = self._handlers_for
+        iter_children = ast.iter_child_nodes
+        stack: List[Tuple[ast.AST, Optional[Tuple[NodeHandler, ...]]]] = [(tree, None)]
+
+        while stack:
+            node, leave_handlers = stack.pop()
+            if leave_handlers is not None:
+                for handler in leave_handlers:
+                    handler(node)
+                continue
+
+            enter, leave = handlers_for(type(node))
+            for handler in enter:
+                handler(node)
+            if leave:
+                stack.append((node, leave))
+
+            children = list(iter_children(node))
+            for child in reversed(children):
+                stack.append((child, None))
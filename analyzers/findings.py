@@ -0,0 +1,88 @@
+from typing import Dict, List, Optional, Tuple
+
+from models import FindingGroup
+
+
+class FindingCollector:
+    """규칙별 발견 항목 집계
+
+    규칙마다 처음 cap개(0이면 무제한) 메시지만 목록에 남기고, 전체 개수와 라인 범위는
+    FindingGroup으로 요약한다. 점수 계산에는 잘리지 않은 전체 개수(total)를 사용한다.
+    keep_details이면 잘린 항목까지 규칙별 전체 메시지를 따로 보관한다 (전체 상세 모드).
+    """
+
+    def __init__(self, cap: int = 0, keep_details: bool = False):
+        self.cap = cap
+        self.keep_details = keep_details
+        self.total = 0
+        self._items: List[str] = []
+        self._counts: Dict[str, int] = {}
+        self._lines: Dict[str, List[int]] = {}
+        self._details: Dict[str, List[str]] = {}
+
+    def add(self, rule: str, lineno: int, message: str) -> None:
+        count = self._counts.get(rule, 0) + 1
+        self._counts[rule] = count
+        self._lines.setdefault(rule, []).append(lineno)
+        self.total += 1
+        if not self.cap or count <= self.cap:
+            self._items.append(message)
+        if self.keep_details:
+            self._details.setdefault(rule, []).append(message)
+
+    @property
+    def items(self) -> List[str]:
+        """규칙별 상한이 적용된 메시지 (추가 순서 유지)"""
+        return self._items
+
+    def groups(self) -> List[FindingGroup]:
+        """규칙별 개수와 연속 라인 범위 (범위도 규칙당 최대 cap개)"""
+        groups = []
+        for rule, count in self._counts.items():
+            ranges: List[List[int]] = []
+            for lineno in sorted(set(self._lines[rule])):
+                if ranges and lineno == ranges[-1][1] + 1:
+                    ranges[-1][1] = lineno
+                else:
+                    ranges.append([lineno, lineno])
+            truncated = bool(self.cap) and (count > self.cap or len(ranges) > self.cap)
+            groups.append(FindingGroup(
+                rule=rule,
+                count=count,
+                first_line=ranges[0][0],
+                last_line=ranges[-1][1],
+                line_ranges=ranges[:self.cap] if self.cap else ranges,
+                truncated=truncated
+            ))
+        return groups
+
+    def details(self) -> Optional[Dict[str, List[str]]]:
+        """전체 상세 모드일 때만 규칙별 전체 메시지"""
+        return self._details if self.keep_details else None
+
+    @classmethod
+    def merged(cls, parts: List[Tuple[List[FindingGroup], Optional[Dict[str, List[str]]]]],
+               cap: int = 0, keep_details: bool = False, rule_order: Tuple[str, ...] = ()) -> "FindingCollector":
+        """청크별로 상한 없이 전체 상세까지 모은 (finding_groups, finding_details)를 라인 순서대로 합친 집계
+
+        개수와 라인 범위는 그대로 더하고, 목록에는 규칙 순서대로 규칙당 처음 cap개 메시지를 남긴다.
+        규칙 순서는 rule_order(에이전트가 규칙을 추가하는 순서)를 따르고, 그 밖의 규칙은 처음 나온 순서로 뒤에 둔다.
+        """
+        collector = cls(cap, keep_details)
+        counts: Dict[str, int] = {}
+        messages: Dict[str, List[str]] = {}
+        for groups, details in parts:
+            for group in groups:
+                counts[group.rule] = counts.get(group.rule, 0) + group.count
+                collector.total += group.count
+                lines = collector._lines.setdefault(group.rule, [])
+                for start, end in group.line_ranges:
+                    lines.extend(range(start, end + 1))
+                messages.setdefault(group.rule, []).extend((details or {}).get(group.rule, []))
+        order = [rule for rule in rule_order if rule in counts] + [rule for rule in counts if rule not in rule_order]
+        collector._counts = {rule: counts[rule] for rule in order}
+        for rule in order:
+            collector._items.extend(messages[rule][:cap] if cap else messages[rule])
+        if keep_details:
+            collector._details = {rule: messages[rule] for rule in order}
+        return collector
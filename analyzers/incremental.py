@@ -0,0 +1,124 @@
+import ast
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+from analyzers.engine import RuleEngine
+from analyzers.suite import AnalysisSuite
+
+# 단위(unit)별로 캐시하는 분석 결과 필드 (AnalysisSuite 규칙 묶음, 속성명, 라인 번호 형태)
+# - model: line_number 필드를 가진 Pydantic 모델
+# - pair: (값, 라인) 튜플
+# - None: 라인 번호 없음
+UNIT_FINDING_FIELDS = (
+    ("security", "vulnerabilities", "model"),
+    ("performance", "issues", "model"),
+    ("bugs", "bugs", "model"),
+    ("code_smells", "long_functions", None),
+    ("code_smells", "large_classes", None),
+    ("code_smells", "magic_numbers", "pair"),
+)
+
+UnitFindings = Dict[str, List[Any]]
+
+
+def unit_span(node: ast.stmt) -> Tuple[int, int]:
+    """데코레이터를 포함한 최상위 단위의 (시작 라인, 끝 라인)"""
+    start = min([node.lineno] + [decorator.lineno for decorator in getattr(node, "decorator_list", [])])
+    return start, getattr(node, "end_lineno", node.lineno)
+
+
+def unit_fingerprint(node: ast.stmt, lines: List[str]) -> str:
+    """최상위 단위의 위치 독립적인 지문
+
+    단위가 차지하는 소스 구간과 구간 안에서의 시작/끝 열 오프셋을 해시한다. 구간이 같으면 AST 구조와
+    단위 내부의 상대 라인 배치가 모두 같으므로 결과를 라인 이동만으로 재사용할 수 있고, 파일 안에서
+    위치만 옮겨진 단위는 같은 지문을 가진다. 열 오프셋은 `;`로 한 라인에 이어 쓴 문장들을 구분한다.
+    (ast.dump 기반 해시는 단위 재분석보다 비용이 커서 사용하지 않는다.)
+    """
+    start, end = unit_span(node)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\n".join(lines[start - 1:end]).encode("utf-8"))
+    digest.update(f"\0{node.col_offset}:{node.end_col_offset}".encode("ascii"))
+    return digest.hexdigest()
+
+
+def _shift_findings(findings: List[Any], kind: str, delta: int) -> List[Any]:
+    """캐시된 결과의 라인 번호를 delta만큼 이동"""
+    if delta == 0 or kind is None:
+        return findings
+    if kind == "pair":
+        return [(value, lineno + delta) for value, lineno in findings]
+    return [finding.model_copy(update={"line_number": finding.line_number + delta}) for finding in findings]
+
+
+class UnitFindingsCache:
+    """파일명별 최상위 단위 분석 결과 캐시 (파일 수 기준 LRU)
+
+    파일명 -> {지문: (단위 시작 라인, 단위 결과)} 형태로 저장하며,
+    재리뷰 시 바뀐 단위만 다시 분석하고 나머지는 라인 번호만 이동하여 재사용한다.
+    """
+
+    def __init__(self, max_files: int = 256):
+        self.max_files = max_files
+        self._files: "OrderedDict[str, Dict[str, Tuple[int, UnitFindings]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"units_reused": 0, "units_analyzed": 0}
+
+    def _get_file(self, file_path: str) -> Dict[str, Tuple[int, UnitFindings]]:
+        with self._lock:
+            units = self._files.get(file_path)
+            if units is None:
+                return {}
+            self._files.move_to_end(file_path)
+            return units
+
+    def _put_file(self, file_path: str, units: Dict[str, Tuple[int, UnitFindings]]) -> None:
+        with self._lock:
+            self._files[file_path] = units
+            self._files.move_to_end(file_path)
+            while len(self._files) > self.max_files:
+                self._files.popitem(last=False)
+
+    def analyze(self, tree: ast.Module, lines: List[str], file_path: str) -> AnalysisSuite:
+        """모듈을 최상위 단위로 나누어 바뀐 단위만 분석하고 전체 결과를 조립
+
+        단위 순서대로 결과를 이어 붙이므로 전체 순회(깊이 우선 전위)와 같은 순서가 된다.
+        """
+        previous = self._get_file(file_path)
+        current: Dict[str, Tuple[int, UnitFindings]] = {}
+
+        worker = AnalysisSuite()
+        engine = RuleEngine().add_rules(*worker.rule_sets())
+        merged = AnalysisSuite()
+
+        for unit in tree.body:
+            fingerprint = unit_fingerprint(unit, lines)
+            cached = current.get(fingerprint) or previous.get(fingerprint)
+
+            if cached is None:
+                # 바뀐 단위: 공유 엔진으로 분석 후 이번 단위 결과만 잘라냄
+                offsets = {field: len(getattr(getattr(worker, rule), field)) for rule, field, _ in UNIT_FINDING_FIELDS}
+                engine.run(unit)
+                findings = {
+                    field: getattr(getattr(worker, rule), field)[offsets[field]:]
+                    for rule, field, _ in UNIT_FINDING_FIELDS
+                }
+                cached = (unit.lineno, findings)
+                self.stats["units_analyzed"] += 1
+            else:
+                self.stats["units_reused"] += 1
+
+            current[fingerprint] = cached
+            base_lineno, findings = cached
+            delta = unit.lineno - base_lineno
+            for rule, field, kind in UNIT_FINDING_FIELDS:
+                getattr(getattr(merged, rule), field).extend(_shift_findings(findings[field], kind, delta))
+
+        self._put_file(file_path, current)
+        return merged
+
+
+# 프로세스 단위 공유 캐시
+unit_findings_cache = UnitFindingsCache()
@@ -1,13 +1,28 @@
 import ast
 from typing import List
 from models import PerformanceIssue
+from analyzers.context import AnalysisContext
+from analyzers.engine import RuleEngine
 
-class PerformancePatternAnalyzer(ast.NodeVisitor):
+class PerformancePatternAnalyzer:
     def __init__(self):
         self.issues: List[PerformanceIssue] = []
         self.loop_depth = 0
 
-    def visit_For(self, node):
+    def register(self, engine: RuleEngine) -> None:
+        """단일 순회 엔진에 노드 타입별 규칙 등록"""
+        engine.register(ast.For, self.enter_for, self.leave_for)
+
+    def visit(self, tree: ast.AST) -> None:
+        """이 분석기만 등록한 엔진으로 트리 순회"""
+        RuleEngine().add_rules(self).run(tree)
+
+    def analyze(self, context: AnalysisContext) -> List[PerformanceIssue]:
+        """공유 컨텍스트의 AST를 분석"""
+        self.visit(context.tree)
+        return self.issues
+
+    def enter_for(self, node):
         self.loop_depth += 1
         
         # Nested loop detection
@@ -52,8 +67,8 @@ class PerformancePatternAnalyzer(ast.NodeVisitor):
                             optimization="Use list.join() or f-strings",
                             estimated_improvement="50-80% performance improvement for large datasets"
                         ))
-        
-        self.generic_visit(node)
+
+    def leave_for(self, node):
         self.loop_depth -= 1
 
     def _get_func_name(self, node):
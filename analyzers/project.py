@@ -0,0 +1,529 @@
+import ast
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from analyzers.context import parse_source
+from analyzers.taint import ExternalFunction, FunctionInfo, TaintAnalyzer
+from models import PerformanceIssue
+
+logger = logging.getLogger(__name__)
+
+# 프로젝트 심볼 테이블에 넣는 소스 확장자
+PROJECT_EXTENSIONS = (".py",)
+# import 순환이 있을 때 모듈 요약을 다시 계산하는 최대 횟수
+MAX_PROJECT_PASSES = 3
+# 호출을 따라 누적하는 반복문 깊이 상한 (재귀 호출에서도 끝나도록)
+MAX_LOOP_DEPTH = 5
+# 패키지 재수출(__init__.py의 from .x import f)을 따라가는 최대 단계
+MAX_REEXPORT_HOPS = 5
+
+# 내보낸 함수 요약: {"name", "params", "kind", "returns", "sinks", "loop_depth"} (TaintAnalyzer.export_summaries)
+ExportedFunction = Dict[str, Any]
+
+
+def _digest(*parts: Any) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else json.dumps(part, sort_keys=True).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def module_name(path: str) -> Tuple[str, bool]:
+    """파일 경로의 점 표기 모듈 이름과 패키지(__init__.py) 여부 (pkg/helpers.py -> pkg.helpers)"""
+    stem = os.path.splitext(path.replace("\\", "/"))[0]
+    parts = [part for part in stem.split("/") if part and part != "."]
+    is_package = bool(parts) and parts[-1] == "__init__"
+    if is_package:
+        parts.pop()
+    return ".".join(parts), is_package
+
+
+class ProjectContext:
+    """리뷰 대상 파일 하나가 보는 프로젝트 정보: 자기 모듈 이름과 import한 프로젝트 함수의 요약
+
+    symbols의 키는 그 파일에서 호출할 때 쓰는 이름(import 별칭을 푼 점 표기 이름)이다.
+    워커 프로세스로 보내지므로 기본 타입만 담는다.
+    """
+
+    def __init__(self, module: str, is_package: bool = False,
+                 symbols: Optional[Dict[str, ExportedFunction]] = None, digest: Optional[str] = None):
+        self.module = module
+        self.is_package = is_package
+        self.symbols = symbols or {}
+        # 결과 캐시 키에 넣는 해시 (ProjectIndex는 참조한 모듈들의 요약 해시로 만들어 넘김)
+        self.digest = digest or _digest(self.symbols)
+
+    def absolute(self, level: int, name: Optional[str]) -> Optional[str]:
+        """상대 import(from ..x import y)의 기준 모듈을 절대 이름으로"""
+        parts = self.module.split(".") if self.module else []
+        if not self.is_package:
+            parts = parts[:-1]
+        if level - 1 > len(parts):
+            return None
+        parts = parts[:len(parts) - (level - 1)]
+        if name:
+            parts.append(name)
+        return ".".join(parts) or None
+
+    def function(self, name: str) -> Optional[ExportedFunction]:
+        return self.symbols.get(name)
+
+
+def loop_calls(body: List[ast.stmt]) -> Tuple[int, List[Tuple[ast.Call, int]]]:
+    """함수 본문의 최대 반복문 중첩 깊이와 (호출, 호출 지점의 반복문 깊이) 목록
+
+    중첩 함수/클래스/람다 본문은 호출될 때 실행되므로 제외한다. for의 iter와 else는 한 번만 실행된다.
+    """
+    deepest = 0
+    calls = []
+    stack: List[Tuple[ast.AST, int]] = [(statement, 0) for statement in body]
+    while stack:
+        node, depth = stack.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)):
+            continue
+        if isinstance(node, ast.Call):
+            calls.append((node, depth))
+        if isinstance(node, (ast.For, ast.AsyncFor)):
+            deepest = max(deepest, depth + 1)
+            stack.extend([(node.target, depth), (node.iter, depth)])
+            stack.extend((child, depth + 1) for child in node.body)
+            stack.extend((child, depth) for child in node.orelse)
+        elif isinstance(node, ast.While):
+            deepest = max(deepest, depth + 1)
+            stack.append((node.test, depth + 1))
+            stack.extend((child, depth + 1) for child in node.body)
+            stack.extend((child, depth) for child in node.orelse)
+        else:
+            stack.extend((child, depth) for child in ast.iter_child_nodes(node))
+    calls.sort(key=lambda call: (call[0].lineno, call[0].col_offset))
+    return deepest, calls
+
+
+def call_loop_depths(analyzer: TaintAnalyzer, module: str) -> Tuple[Dict[str, int], Dict[str, List[str]], int]:
+    """내보내는 함수별 반복문 깊이(호출한 함수의 반복문 포함), 호출 그래프 간선, 다른 모듈로 가는 간선 수
+
+    호출 지점의 반복문 깊이 + 피호출 함수의 깊이를 같은 모듈 안에서는 고정점까지, 다른 모듈은
+    내보낸 요약의 loop_depth로 누적한다. 간선은 점 표기 전체 이름 (모듈.함수 -> 모듈.함수)이다.
+    """
+    functions = analyzer.exported_functions()
+    scanned: Dict[FunctionInfo, Tuple[int, List[Tuple[FunctionInfo, int]]]] = {}
+    edges: Dict[str, List[str]] = {}
+    external = 0
+    for info in functions:
+        deepest, calls = loop_calls(info.body)
+        targets = []
+        for call, depth in calls:
+            resolved = analyzer.resolve_call(call.func, info)
+            if resolved is None:
+                continue
+            target = resolved[0]
+            targets.append((target, depth))
+            callee = target.qualified_name if isinstance(target, ExternalFunction) else f"{module}.{target.name}"
+            callees = edges.setdefault(f"{module}.{info.name}", [])
+            if callee not in callees:
+                callees.append(callee)
+                external += isinstance(target, ExternalFunction)
+        scanned[info] = (deepest, targets)
+
+    depths = {info: scanned[info][0] for info in functions}
+    changed = True
+    while changed:
+        changed = False
+        for info, (_, targets) in scanned.items():
+            for target, depth in targets:
+                callee_depth = target.loop_depth if isinstance(target, ExternalFunction) else depths.get(target, 0)
+                combined = min(depth + callee_depth, MAX_LOOP_DEPTH)
+                if combined > depths[info]:
+                    depths[info] = combined
+                    changed = True
+    return {info.name: depth for info, depth in depths.items()}, edges, external
+
+
+def project_loop_issues(tree: ast.Module, project: ProjectContext) -> List[PerformanceIssue]:
+    """반복문 안에서 다른 모듈의 반복문이 있는 함수를 호출하여 합친 중첩 깊이가 3 이상인 곳
+
+    같은 파일 안의 중첩 반복문 규칙(PerformancePatternAnalyzer)과 같은 기준을 호출 경계 너머로 적용한다.
+    """
+    analyzer = TaintAnalyzer(project=project)
+    analyzer.collect(tree)
+    issues = []
+    for info in analyzer.functions:
+        for call, depth in loop_calls(info.body)[1]:
+            if depth == 0:
+                continue
+            resolved = analyzer.resolve_call(call.func, info)
+            if resolved is None or not isinstance(resolved[0], ExternalFunction) or not resolved[0].loop_depth:
+                continue
+            target = resolved[0]
+            combined = depth + target.loop_depth
+            if combined > 2:
+                issues.append(PerformanceIssue(
+                    type="Nested Loops",
+                    severity="MEDIUM",
+                    line_number=call.lineno,
+                    description=(
+                        f"Loop calls {target.name}() from another module, which loops internally "
+                        f"(combined depth: {combined})"
+                    ),
+                    impact="O(n^{}) time complexity".format(combined),
+                    optimization="Hoist the call out of the loop, batch the work or cache its result",
+                    estimated_improvement="10-90% performance improvement possible"
+                ))
+    return sorted(issues, key=lambda issue: issue.line_number)
+
+
+class ModuleSummaryCache:
+    """모듈 요약 캐시 (LRU, 프로세스 단위로 리뷰 사이에 재사용)
+
+    - header: (내용 해시, 경로) -> 모듈이 import하는 이름과 별칭 (파싱 없이 의존 관계 계산)
+    - summary: (내용 해시, 경로, 참조한 다른 모듈 요약의 해시) -> 내보낸 함수 요약과 호출 간선
+    의존 모듈의 요약이 바뀌면 키가 달라지므로 무효화가 따로 필요 없다.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def get(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._entries.get((kind, key))
+            if value is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end((kind, key))
+            self._stats["hits"] += 1
+            return value
+
+    def put(self, kind: str, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[(kind, key)] = value
+            self._entries.move_to_end((kind, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "max_entries": self.max_entries, **self._stats}
+
+
+# 프로세스 단위 공유 캐시
+module_summary_cache = ModuleSummaryCache()
+
+
+class ModuleEntry:
+    """프로젝트의 모듈 1개 (요약이 끝나면 소스와 AST는 버림)
+
+    local_path가 주어지면 소스를 메모리에 두지 않고 필요할 때 디스크에서 다시 읽는다.
+    """
+
+    def __init__(self, path: str, source: str, local_path: Optional[str] = None):
+        self.path = path
+        self.module, self.is_package = module_name(path)
+        self.content_hash = _digest(source.encode("utf-8"))
+        self.local_path = local_path
+        self.source: Optional[str] = source
+        self.tree: Optional[ast.Module] = None
+        self.imports: List[str] = []
+        self.aliases: Dict[str, str] = {}
+        # 프로젝트 모듈을 가리키는 별칭 (패키지 재수출 해석용)
+        self.reexports: Dict[str, str] = {}
+        self.functions: Dict[str, ExportedFunction] = {}
+        # 내보낸 함수 요약의 해시 (이 모듈을 import하는 모듈의 캐시 키에 들어감)
+        self.digest = ""
+        self.calls: Dict[str, List[str]] = {}
+        self.external_calls = 0
+        self.key: Optional[str] = None
+
+    def parse(self) -> ast.Module:
+        """모듈 AST (디스크에 둔 소스는 파싱할 때만 읽음)"""
+        if self.tree is None:
+            source = self.source
+            if source is None:
+                with open(self.local_path, encoding="utf-8") as file:
+                    source = file.read()
+            self.tree = parse_source(source)
+        return self.tree
+
+
+class ProjectIndex:
+    """리뷰에 포함된 파일들의 프로젝트 심볼 테이블과 호출 그래프
+
+    모듈마다 TaintAnalyzer로 함수 요약(매개변수 -> 싱크, 반환값의 오염)과 반복문 깊이를 계산해
+    "모듈.함수" 이름으로 모은다. import되는 모듈부터 요약하므로 호출을 따라가며 여러 모듈에 걸친
+    흐름이 요약에 누적되고, 각 파일 리뷰는 context_for로 받은 요약만으로 다른 모듈 호출을 해석한다
+    (다른 파일을 다시 파싱하지 않음). 모듈 경로의 뒤쪽 일부로도 import를 해석하므로 아카이브 최상위
+    디렉터리(repo-main/pkg/x.py)가 있어도 import pkg.x가 연결된다.
+    """
+
+    def __init__(self, cache: Optional[ModuleSummaryCache] = module_summary_cache):
+        self.cache = cache
+        self.modules: Dict[str, ModuleEntry] = {}
+        # 모듈 이름 접미사 -> (생략한 앞부분 요소 수, 모듈) (같은 우선순위로 겹치면 None)
+        self._suffixes: Dict[str, Tuple[int, Optional[ModuleEntry]]] = {}
+        self._splits: Dict[str, Optional[Tuple[ModuleEntry, List[str]]]] = {}
+        self.stats = {"modules": 0, "summaries_reused": 0, "summaries_computed": 0}
+
+    @classmethod
+    def build(cls, files: Iterable[Tuple[str, str]],
+              cache: Optional[ModuleSummaryCache] = module_summary_cache,
+              on_disk: bool = False) -> "ProjectIndex":
+        """(경로, 소스) 목록으로 인덱스 생성 (Python 파일만, 구문 오류 파일은 제외)
+
+        on_disk이면 목록은 (경로, 소스를 풀어 둔 로컬 파일 경로)이며 소스는 한 번에 하나씩만 읽는다.
+        """
+        index = cls(cache)
+        for path, source in files:
+            if path.lower().endswith(PROJECT_EXTENSIONS):
+                if on_disk:
+                    local_path = source
+                    with open(local_path, encoding="utf-8") as file:
+                        source = file.read()
+                    index._add(ModuleEntry(path, source, local_path))
+                else:
+                    index._add(ModuleEntry(path, source))
+        for entry in index.modules.values():
+            entry.reexports = {
+                local: aliased for local, aliased in entry.aliases.items() if index._split(aliased) is not None
+            }
+        index._summarize()
+        return index
+
+    def _add(self, entry: ModuleEntry) -> None:
+        header = self._cached("header", _digest(entry.content_hash, entry.path))
+        if header is None:
+            try:
+                tree = entry.parse()
+            except (SyntaxError, ValueError):
+                return
+            analyzer = TaintAnalyzer(project=ProjectContext(entry.module, entry.is_package))
+            analyzer.collect(tree)
+            header = {"imports": sorted(analyzer.imports), "aliases": analyzer.aliases}
+            self._store("header", _digest(entry.content_hash, entry.path), header)
+        if entry.local_path is not None:
+            # 디스크에 둔 소스는 요약할 때 다시 읽으므로 소스와 AST를 모듈 수만큼 쌓아 두지 않음
+            entry.source = None
+            entry.tree = None
+        entry.imports = header["imports"]
+        entry.aliases = header["aliases"]
+        self.modules[entry.path] = entry
+        self.stats["modules"] += 1
+        if entry.module:
+            parts = entry.module.split(".")
+            for skipped in range(len(parts)):
+                suffix = ".".join(parts[skipped:])
+                current = self._suffixes.get(suffix)
+                if current is None or skipped < current[0]:
+                    self._suffixes[suffix] = (skipped, entry)
+                elif skipped == current[0] and current[1] is not entry:
+                    self._suffixes[suffix] = (skipped, None)
+
+    def _cached(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        return self.cache.get(kind, key) if self.cache is not None else None
+
+    def _store(self, kind: str, key: str, value: Dict[str, Any]) -> None:
+        if self.cache is not None:
+            self.cache.put(kind, key, value)
+
+    # 이름 해석
+
+    def _find_module(self, name: str) -> Optional[ModuleEntry]:
+        found = self._suffixes.get(name)
+        return found[1] if found is not None else None
+
+    def _split(self, name: str) -> Optional[Tuple[ModuleEntry, List[str]]]:
+        """점 표기 이름을 가장 긴 프로젝트 모듈 이름과 나머지 요소로 나눔 (이름별로 한 번만 계산)"""
+        if name not in self._splits:
+            found = None
+            parts = name.split(".")
+            for split in range(len(parts), 0, -1):
+                entry = self._find_module(".".join(parts[:split]))
+                if entry is not None:
+                    found = entry, parts[split:]
+                    break
+            self._splits[name] = found
+        return self._splits[name]
+
+    def _resolve(self, name: str, hops: int = 0) -> Optional[Tuple[ModuleEntry, ExportedFunction]]:
+        found = self._split(name)
+        if found is None or not found[1]:
+            return None
+        entry, rest = found
+        exported = entry.functions.get(".".join(rest))
+        if exported is not None:
+            return entry, exported
+        target = entry.reexports.get(rest[0])
+        if target is not None and hops < MAX_REEXPORT_HOPS:
+            return self._resolve(".".join([target, *rest[1:]]), hops + 1)
+        return None
+
+    def lookup(self, name: str) -> Optional[ExportedFunction]:
+        """점 표기 이름(모듈.함수, 모듈.클래스.메서드, 패키지 재수출)을 내보낸 함수 요약으로 해석"""
+        resolved = self._resolve(name)
+        return resolved[1] if resolved is not None else None
+
+    def _symbols(self, entry: ModuleEntry) -> Tuple[Dict[str, ExportedFunction], str]:
+        """모듈이 import하는 프로젝트 함수의 요약 (키는 그 모듈에서 부르는 이름)과 참조한 모듈들의 해시"""
+        symbols: Dict[str, ExportedFunction] = {}
+        sources = {}
+        for target in entry.imports:
+            found = self._split(target)
+            if found is None or found[0] is entry:
+                continue
+            module, rest = found
+            sources[module.path] = module
+            prefix = ".".join(rest)
+            for name, exported in module.functions.items():
+                if not prefix:
+                    symbols[f"{target}.{name}"] = exported
+                elif name == prefix or name.startswith(prefix + "."):
+                    symbols[target + name[len(prefix):]] = exported
+            # 패키지 재수출
+            for local, aliased in module.reexports.items():
+                if rest and local != rest[0]:
+                    continue
+                resolved = self._resolve(".".join([aliased, *rest[1:]]), 1)
+                if resolved is not None:
+                    sources[resolved[0].path] = resolved[0]
+                    symbols.setdefault(target if rest else f"{target}.{local}", resolved[1])
+        digest = _digest(sorted([module.path, module.content_hash, module.digest] for module in sources.values()))
+        return symbols, digest
+
+    def context_for(self, path: str) -> Optional[ProjectContext]:
+        """파일 리뷰에 넘길 프로젝트 정보 (인덱스에 없거나 다른 모듈 함수를 import하지 않으면 None)"""
+        entry = self.modules.get(path)
+        if entry is None:
+            return None
+        symbols, digest = self._symbols(entry)
+        return ProjectContext(entry.module, entry.is_package, symbols, digest) if symbols else None
+
+    # 요약
+
+    def _order(self) -> List[ModuleEntry]:
+        """import되는 모듈이 먼저 오는 순서 (DFS 후위 순회, 순환은 방문 순서대로 끊음)"""
+        order: List[ModuleEntry] = []
+        visited = set()
+        for root in self.modules.values():
+            if root.path in visited:
+                continue
+            visited.add(root.path)
+            stack = [(root, iter(root.imports))]
+            while stack:
+                entry, targets = stack[-1]
+                for target in targets:
+                    found = self._split(target)
+                    if found is not None and found[0].path not in visited:
+                        visited.add(found[0].path)
+                        stack.append((found[0], iter(found[0].imports)))
+                        break
+                else:
+                    stack.pop()
+                    order.append(entry)
+        return order
+
+    def _summarize(self) -> None:
+        """의존 순서대로 모듈 요약 계산 (캐시 키: 내용 해시 + 경로 + 참조한 요약의 해시)
+
+        순환 import가 있으면 참조한 요약이 바뀐 모듈만 다시 계산하며, 모든 키가 그대로이면 끝낸다.
+        """
+        order = self._order()
+        for _ in range(MAX_PROJECT_PASSES):
+            changed = False
+            for entry in order:
+                symbols, digest = self._symbols(entry)
+                key = _digest(entry.content_hash, entry.path, digest)
+                if key == entry.key:
+                    continue
+                summary = self._cached("summary", key)
+                if summary is None:
+                    summary = self._analyze(entry, ProjectContext(entry.module, entry.is_package, symbols, digest))
+                    self._store("summary", key, summary)
+                    self.stats["summaries_computed"] += 1
+                else:
+                    self.stats["summaries_reused"] += 1
+                changed = changed or summary["digest"] != entry.digest
+                entry.key = key
+                entry.digest = summary["digest"]
+                entry.functions = summary["functions"]
+                entry.calls = summary["calls"]
+                entry.external_calls = summary["external_calls"]
+            if not changed:
+                break
+        for entry in order:
+            entry.source = None
+            entry.tree = None
+
+    def _analyze(self, entry: ModuleEntry, context: ProjectContext) -> Dict[str, Any]:
+        analyzer = TaintAnalyzer(project=context)
+        analyzer.analyze(entry.parse())
+        if entry.local_path is not None:
+            entry.tree = None
+        functions = analyzer.export_summaries(entry.path, entry.module)
+        depths, calls, external_calls = call_loop_depths(analyzer, entry.module)
+        for name, exported in functions.items():
+            exported["loop_depth"] = depths.get(name, 0)
+        return {
+            "functions": functions,
+            "digest": _digest(functions),
+            "calls": calls,
+            "external_calls": external_calls
+        }
+
+    def call_graph(self) -> Dict[str, List[str]]:
+        """호출 그래프 (모듈.함수 -> 호출하는 모듈.함수 목록, 해석된 호출만)"""
+        graph: Dict[str, List[str]] = {}
+        for entry in self.modules.values():
+            graph.update(entry.calls)
+        return graph
+
+    def report(self, include_graph: bool = False) -> Dict[str, Any]:
+        """저장용 요약 (모듈 수, 모듈을 넘는 호출 수, 요약 재사용 수, 선택적으로 호출 그래프)"""
+        report = {
+            **self.stats,
+            "functions": sum(len(entry.functions) for entry in self.modules.values()),
+            "cross_module_calls": sum(entry.external_calls for entry in self.modules.values())
+        }
+        if include_graph:
+            report["call_graph"] = self.call_graph()
+        return report
+
+    def snapshot(self, include_graph: bool = False) -> "ProjectSnapshot":
+        """파일별 ProjectContext와 저장용 요약만 담은 pickle 가능한 결과 (프로세스 풀에서 만들어 넘김)"""
+        contexts = {}
+        for path in self.modules:
+            context = self.context_for(path)
+            if context is not None:
+                contexts[path] = context
+        return ProjectSnapshot(contexts, self.report(), self.call_graph() if include_graph else None)
+
+
+class ProjectSnapshot:
+    """ProjectIndex에서 파일 리뷰에 필요한 것만 남긴 결과 (기본 타입과 ProjectContext만 담음)"""
+
+    def __init__(self, contexts: Dict[str, ProjectContext], summary: Dict[str, Any],
+                 call_graph: Optional[Dict[str, List[str]]] = None):
+        self.contexts = contexts
+        self.summary = summary
+        self.call_graph = call_graph
+
+    def context_for(self, path: str) -> Optional[ProjectContext]:
+        return self.contexts.get(path)
+
+    def report(self, include_graph: bool = False) -> Dict[str, Any]:
+        """저장용 요약 (ProjectIndex.report와 같은 형식, 호출 그래프는 만들 때 포함한 경우에만)"""
+        if include_graph and self.call_graph is not None:
+            return {**self.summary, "call_graph": self.call_graph}
+        return dict(self.summary)
+
+
+def build_project_snapshot(files: Iterable[Tuple[str, str]], on_disk: bool = False,
+                           include_graph: bool = False) -> ProjectSnapshot:
+    """프로젝트 인덱스를 만들어 스냅샷만 반환 (분석 실행기의 워커 프로세스에서 실행하는 CPU 바운드 작업)"""
+    return ProjectIndex.build(files, on_disk=on_disk).snapshot(include_graph)
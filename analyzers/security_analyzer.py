@@ -1,14 +1,29 @@
 import ast
 from typing import List
 from models import SecurityVulnerability
+from analyzers.context import AnalysisContext
+from analyzers.engine import RuleEngine
 
-class SecurityASTAnalyzer(ast.NodeVisitor):
+class SecurityASTAnalyzer:
     def __init__(self):
         self.vulnerabilities: List[SecurityVulnerability] = []
         self.context_stack = []
         self.imports = set()
 
-    def visit_Call(self, node):
+    def register(self, engine: RuleEngine) -> None:
+        """단일 순회 엔진에 노드 타입별 규칙 등록"""
+        engine.register(ast.Call, self.check_call)
+
+    def visit(self, tree: ast.AST) -> None:
+        """이 분석기만 등록한 엔진으로 트리 순회"""
+        RuleEngine().add_rules(self).run(tree)
+
+    def analyze(self, context: AnalysisContext) -> List[SecurityVulnerability]:
+        """공유 컨텍스트의 AST를 분석"""
+        self.visit(context.tree)
+        return self.vulnerabilities
+
+    def check_call(self, node):
         func_name = self._get_func_name(node)
         
         # SQL Injection Detection
@@ -23,17 +38,7 @@ class SecurityASTAnalyzer(ast.NodeVisitor):
                 confidence=0.8
             ))
         
-        # Command Injection Detection
-        if func_name in ['system', 'popen', 'subprocess.call', 'os.system'] and self._has_user_input(node):
-            self.vulnerabilities.append(SecurityVulnerability(
-                type="Command Injection",
-                severity="CRITICAL",
-                line_number=node.lineno,
-                description=f"Potential command injection in {func_name}",
-                cwe_id="CWE-78",
-                recommendation="Validate and sanitize all user inputs, use subprocess with shell=False",
-                confidence=0.9
-            ))
+        # Command Injection은 입력 흐름을 따라가는 analyzers.taint.TaintAnalyzer가 탐지
         
         # Path Traversal Detection
         if func_name in ['open', 'file'] and len(node.args) > 0:
@@ -74,8 +79,6 @@ class SecurityASTAnalyzer(ast.NodeVisitor):
                             recommendation="Use environment variables or secure configuration management",
                             confidence=0.7
                         ))
-        
-        self.generic_visit(node)
 
     def _get_func_name(self, node):
         """Extract function name from call node"""
@@ -97,13 +100,4 @@ class SecurityASTAnalyzer(ast.NodeVisitor):
                 return True
             if isinstance(arg, ast.Call) and hasattr(arg.func, 'attr') and arg.func.attr == 'format':
                 return True
-        return False
-
-    def _has_user_input(self, node):
-        """Check if node contains potential user input"""
-        for arg in node.args:
-            if isinstance(arg, ast.Name) and arg.id in ['input', 'request', 'params']:
-                return True
-            if isinstance(arg, ast.Attribute) and arg.attr in ['args', 'form', 'json']:
-                return True
         return False
\ No newline at end of file
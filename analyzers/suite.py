@@ -0,0 +1,23 @@
+import ast
+from analyzers.engine import RuleEngine
+from analyzers.security_analyzer import SecurityASTAnalyzer
+from analyzers.performance_analyzer import PerformancePatternAnalyzer
+from analyzers.bug_detector import BugDetector, CodeSmellDetector
+
+
+class AnalysisSuite:
+    """리뷰 한 번에 필요한 모든 규칙 묶음. 단일 RuleEngine 순회로 함께 실행된다."""
+
+    def __init__(self):
+        self.security = SecurityASTAnalyzer()
+        self.performance = PerformancePatternAnalyzer()
+        self.bugs = BugDetector()
+        self.code_smells = CodeSmellDetector()
+
+    def rule_sets(self) -> list:
+        return [self.security, self.performance, self.bugs, self.code_smells]
+
+    def run(self, tree: ast.AST, *extra_rule_sets) -> "AnalysisSuite":
+        """모든 규칙(및 추가 규칙 묶음)을 한 번의 순회로 실행"""
+        RuleEngine().add_rules(*self.rule_sets(), *extra_rule_sets).run(tree)
+        return self
@@ -0,0 +1,1037 @@
+import ast
+import logging
+from collections import deque
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from models import SecurityVulnerability
+
+logger = logging.getLogger(__name__)
+
+# 이름 패턴 (TaintSpec에서 일치 여부 판단)
+# - "a.b": 전체 이름이 a.b이거나 ...a.b로 끝남 (self.request.args, flask.request.args)
+# - ".m": 마지막 요소가 m인 메서드 호출 (cursor.execute)
+# - "f": 전체 이름이 정확히 f (내장 함수)
+# import 별칭은 원래 이름으로 바꾼 뒤 비교한다 (from os import system -> os.system).
+
+# 오염원: 이 이름의 속성 값이나 호출 결과는 신뢰할 수 없는 입력
+TAINT_SOURCES = (
+    "input", "sys.argv", "sys.stdin", "os.environ", "os.getenv",
+    "request.args", "request.form", "request.values", "request.json", "request.get_json", "request.data",
+    "request.cookies", "request.headers", "request.files", "request.GET", "request.POST", "request.body",
+    "request.query_params", "request.path_params",
+)
+
+# 이 이름의 함수 매개변수는 요청/사용자 입력으로 보고 오염원으로 취급 (웹 핸들러의 request 등)
+TAINT_SOURCE_PARAMS = ("request", "params", "user_input")
+
+# 싱크 종류 -> (취약점 유형, 심각도, CWE, 권고)
+SINK_KINDS = {
+    "command": ("Command Injection", "CRITICAL", "CWE-78",
+                "Validate and sanitize all user inputs, use subprocess with shell=False"),
+    "code": ("Code Injection", "CRITICAL", "CWE-94",
+             "Never evaluate untrusted input; use ast.literal_eval or explicit parsing"),
+    "sql": ("SQL Injection", "HIGH", "CWE-89", "Use parameterized queries or prepared statements"),
+    "path": ("Path Traversal", "MEDIUM", "CWE-22", "Validate file paths and use os.path.join()"),
+    "deserialization": ("Insecure Deserialization", "HIGH", "CWE-502",
+                        "Do not deserialize untrusted data; use JSON or a safe loader"),
+    "ssrf": ("Server-Side Request Forgery", "MEDIUM", "CWE-918", "Validate URLs against an allow-list of hosts"),
+    "template": ("Cross-Site Scripting", "HIGH", "CWE-79", "Render untrusted values through escaped templates"),
+}
+
+# 싱크: 이름 -> (종류, 검사할 위치 인자 (None이면 모든 인자), 이 키워드가 True일 때만 (None이면 항상))
+TAINT_SINKS = {
+    "os.system": ("command", None, None),
+    "os.popen": ("command", (0,), None),
+    "subprocess.getoutput": ("command", (0,), None),
+    "subprocess.getstatusoutput": ("command", (0,), None),
+    "subprocess.call": ("command", (0,), "shell"),
+    "subprocess.run": ("command", (0,), "shell"),
+    "subprocess.Popen": ("command", (0,), "shell"),
+    "subprocess.check_call": ("command", (0,), "shell"),
+    "subprocess.check_output": ("command", (0,), "shell"),
+    "eval": ("code", (0,), None),
+    "exec": ("code", (0,), None),
+    ".execute": ("sql", (0,), None),
+    ".executemany": ("sql", (0,), None),
+    ".executescript": ("sql", (0,), None),
+    "open": ("path", (0,), None),
+    "os.remove": ("path", (0,), None),
+    "os.unlink": ("path", (0,), None),
+    "shutil.rmtree": ("path", (0,), None),
+    "send_file": ("path", (0,), None),
+    "pickle.loads": ("deserialization", (0,), None),
+    "pickle.load": ("deserialization", (0,), None),
+    "marshal.loads": ("deserialization", (0,), None),
+    "yaml.unsafe_load": ("deserialization", (0,), None),
+    "requests.get": ("ssrf", (0,), None),
+    "requests.post": ("ssrf", (0,), None),
+    "urllib.request.urlopen": ("ssrf", (0,), None),
+    "render_template_string": ("template", (0,), None),
+    "markupsafe.Markup": ("template", (0,), None),
+}
+
+# 정화 함수: 호출 결과는 오염되지 않은 값
+TAINT_SANITIZERS = (
+    "int", "float", "bool", "len", "shlex.quote", "pipes.quote", "html.escape", "markupsafe.escape",
+    "os.path.basename", "werkzeug.utils.secure_filename", "bleach.clean", "urllib.parse.quote",
+)
+
+# 오염 표식: 함수 매개변수 위치(int) 또는 (오염원 이름, 라인)
+# (다른 모듈 함수의 요약에서는 오염원이 "이름 in 경로:라인" 문자열이며, 호출 지점에서 (문자열, 호출 라인)이 된다)
+Label = object
+Taint = FrozenSet[Label]
+State = Dict[str, Taint]
+EMPTY: Taint = frozenset()
+
+# 함수 1개당 블록 처리 횟수 상한 (블록 수 배수, 비정상적으로 큰 격자에 대한 안전장치)
+MAX_BLOCK_VISITS_PER_BLOCK = 50
+# 전체 함수 분석 횟수 상한 (함수 수 배수)
+MAX_FUNCTION_VISITS_PER_FUNCTION = 20
+
+
+class TaintSpec:
+    """선언적 오염원/싱크/정화 함수 표를 이름 일치 규칙에 맞게 색인"""
+
+    def __init__(self, sources: Iterable[str] = TAINT_SOURCES,
+                 sinks: Optional[Dict[str, tuple]] = None,
+                 sanitizers: Iterable[str] = TAINT_SANITIZERS,
+                 source_params: Iterable[str] = TAINT_SOURCE_PARAMS):
+        self.sinks = dict(TAINT_SINKS if sinks is None else sinks)
+        self.source_params = frozenset(source_params)
+        self._sources = self._index(sources)
+        self._sinks = self._index(self.sinks)
+        self._sanitizers = self._index(sanitizers)
+
+    @staticmethod
+    def _index(patterns: Iterable[str]) -> Tuple[Set[str], Set[str], Set[str]]:
+        exact, dotted, methods = set(), set(), set()
+        for pattern in patterns:
+            if pattern.startswith("."):
+                methods.add(pattern[1:])
+            elif "." in pattern:
+                dotted.add(pattern)
+            else:
+                exact.add(pattern)
+        return exact, dotted, methods
+
+    @staticmethod
+    def _match(name: str, index: Tuple[Set[str], Set[str], Set[str]]) -> Optional[str]:
+        exact, dotted, methods = index
+        if name in exact or name in dotted:
+            return name
+        parts = name.split(".")
+        for start in range(1, len(parts) - 1):
+            suffix = ".".join(parts[start:])
+            if suffix in dotted:
+                return suffix
+        if len(parts) > 1 and parts[-1] in methods:
+            return "." + parts[-1]
+        return None
+
+    def source(self, name: str) -> Optional[str]:
+        return self._match(name, self._sources)
+
+    def sink(self, name: str) -> Optional[str]:
+        return self._match(name, self._sinks)
+
+    def sanitizer(self, name: str) -> Optional[str]:
+        return self._match(name, self._sanitizers)
+
+
+DEFAULT_TAINT_SPEC = TaintSpec()
+
+
+class FunctionInfo:
+    """분석 단위 함수 (모듈 최상위 코드는 매개변수 없는 <module> 함수)"""
+
+    def __init__(self, name: str, body: List[ast.stmt], params: List[str] = (),
+                 parent: Optional["FunctionInfo"] = None, class_name: Optional[str] = None,
+                 kind: str = "function", lineno: int = 0):
+        self.name = name
+        self.lineno = lineno
+        self.body = body
+        self.params = list(params)
+        self.param_index = {param: index for index, param in enumerate(self.params)}
+        self.parent = parent
+        self.class_name = class_name
+        # function / method / staticmethod / classmethod
+        self.kind = kind
+        self.nested: Dict[str, "FunctionInfo"] = {}
+        # 매개변수와 본문에서 바인딩되는 지역 이름 (모듈 전역 오염을 가리는 이름, 최초 사용 시 계산)
+        self._local_names: Optional[Set[str]] = None
+
+    @property
+    def local_names(self) -> Set[str]:
+        if self._local_names is None:
+            self._local_names = _local_names(self.body) | set(self.params)
+        return self._local_names
+
+
+class FunctionSummary:
+    """함수 요약 (메모이즈되어 호출 지점마다 재사용)
+
+    - returns: 반환값에 섞이는 표식 (매개변수 위치 또는 함수 안의 오염원)
+    - param_sinks: (매개변수 위치, 싱크 이름, 싱크 라인, 싱크 종류) -> 싱크가 있는 함수 이름
+    """
+
+    def __init__(self):
+        self.returns: Taint = EMPTY
+        self.param_sinks: Dict[tuple, str] = {}
+
+    def merge(self, returns: Taint, param_sinks: Dict[tuple, str]) -> bool:
+        """분석 결과를 합치고 요약이 커졌는지 반환 (요약은 단조 증가하므로 반복이 끝난다)"""
+        changed = not returns <= self.returns
+        self.returns = self.returns | returns
+        for key, via in param_sinks.items():
+            if key not in self.param_sinks:
+                self.param_sinks[key] = via
+                changed = True
+        return changed
+
+
+class ExternalFunction(FunctionInfo):
+    """다른 모듈의 함수: 본문 대신 프로젝트 심볼 테이블의 내보낸 요약(TaintAnalyzer.export_summaries)으로 해석"""
+
+    def __init__(self, name: str, exported: Dict[str, Any]):
+        super().__init__(name, [], exported["params"], kind=exported["kind"])
+        # 정의된 모듈 기준 전체 이름 (name은 호출하는 파일에서 쓰는 이름)
+        self.qualified_name = exported.get("name", name)
+        self.loop_depth = exported.get("loop_depth", 0)
+        self.summary = FunctionSummary()
+        # 싱크 위치는 다른 파일이므로 라인 대신 None (호출 지점 라인으로 보고)
+        self.summary.merge(frozenset(exported["returns"]), {
+            (param, sink, None, kind): owner for param, sink, kind, owner in exported["sinks"]
+        })
+
+    def located_names(self) -> Set[str]:
+        """이미 위치가 붙은 오염원/싱크/함수 이름"""
+        names = {label for label in self.summary.returns if isinstance(label, str)}
+        for (_, sink, _, _), owner in self.summary.param_sinks.items():
+            names.update((sink, owner))
+        return names
+
+
+def _function_params(node) -> List[str]:
+    arguments = node.args
+    return [arg.arg for arg in [*arguments.posonlyargs, *arguments.args, *arguments.kwonlyargs]]
+
+
+def _function_kind(node, class_name: Optional[str]) -> str:
+    if class_name is None:
+        return "function"
+    decorators = {decorator.id for decorator in node.decorator_list if isinstance(decorator, ast.Name)}
+    if "staticmethod" in decorators:
+        return "staticmethod"
+    if "classmethod" in decorators:
+        return "classmethod"
+    return "method"
+
+
+def _child_statements(node: ast.AST) -> Iterable[ast.AST]:
+    """복합문/처리기/case의 하위 문 (식은 따라가지 않음)"""
+    for field in ("body", "orelse", "finalbody", "handlers", "cases"):
+        yield from getattr(node, field, ())
+
+
+def _target_names(target: ast.AST) -> List[str]:
+    """대입 대상(튜플/별표 포함)에 들어 있는 이름"""
+    if isinstance(target, ast.Name):
+        return [target.id]
+    if isinstance(target, (ast.Tuple, ast.List)):
+        return [name for element in target.elts for name in _target_names(element)]
+    if isinstance(target, ast.Starred):
+        return _target_names(target.value)
+    return []
+
+
+def _pattern_names(pattern: ast.AST) -> List[str]:
+    """match 패턴이 바인딩하는 이름"""
+    return [
+        node.name for node in ast.walk(pattern)
+        if isinstance(node, (ast.MatchAs, ast.MatchStar)) and node.name
+    ] + [
+        node.rest for node in ast.walk(pattern) if isinstance(node, ast.MatchMapping) and node.rest
+    ]
+
+
+def _local_names(body: List[ast.stmt]) -> Set[str]:
+    """함수 본문에서 바인딩되어 지역 변수가 되는 이름 (global/nonlocal 선언 제외, 중첩 스코프는 이름만)"""
+    bound: Set[str] = set()
+    declared: Set[str] = set()
+    stack: List[ast.AST] = list(body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            bound.add(node.name)
+            stack.extend(node.decorator_list)
+            continue
+        if isinstance(node, (ast.Lambda, ast.ListComp, ast.SetComp, ast.GeneratorExp, ast.DictComp)):
+            continue
+        if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load):
+            bound.add(node.id)
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            declared.update(node.names)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            bound.update((alias.asname or alias.name).partition(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ExceptHandler) and node.name:
+            bound.add(node.name)
+        elif isinstance(node, (ast.MatchAs, ast.MatchStar)) and node.name:
+            bound.add(node.name)
+        stack.extend(ast.iter_child_nodes(node))
+    return bound - declared
+
+
+class ControlFlowGraph:
+    """함수 본문의 기본 블록 그래프
+
+    블록은 명령 목록이다: ("stmt", 문), ("eval", 식), ("bind", 대상, 식 또는 None),
+    ("return", 식 또는 None), ("kill", 이름), ("class", 클래스 정의). 예외 처리기는 try 본문의 모든 블록을
+    선행 블록으로 가진다.
+    """
+
+    def __init__(self, body: List[ast.stmt]):
+        self.blocks: List[List[tuple]] = []
+        self.successors: List[List[int]] = []
+        # (continue 대상, break 대상)
+        self._loops: List[Tuple[int, int]] = []
+        self.entry = self._new_block()
+        self._build(body, self.entry)
+
+    def _new_block(self) -> int:
+        self.blocks.append([])
+        self.successors.append([])
+        return len(self.blocks) - 1
+
+    def _link(self, source: Optional[int], target: int) -> None:
+        if source is not None:
+            self.successors[source].append(target)
+
+    def _build(self, body: List[ast.stmt], current: Optional[int]) -> Optional[int]:
+        for statement in body:
+            if current is None:
+                # return/break 뒤의 도달 불가능한 코드
+                current = self._new_block()
+            current = self._statement(statement, current)
+        return current
+
+    def _loop(self, current: int, header_instruction: tuple, body: List[ast.stmt],
+              orelse: List[ast.stmt]) -> int:
+        header = self._new_block()
+        self._link(current, header)
+        self.blocks[header].append(header_instruction)
+        body_start = self._new_block()
+        self._link(header, body_start)
+        after = self._new_block()
+        self._loops.append((header, after))
+        body_end = self._build(body, body_start)
+        self._loops.pop()
+        self._link(body_end, header)
+        if orelse:
+            else_start = self._new_block()
+            self._link(header, else_start)
+            self._link(self._build(orelse, else_start), after)
+        else:
+            self._link(header, after)
+        return after
+
+    def _statement(self, statement: ast.stmt, current: int) -> Optional[int]:
+        blocks = self.blocks
+        if isinstance(statement, ast.If):
+            blocks[current].append(("eval", statement.test))
+            then_start = self._new_block()
+            self._link(current, then_start)
+            ends = [self._build(statement.body, then_start)]
+            if statement.orelse:
+                else_start = self._new_block()
+                self._link(current, else_start)
+                ends.append(self._build(statement.orelse, else_start))
+            else:
+                ends.append(current)
+            return self._join(ends)
+
+        if isinstance(statement, ast.While):
+            return self._loop(current, ("eval", statement.test), statement.body, statement.orelse)
+
+        if isinstance(statement, (ast.For, ast.AsyncFor)):
+            return self._loop(current, ("bind", statement.target, statement.iter), statement.body, statement.orelse)
+
+        if isinstance(statement, (ast.With, ast.AsyncWith)):
+            for item in statement.items:
+                if item.optional_vars is not None:
+                    blocks[current].append(("bind", item.optional_vars, item.context_expr))
+                else:
+                    blocks[current].append(("eval", item.context_expr))
+            return self._build(statement.body, current)
+
+        if isinstance(statement, (ast.Try, getattr(ast, "TryStar", ast.Try))):
+            return self._try(statement, current)
+
+        if isinstance(statement, ast.Match):
+            blocks[current].append(("eval", statement.subject))
+            ends = [current]
+            for case in statement.cases:
+                case_start = self._new_block()
+                self._link(current, case_start)
+                for name in _pattern_names(case.pattern):
+                    blocks[case_start].append(("bind", ast.Name(id=name, ctx=ast.Store()), statement.subject))
+                if case.guard is not None:
+                    blocks[case_start].append(("eval", case.guard))
+                ends.append(self._build(case.body, case_start))
+            return self._join(ends)
+
+        if isinstance(statement, ast.Return):
+            blocks[current].append(("return", statement.value))
+            return None
+
+        if isinstance(statement, ast.Raise):
+            if statement.exc is not None:
+                blocks[current].append(("eval", statement.exc))
+            return None
+
+        if isinstance(statement, (ast.Break, ast.Continue)):
+            if self._loops:
+                continue_target, break_target = self._loops[-1]
+                self._link(current, break_target if isinstance(statement, ast.Break) else continue_target)
+            return None
+
+        if isinstance(statement, ast.ClassDef):
+            # 클래스 본문은 정의 시점에 한 번 실행됨 (데코레이터와 기반 클래스 식을 먼저 평가)
+            for expression in (*statement.decorator_list, *statement.bases,
+                               *(keyword.value for keyword in statement.keywords)):
+                blocks[current].append(("eval", expression))
+            blocks[current].append(("class", statement))
+            return current
+
+        if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            # 함수 정의는 별도 분석 단위이고, 여기서는 이름을 덮어쓰기만 함
+            blocks[current].append(("kill", statement.name))
+            return current
+
+        blocks[current].append(("stmt", statement))
+        return current
+
+    def _try(self, statement, current: int) -> Optional[int]:
+        body_start = self._new_block()
+        self._link(current, body_start)
+        mark = len(self.blocks)
+        body_end = self._build(statement.body, body_start)
+        body_blocks = [body_start, *range(mark, len(self.blocks))]
+        if statement.orelse:
+            body_end = self._build(statement.orelse, body_end)
+        ends = [body_end]
+        for handler in statement.handlers:
+            handler_start = self._new_block()
+            for block in body_blocks:
+                self._link(block, handler_start)
+            if handler.name:
+                self.blocks[handler_start].append(("kill", handler.name))
+            ends.append(self._build(handler.body, handler_start))
+        after = self._join(ends)
+        if statement.finalbody:
+            if after is None:
+                after = self._new_block()
+            return self._build(statement.finalbody, after)
+        return after
+
+    def _join(self, ends: List[Optional[int]]) -> Optional[int]:
+        reachable = [end for end in ends if end is not None]
+        if not reachable:
+            return None
+        after = self._new_block()
+        for end in reachable:
+            self._link(end, after)
+        return after
+
+
+class FunctionAnalysis:
+    """함수 1개의 블록 단위 worklist 데이터 흐름 분석 (may 분석: 합류 시 합집합)
+
+    매개변수는 위치 표식으로 시작하므로, 한 번의 분석으로 요약(반환값/매개변수->싱크)과
+    함수 안의 오염원->싱크 발견을 함께 얻는다. 함수는 모듈 최상위 대입의 오염(TaintAnalyzer.module_globals)을
+    전역 이름의 초기 상태로 받고, 모듈 최상위 분석은 최상위 대입을 globals에 모은다.
+    """
+
+    def __init__(self, analyzer: "TaintAnalyzer", info: FunctionInfo):
+        self.analyzer = analyzer
+        self.spec = analyzer.spec
+        self.info = info
+        self.returns: Set[Label] = set()
+        self.param_sinks: Dict[tuple, str] = {}
+        # (종류, 싱크 이름, 싱크 라인, 오염원 이름, 오염원 라인) -> (경유 함수, 호출 라인)
+        self.findings: Dict[tuple, Tuple[Optional[str], Optional[int]]] = {}
+        self.callees: Set[FunctionInfo] = set()
+        self.state: State = {}
+        # 모듈 최상위 분석이면 최상위 대입의 오염을 이름별로 모음 (흐름 무관, 합집합)
+        self.is_module = info is analyzer.module
+        self.globals: State = {}
+        # 읽은 이름 (모듈 전역 오염이 커지면 다시 분석할 함수를 고르는 데 사용)
+        self.reads: Set[str] = set()
+        self._class_depth = 0
+
+    def run(self) -> None:
+        entry_state: State = {}
+        if not self.is_module and self.analyzer.module_globals:
+            # 지역 이름이 가리지 않는 모듈 전역의 오염에서 시작
+            local_names = self.info.local_names
+            entry_state = {
+                name: taint for name, taint in self.analyzer.module_globals.items()
+                if name.partition(".")[0] not in local_names
+            }
+        entry_state.update({
+            param: frozenset((index, (f"parameter {param}", self.info.lineno)))
+            if param in self.spec.source_params else frozenset((index,))
+            for param, index in self.info.param_index.items()
+        })
+        self._run_graph(ControlFlowGraph(self.info.body), entry_state)
+
+    def _run_graph(self, graph: ControlFlowGraph, entry_state: State) -> None:
+        inputs: List[Optional[State]] = [None] * len(graph.blocks)
+        inputs[graph.entry] = entry_state
+        worklist = deque([graph.entry])
+        queued = {graph.entry}
+        budget = MAX_BLOCK_VISITS_PER_BLOCK * len(graph.blocks)
+
+        while worklist and budget > 0:
+            budget -= 1
+            block = worklist.popleft()
+            queued.discard(block)
+            self.state = dict(inputs[block])
+            for instruction in graph.blocks[block]:
+                self._execute(instruction)
+            for successor in graph.successors[block]:
+                if self._join_into(inputs, successor, self.state) and successor not in queued:
+                    worklist.append(successor)
+                    queued.add(successor)
+        if worklist:
+            logger.warning(f"Taint analysis of {self.info.name} stopped at the block visit limit")
+
+    @staticmethod
+    def _join_into(inputs: List[Optional[State]], block: int, state: State) -> bool:
+        current = inputs[block]
+        if current is None:
+            inputs[block] = dict(state)
+            return True
+        changed = False
+        for name, taint in state.items():
+            previous = current.get(name)
+            if previous is None:
+                current[name] = taint
+                changed = True
+            elif not taint <= previous:
+                current[name] = previous | taint
+                changed = True
+        return changed
+
+    # 명령/문 전이
+
+    def _execute(self, instruction: tuple) -> None:
+        kind = instruction[0]
+        if kind == "stmt":
+            self._statement(instruction[1])
+        elif kind == "eval":
+            self.eval(instruction[1])
+        elif kind == "bind":
+            _, target, value = instruction
+            self._assign(target, self.eval(value) if value is not None else EMPTY)
+        elif kind == "return":
+            if instruction[1] is not None:
+                self.returns.update(self.eval(instruction[1]))
+        elif kind == "kill":
+            self.state.pop(instruction[1], None)
+        elif kind == "class":
+            # 클래스 본문: 바깥 상태에서 시작하는 별도 그래프로 분석한 뒤 바깥 상태로 돌아감
+            # (클래스 속성 대입은 자기 이름 공간에만 남고 바깥 이름을 바꾸지 않음)
+            node = instruction[1]
+            outer = self.state
+            self._class_depth += 1
+            self._run_graph(ControlFlowGraph(node.body), dict(outer))
+            self._class_depth -= 1
+            self.state = outer
+            self.state.pop(node.name, None)
+
+    def _statement(self, statement: ast.stmt) -> None:
+        if isinstance(statement, ast.Assign):
+            taint = self.eval(statement.value)
+            for target in statement.targets:
+                self._assign(target, taint)
+        elif isinstance(statement, ast.AugAssign):
+            self._assign(statement.target, self.eval(statement.value) | self._load(statement.target), weak=True)
+        elif isinstance(statement, ast.AnnAssign):
+            if statement.value is not None:
+                self._assign(statement.target, self.eval(statement.value))
+        elif isinstance(statement, ast.Expr):
+            self.eval(statement.value)
+        elif isinstance(statement, ast.Assert):
+            self.eval(statement.test)
+        elif isinstance(statement, ast.Delete):
+            for target in statement.targets:
+                if isinstance(target, ast.Name):
+                    self.state.pop(target.id, None)
+
+    def _record_global(self, key: str, taint: Taint) -> None:
+        """모듈 최상위(클래스 본문 제외) 대입의 오염을 전역 이름에 누적"""
+        if self.is_module and not self._class_depth and taint:
+            self.globals[key] = self.globals.get(key, EMPTY) | taint
+
+    def _assign(self, target: ast.AST, taint: Taint, weak: bool = False) -> None:
+        state = self.state
+        if isinstance(target, ast.Name):
+            if weak:
+                taint = taint | state.get(target.id, EMPTY)
+            if taint:
+                state[target.id] = taint
+            else:
+                state.pop(target.id, None)
+            self._record_global(target.id, taint)
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            for element in target.elts:
+                self._assign(element, taint, weak)
+        elif isinstance(target, ast.Starred):
+            self._assign(target.value, taint, weak)
+        elif isinstance(target, ast.Attribute):
+            key = self.analyzer.dotted_name(target)
+            if key is not None:
+                if weak:
+                    taint = taint | state.get(key, EMPTY)
+                state[key] = taint
+                self._record_global(key, taint)
+        elif isinstance(target, ast.Subscript):
+            # 컨테이너 원소 대입은 컨테이너 전체에 약한 갱신
+            key = self.analyzer.dotted_name(target.value)
+            if key is not None and taint:
+                state[key] = state.get(key, EMPTY) | taint
+                self._record_global(key, taint)
+
+    def _load(self, target: ast.AST) -> Taint:
+        if isinstance(target, (ast.Name, ast.Attribute, ast.Subscript)):
+            return self.eval(target)
+        return EMPTY
+
+    # 식 평가: 값에 섞인 오염 표식
+
+    def eval(self, node: ast.AST) -> Taint:
+        if isinstance(node, ast.Constant):
+            return EMPTY
+        if isinstance(node, ast.Name):
+            self.reads.add(node.id)
+            taint = self.state.get(node.id, EMPTY)
+            if node.id in self.analyzer.aliases:
+                taint = taint | self._source_label(self.analyzer.resolve(node.id), node)
+            return taint
+        if isinstance(node, ast.Attribute):
+            key = self.analyzer.dotted_name(node)
+            if key is not None:
+                self.reads.add(key)
+            if key is not None and key in self.state:
+                taint = self.state[key]
+            else:
+                taint = self.eval(node.value)
+            if key is not None:
+                taint = taint | self._source_label(self.analyzer.resolve(key), node)
+            return taint
+        if isinstance(node, ast.Call):
+            return self._call(node)
+        if isinstance(node, ast.BinOp):
+            return self.eval(node.left) | self.eval(node.right)
+        if isinstance(node, ast.Subscript):
+            self.eval(node.slice)
+            return self.eval(node.value)
+        if isinstance(node, ast.Compare):
+            self.eval(node.left)
+            for comparator in node.comparators:
+                self.eval(comparator)
+            return EMPTY
+        if isinstance(node, ast.NamedExpr):
+            taint = self.eval(node.value)
+            self._assign(node.target, taint)
+            return taint
+        if isinstance(node, (ast.ListComp, ast.SetComp, ast.GeneratorExp, ast.DictComp)):
+            return self._comprehension(node)
+        if isinstance(node, (ast.Yield, ast.YieldFrom)):
+            taint = self.eval(node.value) if node.value is not None else EMPTY
+            self.returns.update(taint)
+            return taint
+        if isinstance(node, ast.Lambda):
+            return EMPTY
+        # 컨테이너, f-문자열, 조건식, 불리언 연산 등: 하위 식의 합집합
+        taint = EMPTY
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.expr):
+                taint = taint | self.eval(child)
+        return taint
+
+    def _source_label(self, name: str, node: ast.AST, call: bool = False) -> Taint:
+        source = self.spec.source(name)
+        if source is None:
+            return EMPTY
+        return frozenset(((source + "()" if call else source, node.lineno),))
+
+    def _comprehension(self, node) -> Taint:
+        # 내포 변수는 별도 스코프이므로 평가가 끝나면 원래 값으로 되돌림
+        saved: Dict[str, Optional[Taint]] = {}
+        for generator in node.generators:
+            iterated = self.eval(generator.iter)
+            for name in _target_names(generator.target):
+                if name not in saved:
+                    saved[name] = self.state.get(name)
+                if iterated:
+                    self.state[name] = iterated
+                else:
+                    self.state.pop(name, None)
+            for condition in generator.ifs:
+                self.eval(condition)
+        if isinstance(node, ast.DictComp):
+            taint = self.eval(node.key) | self.eval(node.value)
+        else:
+            taint = self.eval(node.elt)
+        for name, previous in saved.items():
+            if previous is None:
+                self.state.pop(name, None)
+            else:
+                self.state[name] = previous
+        return taint
+
+    def _call(self, node: ast.Call) -> Taint:
+        name = self.analyzer.call_name(node.func)
+        arg_taints = [self.eval(arg) for arg in node.args]
+        keyword_taints = {keyword.arg: self.eval(keyword.value) for keyword in node.keywords}
+
+        if name is not None:
+            if self.spec.sanitizer(name) is not None:
+                return EMPTY
+            sink = self.spec.sink(name)
+            if sink is not None:
+                self._check_sink(node, name, self.spec.sinks[sink], arg_taints, keyword_taints)
+
+        target = self.analyzer.resolve_call(node.func, self.info)
+        if target is not None:
+            return self._apply_summary(node, *target, arg_taints, keyword_taints)
+
+        # 알 수 없는 호출: 인자와 수신 객체의 오염이 결과로 전파된다고 가정 (문자열 메서드 등)
+        taint = EMPTY
+        for arg_taint in arg_taints:
+            taint = taint | arg_taint
+        for keyword_taint in keyword_taints.values():
+            taint = taint | keyword_taint
+        if isinstance(node.func, ast.Attribute):
+            taint = taint | self.eval(node.func.value)
+        if name is not None:
+            taint = taint | self._source_label(name, node, call=True)
+        return taint
+
+    def _check_sink(self, node: ast.Call, name: str, sink: tuple, arg_taints: List[Taint],
+                    keyword_taints: Dict[Optional[str], Taint]) -> None:
+        kind, positions, required_keyword = sink
+        if required_keyword is not None and not any(
+            keyword.arg == required_keyword and isinstance(keyword.value, ast.Constant) and keyword.value.value is True
+            for keyword in node.keywords
+        ):
+            return
+        if positions is None:
+            taints = [*arg_taints, *keyword_taints.values()]
+        else:
+            taints = [arg_taints[position] for position in positions if position < len(arg_taints)]
+        for taint in taints:
+            for label in taint:
+                self._record_flow(label, (name, node.lineno, kind), self.info.name)
+
+    def _record_flow(self, label: Label, sink: tuple, owner: str,
+                     via: Optional[str] = None, call_line: Optional[int] = None) -> None:
+        """표식이 싱크에 닿음: 매개변수면 요약에, 오염원이면 발견으로 기록
+
+        owner는 싱크가 있는 함수, via/call_line은 이 함수에서 싱크 쪽으로 호출한 함수와 호출 라인이다.
+        """
+        sink_name, sink_line, kind = sink
+        if isinstance(label, int):
+            self.param_sinks.setdefault((label, sink_name, sink_line, kind), owner)
+        else:
+            source_name, source_line = label
+            self.findings.setdefault((kind, sink_name, sink_line, source_name, source_line), (via, call_line))
+
+    def _apply_summary(self, node: ast.Call, target: FunctionInfo, offset: int, arg_taints: List[Taint],
+                       keyword_taints: Dict[Optional[str], Taint]) -> Taint:
+        """호출 대상의 요약을 호출 지점의 인자 오염에 적용"""
+        self.callees.add(target)
+        summary = self.analyzer.summary(target)
+        param_taints: Dict[int, Taint] = {}
+        for position, taint in enumerate(arg_taints):
+            if position + offset < len(target.params):
+                param_taints[position + offset] = taint
+        for keyword, taint in keyword_taints.items():
+            if keyword in target.param_index:
+                param_taints[target.param_index[keyword]] = taint
+
+        taint = EMPTY
+        for label in summary.returns:
+            if isinstance(label, int):
+                taint = taint | param_taints.get(label, EMPTY)
+            elif isinstance(label, str):
+                taint = taint | frozenset(((label, node.lineno),))
+            else:
+                taint = taint | frozenset((label,))
+        for (param, sink_name, sink_line, kind), owner in summary.param_sinks.items():
+            for label in param_taints.get(param, EMPTY):
+                self._record_flow(
+                    label, (sink_name, sink_line if sink_line is not None else node.lineno, kind),
+                    owner, target.name, node.lineno
+                )
+        return taint
+
+
+class TaintAnalyzer:
+    """모듈 단위 오염(taint) 분석: 함수 내부는 블록 worklist 데이터 흐름, 함수 사이는 요약 전파
+
+    함수마다 요약을 메모이즈하고, 요약이 커진 함수의 호출자만 다시 분석하는 함수 단위 worklist로
+    고정점을 구한다. 각 함수는 호출하는 함수의 요약이 바뀔 때만 재분석되므로 분석 시간은 코드 크기에
+    거의 비례한다. 발견은 싱크 위치(종류, 라인)별로 묶어 SecurityVulnerability로 보고한다.
+    """
+
+    def __init__(self, spec: TaintSpec = DEFAULT_TAINT_SPEC, project=None):
+        self.spec = spec
+        # 프로젝트 정보 (analyzers.project.ProjectContext): 상대 import와 다른 모듈 함수 호출 해석
+        self.project = project
+        self.aliases: Dict[str, str] = {}
+        # import한 모듈/객체의 점 표기 이름
+        self.imports: Set[str] = set()
+        self.functions: List[FunctionInfo] = []
+        self.module_functions: Dict[str, FunctionInfo] = {}
+        self.classes: Set[str] = set()
+        self.methods: Dict[Tuple[str, str], FunctionInfo] = {}
+        # 모듈 최상위 코드와 최상위 대입의 오염 (함수 분석의 전역 이름 초기 상태)
+        self.module: Optional[FunctionInfo] = None
+        self.module_globals: State = {}
+        self._summaries: Dict[FunctionInfo, FunctionSummary] = {}
+        self._external: Dict[str, Optional[ExternalFunction]] = {}
+        # 다른 모듈 요약에서 온, 이미 위치가 붙은 이름
+        self.located_names: Set[str] = set()
+
+    # 이름 해석
+
+    def dotted_name(self, node: ast.AST) -> Optional[str]:
+        """Name/Attribute 체인의 점 표기 이름 (그 외 식이 섞이면 None)"""
+        parts = []
+        while isinstance(node, ast.Attribute):
+            parts.append(node.attr)
+            node = node.value
+        if not isinstance(node, ast.Name):
+            return None
+        parts.append(node.id)
+        return ".".join(reversed(parts))
+
+    def resolve(self, name: str) -> str:
+        """첫 요소의 import 별칭을 원래 모듈/객체 이름으로 바꿈"""
+        head, dot, rest = name.partition(".")
+        original = self.aliases.get(head)
+        if original is None:
+            return name
+        return original + dot + rest
+
+    def call_name(self, func: ast.AST) -> Optional[str]:
+        name = self.dotted_name(func)
+        return self.resolve(name) if name is not None else None
+
+    def resolve_call(self, func: ast.AST, caller: FunctionInfo) -> Optional[Tuple[FunctionInfo, int]]:
+        """호출 대상 함수와 인자->매개변수 위치 보정값 (self/cls 자리)"""
+        if isinstance(func, ast.Name):
+            scope = caller
+            while scope is not None:
+                if func.id in scope.nested:
+                    return scope.nested[func.id], 0
+                scope = scope.parent
+            target = self.module_functions.get(func.id)
+            if target is not None:
+                return target, 0
+        elif isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+            owner = func.value.id
+            if owner in ("self", "cls") and caller.class_name is not None:
+                target = self.methods.get((caller.class_name, func.attr))
+                if target is not None:
+                    return target, 0 if target.kind == "staticmethod" else 1
+            elif owner in self.classes:
+                target = self.methods.get((owner, func.attr))
+                if target is not None:
+                    return target, 1 if target.kind == "classmethod" else 0
+        if self.project is not None:
+            name = self.call_name(func)
+            target = self.external_function(name) if name is not None else None
+            if target is not None:
+                return target, 1 if target.kind == "classmethod" else 0
+        return None
+
+    def external_function(self, name: str) -> Optional[ExternalFunction]:
+        """프로젝트 심볼 테이블에서 다른 모듈 함수 조회 (이름별로 한 번만 만듦)"""
+        if name not in self._external:
+            exported = self.project.function(name)
+            target = ExternalFunction(name, exported) if exported is not None else None
+            if target is not None:
+                self._summaries[target] = target.summary
+                self.located_names.update(target.located_names())
+            self._external[name] = target
+        return self._external[name]
+
+    def summary(self, info: FunctionInfo) -> FunctionSummary:
+        summary = self._summaries.get(info)
+        if summary is None:
+            summary = self._summaries[info] = FunctionSummary()
+        return summary
+
+    # 수집
+
+    def collect(self, tree: ast.Module) -> None:
+        """함수/메서드 정의와 import 별칭 수집 (문 노드만 따라감)"""
+        module = self.module = FunctionInfo("<module>", tree.body)
+        self.functions.append(module)
+        stack: List[Tuple[ast.AST, Optional[FunctionInfo], Optional[str]]] = [(tree, None, None)]
+        while stack:
+            node, parent, class_name = stack.pop()
+            for child in _child_statements(node):
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    info = FunctionInfo(
+                        child.name if class_name is None else f"{class_name}.{child.name}",
+                        child.body, _function_params(child), parent,
+                        class_name if class_name is not None else (parent.class_name if parent else None),
+                        _function_kind(child, class_name), child.lineno
+                    )
+                    self.functions.append(info)
+                    if class_name is not None:
+                        self.methods.setdefault((class_name, child.name), info)
+                    elif parent is not None:
+                        parent.nested.setdefault(child.name, info)
+                    else:
+                        self.module_functions.setdefault(child.name, info)
+                    stack.append((child, info, None))
+                elif isinstance(child, ast.ClassDef):
+                    self.classes.add(child.name)
+                    stack.append((child, parent, child.name))
+                elif isinstance(child, ast.Import):
+                    for alias in child.names:
+                        self.imports.add(alias.name)
+                        if alias.asname:
+                            self.aliases[alias.asname] = alias.name
+                elif isinstance(child, ast.ImportFrom):
+                    base = child.module if not child.level else (
+                        self.project.absolute(child.level, child.module) if self.project is not None else None
+                    )
+                    if base:
+                        for alias in child.names:
+                            self.imports.add(f"{base}.{alias.name}")
+                            self.aliases[alias.asname or alias.name] = f"{base}.{alias.name}"
+                else:
+                    stack.append((child, parent, class_name))
+
+    # 분석
+
+    def analyze(self, tree: ast.Module) -> List[SecurityVulnerability]:
+        self.collect(tree)
+        callers: Dict[FunctionInfo, Set[FunctionInfo]] = {}
+        # 이름 -> 그 이름을 읽은 함수 (모듈 전역 오염이 커지면 다시 분석)
+        readers: Dict[str, Set[FunctionInfo]] = {}
+        findings: Dict[FunctionInfo, Dict[tuple, tuple]] = {}
+        worklist = deque(self.functions)
+        queued = set(self.functions)
+        budget = MAX_FUNCTION_VISITS_PER_FUNCTION * len(self.functions)
+
+        while worklist and budget > 0:
+            budget -= 1
+            info = worklist.popleft()
+            queued.discard(info)
+            analysis = FunctionAnalysis(self, info)
+            try:
+                analysis.run()
+            except RecursionError:
+                logger.warning(f"Taint analysis skipped {info.name}: expression nesting too deep")
+                continue
+            # 마지막 분석이 최종 요약을 반영하므로 함수별 발견은 덮어씀
+            findings[info] = analysis.findings
+            for callee in analysis.callees:
+                callers.setdefault(callee, set()).add(info)
+            dependents: Set[FunctionInfo] = set()
+            if analysis.is_module:
+                for name in self._merge_globals(analysis.globals):
+                    dependents.update(readers.get(name, ()))
+            else:
+                for name in analysis.reads:
+                    readers.setdefault(name, set()).add(info)
+            if self.summary(info).merge(frozenset(analysis.returns), analysis.param_sinks):
+                dependents.update(callers.get(info, ()))
+            for dependent in dependents:
+                if dependent not in queued:
+                    worklist.append(dependent)
+                    queued.add(dependent)
+        if worklist:
+            logger.warning("Taint analysis stopped at the function visit limit")
+
+        return self._vulnerabilities(findings)
+
+    def _merge_globals(self, assigned: State) -> List[str]:
+        """모듈 최상위 대입의 오염을 합치고 오염이 커진 이름 반환 (단조 증가)"""
+        changed = []
+        for name, taint in assigned.items():
+            previous = self.module_globals.get(name, EMPTY)
+            if not taint <= previous:
+                self.module_globals[name] = previous | taint
+                changed.append(name)
+        return changed
+
+    def exported_functions(self) -> List[FunctionInfo]:
+        """다른 모듈에서 호출할 수 있는 모듈 최상위 함수와 최상위 클래스의 메서드 (같은 이름은 처음 정의)"""
+        exported: Dict[str, FunctionInfo] = {}
+        for info in self.functions[1:]:
+            if info.parent is None:
+                exported.setdefault(info.name, info)
+        return list(exported.values())
+
+    def export_summaries(self, path: str, module: str) -> Dict[str, Dict[str, Any]]:
+        """analyze 이후 함수 요약을 다른 모듈에서 쓸 수 있는 기본 타입 dict로 내보냄 (analyzers.project)
+
+        오염원/싱크는 "이름 in 경로:라인", 싱크가 있는 함수는 점 표기 전체 이름으로 바꾼다.
+        """
+        def located(name: str, line: int) -> str:
+            return name if name in self.located_names else f"{name.lstrip('.')} in {path}:{line}"
+
+        exported = {}
+        for info in self.exported_functions():
+            summary = self.summary(info)
+            exported[info.name] = {
+                "name": f"{module}.{info.name}",
+                "params": info.params,
+                "kind": info.kind,
+                "returns": sorted(
+                    (label if isinstance(label, int) else located(*label) for label in summary.returns), key=str
+                ),
+                "sinks": sorted(
+                    [param, located(sink_name, sink_line), kind,
+                     owner if owner in self.located_names else f"{module}.{owner}"]
+                    for (param, sink_name, sink_line, kind), owner in summary.param_sinks.items()
+                )
+            }
+        return exported
+
+    def _vulnerabilities(self, findings: Dict[FunctionInfo, Dict[tuple, tuple]]) -> List[SecurityVulnerability]:
+        """싱크 위치별로 오염원을 묶어 보고"""
+        grouped: Dict[tuple, List[tuple]] = {}
+        for function_findings in findings.values():
+            for (kind, sink_name, sink_line, source_name, source_line), (via, call_line) in function_findings.items():
+                grouped.setdefault((sink_line, kind, sink_name), []).append((source_line, source_name, via, call_line))
+
+        vulnerabilities = []
+        for (sink_line, kind, sink_name), sources in sorted(grouped.items()):
+            sources.sort(key=lambda source: (source[0], source[1], source[3] or 0))
+            source_line, source_name, via, call_line = sources[0]
+            vulnerability_type, severity, cwe_id, recommendation = SINK_KINDS[kind]
+            description = f"Untrusted input from {source_name} (line {source_line}) reaches {sink_name.lstrip('.')}"
+            if via is not None:
+                description += f" through {via}() called at line {call_line}"
+            if len(sources) > 1:
+                description += f" (+{len(sources) - 1} more tainted flows)"
+            vulnerabilities.append(SecurityVulnerability(
+                type=vulnerability_type,
+                severity=severity,
+                line_number=sink_line,
+                description=description,
+                cwe_id=cwe_id,
+                recommendation=recommendation,
+                # 함수 안의 직접 흐름이 호출 경유 흐름보다 확실함
+                confidence=0.9 if any(source[2] is None for source in sources) else 0.8
+            ))
+        return vulnerabilities
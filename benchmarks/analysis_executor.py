@@ -0,0 +1,70 @@
+"""분석 실행기(inline / process)별 처리량과 분석 부하 중 이벤트 루프 지연 측정
+
+이벤트 루프 지연은 10ms 주기 프로브의 초과 지연으로 측정하며,
+/api/v1/health 같은 API 응답 지연의 하한에 해당한다.
+
+실행: python -m benchmarks.analysis_executor
+"""
+import asyncio
+import os
+import time
+from typing import Dict, List
+
+from benchmarks.corpus import generate_python_source
+from executor import AnalysisExecutor
+
+SOURCE_KB = 100
+REVIEWS = 8
+PROBE_INTERVAL = 0.01
+
+
+async def probe_event_loop(stop: asyncio.Event, lags: List[float]) -> None:
+    """주기적으로 깨어나며 예정 시각 대비 지연(ms) 기록"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append((time.perf_counter() - start - PROBE_INTERVAL) * 1000)
+
+
+async def measure(mode: str, workers: int, source: str) -> Dict[str, float]:
+    executor = AnalysisExecutor(mode=mode, workers=workers)
+    await executor.start()
+    try:
+        stop = asyncio.Event()
+        lags: List[float] = []
+        probe = asyncio.create_task(probe_event_loop(stop, lags))
+
+        start = time.perf_counter()
+        await asyncio.gather(*[executor.run(source, f"file_{i}.py", "python") for i in range(REVIEWS)])
+        elapsed = time.perf_counter() - start
+
+        stop.set()
+        await probe
+    finally:
+        executor.shutdown()
+
+    lags.sort()
+    return {
+        "reviews_per_sec": REVIEWS / elapsed,
+        "p50_lag_ms": lags[len(lags) // 2] if lags else 0.0,
+        "max_lag_ms": lags[-1] if lags else 0.0
+    }
+
+
+async def main() -> None:
+    source = generate_python_source(SOURCE_KB * 1024)
+    cores = os.cpu_count() or 1
+    configs = [("inline", 1)] + [("process", n) for n in sorted({1, 2, cores})]
+    print(f"{REVIEWS} reviews x {SOURCE_KB}KB, {cores} CPU core(s)")
+    print(f"{'executor':>12} | {'reviews/s':>9} | {'p50 lag ms':>10} | {'max lag ms':>10}")
+    for mode, workers in configs:
+        result = await measure(mode, workers, source)
+        label = mode if mode == "inline" else f"process x{workers}"
+        print(
+            f"{label:>12} | {result['reviews_per_sec']:>9.2f} | "
+            f"{result['p50_lag_ms']:>10.1f} | {result['max_lag_ms']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
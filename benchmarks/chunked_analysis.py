@@ -0,0 +1,76 @@
+"""큰 파일 한 건의 분석 시간: 파일 전체를 워커 하나에서 분석 vs 최상위 정의 경계의 청크로 나누어 동시에 분석
+
+워커 수별로 리뷰 1건의 벽시계 시간을 재고, 청크 병합 결과의 발견 항목 수가 전체 분석과 같은지 함께 확인한다.
+청크는 워커 수보다 하나 적게(최소 2개) 나누고 모듈 전체의 입력 흐름(taint) 분석은 워커 하나에서 청크와 함께
+실행되므로, 전체 분석에서 잰 입력 흐름 분석 비중으로 속도 향상 상한(executor.chunk_speedup_bound)과 실행기가
+청크 분석을 고를지(CHUNK_MIN_SPEEDUP 이상)를 함께 출력한다. 청크 분석의 시간 단축은 워커 수만큼의 CPU 코어가
+있어야 나타나므로, 코어가 워커보다 적은 행은 표시하고 속도 향상을 근거로 삼지 않는다.
+
+실행: python -m benchmarks.chunked_analysis
+"""
+import asyncio
+import os
+import time
+from typing import Any, Dict, List
+
+from benchmarks.corpus import generate_python_source
+from executor import CHUNK_MIN_SPEEDUP, AnalysisExecutor, analysis_seconds, chunk_speedup_bound
+from metrics import FINDING_LISTS
+
+SOURCE_KB = (100, 500)
+REPEAT = 3
+
+
+def finding_counts(results: Dict[str, Any]) -> List[int]:
+    return [len((results.get(section) or {}).get(key) or []) for section, key in FINDING_LISTS.items()]
+
+
+async def measure(workers: int, chunk_min_bytes: int, source: str) -> Dict[str, Any]:
+    executor = AnalysisExecutor(mode="process", workers=workers, chunk_min_bytes=chunk_min_bytes)
+    await executor.start()
+    try:
+        best = float("inf")
+        taint_share = None
+        for index in range(REPEAT):
+            # 관측한 입력 흐름 분석 비중으로 청크 분석을 건너뛰지 않도록 매번 초기화 (청크 분석 시간을 재기 위함)
+            executor.taint_share = None
+            start = time.perf_counter()
+            results, run_metrics = await executor.run_with_metrics(source, f"large_{index}.py", "python")
+            best = min(best, time.perf_counter() - start)
+            if not chunk_min_bytes and run_metrics.get("taint_seconds") is not None:
+                taint_share = run_metrics["taint_seconds"] / analysis_seconds(run_metrics)
+    finally:
+        executor.shutdown()
+    return {"seconds": best, "findings": finding_counts(results), "taint_share": taint_share,
+            "chunks": executor.chunk_count}
+
+
+async def main() -> None:
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    worker_counts = sorted({2, 4, cores} - {1})
+    print(f"best of {REPEAT}, {cores} CPU core(s) available, chunking needs an estimated speedup >= {CHUNK_MIN_SPEEDUP}x")
+    print(
+        f"{'source':>7} | {'workers':>7} | {'chunks':>6} | {'taint':>5} | {'bound':>6} | {'whole s':>8} | "
+        f"{'chunked s':>9} | {'speedup':>7} | findings"
+    )
+    for kb in SOURCE_KB:
+        source = generate_python_source(kb * 1024)
+        for workers in worker_counts:
+            whole = await measure(workers, 0, source)
+            chunked = await measure(workers, 1, source)
+            bound = chunk_speedup_bound(whole["taint_share"], chunked["chunks"], workers)
+            same = "same" if whole["findings"] == chunked["findings"] else f"{whole['findings']} vs {chunked['findings']}"
+            notes = [same]
+            if bound < CHUNK_MIN_SPEEDUP:
+                notes.append("executor analyzes whole")
+            if cores < workers:
+                notes.append(f"only {cores} core(s): speedup not meaningful")
+            print(
+                f"{kb:>5}KB | {workers:>7} | {chunked['chunks']:>6} | {whole['taint_share']:>5.2f} | {bound:>5.2f}x | "
+                f"{whole['seconds']:>8.2f} | {chunked['seconds']:>9.2f} | "
+                f"{whole['seconds'] / chunked['seconds']:>6.2f}x | {', '.join(notes)}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+from typing import List
+
+
+def generate_python_source(target_bytes: int) -> str:
+    """목표 크기에 맞춘 결정적(deterministic) 합성 Python 소스 생성"""
+    parts: List[str] = ["import os\nimport subprocess\nimport hashlib\n"]
+    size = len(parts[0])
+    index = 0
+    while size < target_bytes:
+        if index % 3 == 0:
+            block = (
+                f"def process_{index}(data, limit):\n"
+                f"    # TODO: validate limit\n"
+                f"    result = ''\n"
+                f"    for item in data:\n"
+                f"        for value in item:\n"
+                f"            result = result + 'x'\n"
+                f"    return result[:{index + 10}]\n"
+            )
+        elif index % 3 == 1:
+            block = (
+                f"def query_{index}(cursor, request):\n"
+                f"    try:\n"
+                f"        cursor.execute('SELECT * FROM t WHERE id = %s' % request)\n"
+                f"    except Exception:\n"
+                f"        pass\n"
+                f"    return hashlib.md5(request).hexdigest()\n"
+            )
+        else:
+            block = (
+                f"class Handler{index}:\n"
+                f"    \"\"\"Handler {index}\"\"\"\n\n"
+                f"    def handle(self, value):\n"
+                f"        if value == None:\n"
+                f"            return {index * 7}\n"
+                f"        return value * {index + 2}\n"
+            )
+        parts.append(block)
+        size += len(block) + 1
+        index += 1
+    return "\n".join(parts)
+
+
+def generate_nested_source(target_bytes: int, depth: int = 16) -> str:
+    """깊게 중첩된 제어 흐름(if/for/while/try)을 가진 함수들로 구성된 합성 소스"""
+    keywords = ["if value > {n}:", "for item in range({n}):", "while value < {n}:", "try:"]
+    parts: List[str] = []
+    size = 0
+    index = 0
+    while size < target_bytes:
+        lines = [f"def nested_{index}(value):"]
+        for level in range(depth):
+            indent = "    " * (level + 1)
+            keyword = keywords[level % len(keywords)].format(n=level + 2)
+            lines.append(indent + keyword)
+            if keyword == "try:":
+                lines.append(indent + "    value = value + 1")
+                lines.append(indent + "except ValueError:")
+                lines.append(indent + "    pass")
+                lines.append(indent + "else:")
+            elif keyword.startswith("while"):
+                lines.append(indent + "    value += 1")
+        lines.append("    " * (depth + 1) + "return value")
+        block = "\n".join(lines) + "\n"
+        parts.append(block)
+        size += len(block) + 1
+        index += 1
+    return "\n".join(parts)
+
+
+def generate_many_functions_source(target_bytes: int) -> str:
+    """작은 함수가 아주 많은 합성 소스 (함수 인덱스/테스트 제안 비용)"""
+    parts: List[str] = []
+    size = 0
+    index = 0
+    while size < target_bytes:
+        block = f"def fn_{index}(a, b):\n    return a + b\n"
+        parts.append(block)
+        size += len(block) + 1
+        index += 1
+    return "\n".join(parts)
+
+
+def generate_literal_heavy_source(target_bytes: int) -> str:
+    """숫자/문자열 리터럴이 많은 합성 소스 (매직 넘버 등 반복 발견 항목 비용)"""
+    parts: List[str] = []
+    size = 0
+    index = 0
+    while size < target_bytes:
+        values = ", ".join(str(index * 10 + offset + 2) for offset in range(8))
+        block = (
+            f"TABLE_{index} = [{values}]\n"
+            f"LABEL_{index} = {{'name': 'label-{index}', 'limit': {index + 100}, 'ratio': {index + 2}.5}}\n"
+        )
+        parts.append(block)
+        size += len(block) + 1
+        index += 1
+    return "\n".join(parts)
+
+
+# 회귀 벤치마크(benchmarks.pipeline)에서 쓰는 코퍼스 형태: 이름 -> 생성 함수(목표 바이트)
+CORPUS_SHAPES = {
+    "mixed": generate_python_source,
+    "deep_nesting": generate_nested_source,
+    "many_functions": generate_many_functions_source,
+    "many_literals": generate_literal_heavy_source
+}
@@ -0,0 +1,54 @@
+"""진행 이벤트 브로커의 팬아웃 비용: 유휴 구독자당 메모리와 구독자 수에 따른 발행/전달 시간
+
+실행: python -m benchmarks.event_fanout
+"""
+import asyncio
+import time
+import tracemalloc
+
+from events import ReviewEventBroker
+
+SUBSCRIBER_COUNTS = [100, 1000, 10000]
+EVENTS = 5
+
+
+async def consume(broker: ReviewEventBroker, review_id: str, received: list) -> None:
+    async for _ in broker.subscribe(review_id, lambda _: None):
+        received[0] += 1
+
+
+async def run(subscriber_count: int) -> tuple:
+    broker = ReviewEventBroker(keep_alive_seconds=3600)
+    received = [0]
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tasks = [asyncio.create_task(consume(broker, "busy-review", received)) for _ in range(subscriber_count)]
+    await asyncio.sleep(0)
+    idle_bytes = (tracemalloc.get_traced_memory()[0] - before) / subscriber_count
+    tracemalloc.stop()
+
+    # 다른 리뷰 발행은 이 구독자들에게 비용을 주지 않음
+    start = time.perf_counter()
+    for index in range(1000):
+        broker.publish(f"other-{index % 10}", "node_completed", {"node": "security"})
+    other_us = (time.perf_counter() - start) * 1e6 / 1000
+
+    start = time.perf_counter()
+    for index in range(EVENTS - 1):
+        broker.publish("busy-review", "node_completed", {"node": f"node-{index}", "result": {"items": list(range(50))}})
+    broker.close("busy-review", "review_completed", {"status": "completed"})
+    await asyncio.gather(*tasks)
+    deliver_ms = (time.perf_counter() - start) * 1000
+    return idle_bytes, other_us, deliver_ms, received[0]
+
+
+async def main() -> None:
+    print(f"{'subscribers':>11} | {'idle bytes/sub':>14} | {'unrelated publish us':>20} | {'deliver all ms':>14}")
+    for subscriber_count in SUBSCRIBER_COUNTS:
+        idle_bytes, other_us, deliver_ms, _ = await run(subscriber_count)
+        print(f"{subscriber_count:>11} | {idle_bytes:>14.0f} | {other_us:>20.2f} | {deliver_ms:>14.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+"""같은 파일을 한 함수만 바꿔 재리뷰할 때 전체 분석과 단위별 증분 분석의 비용 비교
+
+측정 전에 증분 분석 결과가 전체 분석과 같은지 확인한다 (`;`로 한 라인에 이어 쓴 문장 포함).
+
+실행: python -m benchmarks.incremental
+"""
+import time
+
+from analyzers.context import AnalysisContext
+from analyzers.incremental import UNIT_FINDING_FIELDS, UnitFindingsCache
+from benchmarks.corpus import generate_python_source
+
+SIZES_KB = [10, 50, 100]
+REPEAT = 5
+
+# 같은 라인을 공유하는 최상위 문장들 (라인 구간이 같아도 문장마다 결과가 달라야 함)
+JOINED_STATEMENTS = "import os\nx = 5; y = 7 * 42; eval(input()); os.system('rm')\nx = 5; y = 7 * 42\n"
+
+
+def edit_one_function(source: str) -> str:
+    """파일 중간의 함수 하나에 라인을 추가하여 이후 단위들의 라인 번호를 모두 이동"""
+    marker = "    result = ''\n"
+    middle = source.find(marker, len(source) // 2)
+    return source[:middle] + "    retries = 3\n" + source[middle:]
+
+
+def time_rules(source: str, unit_cache=None) -> float:
+    """파싱 이후 규칙 실행 시간(ms)만 측정"""
+    context = AnalysisContext(source, "module.py", unit_cache)
+    start = time.perf_counter()
+    context.suite
+    return (time.perf_counter() - start) * 1000
+
+
+def unit_findings(source: str, unit_cache=None) -> dict:
+    suite = AnalysisContext(source, "module.py", unit_cache).suite
+    return {field: getattr(getattr(suite, rule), field) for rule, field, _ in UNIT_FINDING_FIELDS}
+
+
+def check_parity(source: str, edited: str) -> None:
+    """첫 리뷰와 수정 후 재리뷰 모두 증분 분석 결과가 전체 분석과 같은지 확인"""
+    cache = UnitFindingsCache()
+    for version in (source, edited):
+        if unit_findings(version, cache) != unit_findings(version):
+            raise SystemExit("incremental findings differ from a full analysis")
+
+
+def main() -> None:
+    check_parity(JOINED_STATEMENTS, JOINED_STATEMENTS.replace("7 * 42", "7 * 43"))
+    print(f"{'size':>6} | {'full ms':>8} | {'incremental ms':>14} | {'speedup':>7} | {'reused/analyzed units':>21}")
+    for size_kb in SIZES_KB:
+        source = generate_python_source(size_kb * 1024)
+        edited = edit_one_function(source)
+        check_parity(source, edited)
+
+        full_ms = min(time_rules(edited) for _ in range(REPEAT))
+
+        incremental_ms = float("inf")
+        for _ in range(REPEAT):
+            cache = UnitFindingsCache()
+            time_rules(source, cache)
+            before = dict(cache.stats)
+            incremental_ms = min(incremental_ms, time_rules(edited, cache))
+        reused = cache.stats["units_reused"] - before["units_reused"]
+        analyzed = cache.stats["units_analyzed"] - before["units_analyzed"]
+
+        print(
+            f"{size_kb:>4}KB | {full_ms:>8.2f} | {incremental_ms:>14.2f} | "
+            f"{full_ms / incremental_ms:>6.2f}x | {f'{reused}/{analyzed}':>21}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""아카이브 스트리밍 수집 처리량(files/sec)과 아카이브별 RSS 증가량 측정
+
+저장소 크기(파일 수)를 늘려도 아카이브 처리 중 RSS 증가량이 거의 늘지 않아야 한다.
+실행: python -m benchmarks.ingestion
+"""
+import asyncio
+import io
+import os
+import tarfile
+import tempfile
+
+from benchmarks.corpus import generate_python_source
+from executor import AnalysisExecutor
+from ingestion import ingest_archive
+
+FILE_COUNTS = [100, 500, 2000]
+FILE_BYTES = 2 * 1024
+
+
+def build_archive(path: str, file_count: int) -> None:
+    """file_count개의 서로 다른 Python 파일을 담은 tar.gz 생성 (파일 하나씩 기록)"""
+    with tarfile.open(path, "w:gz") as archive:
+        for index in range(file_count):
+            data = (f"# module {index}\n" + generate_python_source(FILE_BYTES)).encode("utf-8")
+            info = tarfile.TarInfo(f"repo/pkg_{index // 100}/module_{index}.py")
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+
+
+async def run(executor: AnalysisExecutor, archive_path: str, findings_path: str):
+    with open(archive_path, "rb") as archive:
+        return await ingest_archive(
+            archive, "tar.gz", executor.run, findings_path,
+            extensions=[".py"], max_file_bytes=1024 * 1024, concurrency=4
+        )
+
+
+async def main() -> None:
+    executor = AnalysisExecutor(mode="inline")
+    await executor.start()
+
+    print(f"{'files':>6} | {'archive KB':>10} | {'files/sec':>9} | {'RSS delta MB':>12}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for file_count in FILE_COUNTS:
+            archive_path = os.path.join(workdir, f"repo_{file_count}.tar.gz")
+            build_archive(archive_path, file_count)
+            summary = await run(executor, archive_path, os.path.join(workdir, f"findings_{file_count}.jsonl"))
+            print(
+                f"{file_count:>6} | {os.path.getsize(archive_path) / 1024:>10.1f} | "
+                f"{summary['files_per_second']:>9.1f} | {summary['peak_rss_delta_mb']:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+"""공유 AnalysisContext 도입 전후의 리뷰당 파싱/복사 비용 비교
+
+실행: python -m benchmarks.parse_context
+"""
+import ast
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from analyzers.context import AnalysisContext
+from benchmarks.corpus import generate_python_source
+
+SIZES_KB = [1, 10, 50, 100]
+REPEAT = 5
+
+
+def legacy_review_steps(source: str) -> List[Callable[[], object]]:
+    """기존 방식: 에이전트 4개가 각각 파싱하고 3개가 라인 분할"""
+    parses = [lambda: ast.parse(source) for _ in range(4)]
+    splits = [lambda: source.split('\n') for _ in range(3)]
+    return parses + splits
+
+
+def shared_review_steps(source: str) -> List[Callable[[], object]]:
+    """공유 컨텍스트 방식: 리뷰당 한 번만 파싱/분할"""
+    return [lambda: AnalysisContext(source)]
+
+
+def measure(steps: List[Callable[[], object]]) -> Dict[str, float]:
+    """리뷰 1회 기준 평균 실행 시간(ms)과 단계별 할당 합계(KB) 측정"""
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        for step in steps:
+            step()
+    elapsed_ms = (time.perf_counter() - start) * 1000 / REPEAT
+
+    allocated = 0
+    tracemalloc.start()
+    for step in steps:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        step()
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += peak - base
+    tracemalloc.stop()
+    return {"time_ms": elapsed_ms, "allocated_kb": allocated / 1024, "steps": len(steps)}
+
+
+def main() -> None:
+    print(f"{'size':>6} | {'legacy ms':>10} | {'shared ms':>10} | {'speedup':>7} | {'legacy KB':>10} | {'shared KB':>10} | {'saved KB':>9}")
+    for size_kb in SIZES_KB:
+        source = generate_python_source(size_kb * 1024)
+        legacy = measure(legacy_review_steps(source))
+        shared = measure(shared_review_steps(source))
+        speedup = legacy["time_ms"] / shared["time_ms"] if shared["time_ms"] else 0.0
+        print(
+            f"{size_kb:>4}KB | {legacy['time_ms']:>10.2f} | {shared['time_ms']:>10.2f} | "
+            f"{speedup:>6.2f}x | {legacy['allocated_kb']:>10.0f} | {shared['allocated_kb']:>10.0f} | "
+            f"{legacy['allocated_kb'] - shared['allocated_kb']:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
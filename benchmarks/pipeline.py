@@ -0,0 +1,275 @@
+"""리뷰 파이프라인 회귀 벤치마크
+
+결정적으로 생성한 합성 코퍼스(형태 x 크기)마다 컨텍스트 생성(파싱), 단일 순회 규칙, 에이전트별 시간과
+컴파일된 워크플로우 전체 실행 시간(반복 중 최솟값), 워크플로우 실행 중 최대 메모리(tracemalloc)를 측정하고
+저장된 기준선(benchmarks/baseline.json)과 비교한다. 허용 범위를 넘은 경우는 다시 측정하여(지표별 최솟값)
+확인하고, 그래도 남는 회귀가 있으면 종료 코드 1.
+
+기준선의 시간은 절대값(ms)이 아니라 같은 실행에서 잰 보정 작업(저장소 코드를 쓰지 않는 ast 파싱/순회) 시간에
+대한 배수로 저장하고, 비교할 때 현재 머신의 보정 시간을 곱해 되돌리므로 다른 머신에서 기록한 기준선과도 비교할 수
+있다. 최대 메모리와 인터프리터 속도는 Python 버전(major.minor)에 따라 달라지므로 버전이 다르면 비교하지 않는다
+(실행 모드가 다를 때와 같음).
+
+실행:
+  python -m benchmarks.pipeline                    # 기준선과 비교
+  python -m benchmarks.pipeline --update-baseline  # 현재 측정값을 기준선으로 저장
+  python -m benchmarks.pipeline --sizes 1 10 --shapes mixed many_literals
+"""
+import argparse
+import ast
+import gc
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+from benchmarks.corpus import CORPUS_SHAPES, generate_python_source
+from models import CodeReviewState
+from workflow import ANALYSIS_AGENTS, WORKFLOW_MODES, create_initial_state, get_code_review_workflow
+from agents import consolidation_agent
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+SIZES_KB = [1, 10, 50, 100]
+REPEAT = 5
+STAGES = ["context", "rules", *ANALYSIS_AGENTS, "consolidation"]
+CALIBRATION_KB = 50
+CALIBRATION_REPEAT = 10
+
+# 리듀서로 병합되는 상태 필드 (워크플로우와 같은 방식으로 에이전트 변경분 적용)
+MERGED_FIELDS = ("completion_status", "confidence_scores")
+APPENDED_FIELDS = ("error_log", "messages")
+
+
+def apply_update(state: CodeReviewState, update: Dict[str, Any]) -> CodeReviewState:
+    changes = {}
+    for key, value in update.items():
+        if key in MERGED_FIELDS:
+            changes[key] = {**getattr(state, key), **value}
+        elif key in APPENDED_FIELDS:
+            changes[key] = getattr(state, key) + value
+        elif key in CodeReviewState.model_fields:
+            changes[key] = value
+    return state.model_copy(update=changes)
+
+
+def calibrate() -> float:
+    """머신 속도 보정 작업의 시간(ms, 반복 중 최솟값): 고정된 합성 소스의 ast 파싱과 전체 노드 순회"""
+    source = generate_python_source(CALIBRATION_KB * 1024)
+    runs = []
+    for _ in range(CALIBRATION_REPEAT):
+        gc.collect()
+        start = time.perf_counter()
+        for _node in ast.walk(ast.parse(source)):
+            pass
+        runs.append((time.perf_counter() - start) * 1000)
+    return min(runs)
+
+
+def normalize(results: Dict[str, Dict[str, float]], calibration_ms: float) -> Dict[str, Dict[str, float]]:
+    """시간 지표(*_ms)를 보정 시간 대비 배수(*_rel)로 변환 (메모리 지표는 그대로)"""
+    return {
+        case: {
+            (f"{metric[:-3]}_rel" if metric.endswith("_ms") else metric):
+                round(value / calibration_ms, 4) if metric.endswith("_ms") else value
+            for metric, value in metrics.items()
+        }
+        for case, metrics in results.items()
+    }
+
+
+def denormalize(results: Dict[str, Dict[str, float]], calibration_ms: float) -> Dict[str, Dict[str, float]]:
+    """보정 시간 대비 배수(*_rel)를 이 머신의 시간(*_ms)으로 되돌림"""
+    return {
+        case: {
+            (f"{metric[:-4]}_ms" if metric.endswith("_rel") else metric):
+                value * calibration_ms if metric.endswith("_rel") else value
+            for metric, value in metrics.items()
+        }
+        for case, metrics in results.items()
+    }
+
+
+def environment_fingerprint(mode: str, repeat: int, calibration_ms: float) -> Dict[str, Any]:
+    return {
+        "python": ".".join(platform.python_version_tuple()[:2]),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "calibration_ms": round(calibration_ms, 3),
+        "mode": mode,
+        "repeat": repeat
+    }
+
+
+def time_stages(source: str) -> Dict[str, float]:
+    """컨텍스트 생성부터 통합까지 단계별 시간(ms)을 한 번 측정"""
+    timings = {}
+    start = time.perf_counter()
+    state = create_initial_state(source, "benchmark.py", "python")
+    timings["context"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    if state.analysis_context is not None:
+        state.analysis_context.suite
+    timings["rules"] = (time.perf_counter() - start) * 1000
+
+    for name, agent in [*ANALYSIS_AGENTS.items(), ("consolidation", consolidation_agent)]:
+        start = time.perf_counter()
+        update = agent(state)
+        timings[name] = (time.perf_counter() - start) * 1000
+        state = apply_update(state, update)
+    return timings
+
+
+def measure(source: str, mode: str, repeat: int) -> Dict[str, float]:
+    """반복 측정 중 최솟값 사용 (단일 코어/공유 환경의 일시적 지연에 덜 민감)"""
+    workflow = get_code_review_workflow(mode)
+    stage_runs = []
+    for _ in range(repeat):
+        gc.collect()
+        stage_runs.append(time_stages(source))
+    result = {f"{stage}_ms": min(run[stage] for run in stage_runs) for stage in STAGES}
+
+    workflow_runs = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        workflow.invoke(create_initial_state(source, "benchmark.py", "python"))
+        workflow_runs.append((time.perf_counter() - start) * 1000)
+    result["workflow_ms"] = min(workflow_runs)
+
+    # 메모리는 추적 오버헤드가 시간 측정에 섞이지 않도록 별도 실행에서 측정
+    gc.collect()
+    tracemalloc.start()
+    workflow.invoke(create_initial_state(source, "benchmark.py", "python"))
+    result["peak_mb"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+    return {key: round(value, 3) for key, value in result.items()}
+
+
+def find_regressions(current: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+                     time_tolerance: float, memory_tolerance: float, min_delta_ms: float) -> List[str]:
+    """기준선(이 머신의 시간으로 되돌린 값) 대비 허용 비율과 최소 절대 차이를 모두 넘은 지표 목록"""
+    regressions = []
+    for case, metrics in current.items():
+        base_metrics = baseline.get(case)
+        if base_metrics is None:
+            continue
+        for metric, value in metrics.items():
+            base = base_metrics.get(metric)
+            if base is None:
+                continue
+            if metric.endswith("_ms"):
+                regressed = value > base * (1 + time_tolerance) and value - base > min_delta_ms
+            else:
+                regressed = value > base * (1 + memory_tolerance) and value - base > 1.0
+            if regressed:
+                regressions.append(f"{case} {metric}: {base:.2f} -> {value:.2f} ({(value / base - 1) * 100:+.0f}%)")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Review pipeline regression benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES_KB, help="corpus sizes in KB")
+    parser.add_argument("--shapes", nargs="+", default=list(CORPUS_SHAPES), choices=list(CORPUS_SHAPES))
+    # parallel은 에이전트 스레드 간 GIL 전환(5ms 간격) 때문에 실행마다 편차가 커서 기본은 sequential
+    parser.add_argument("--mode", default="sequential", choices=WORKFLOW_MODES)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--time-tolerance", type=float, default=0.5, help="allowed slowdown ratio (0.5 = +50%%)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.2, help="allowed peak memory growth ratio")
+    parser.add_argument("--min-delta-ms", type=float, default=5.0, help="ignore slowdowns smaller than this")
+    args = parser.parse_args()
+
+    # 에이전트 로그가 측정 출력에 섞이지 않도록
+    logging.disable(logging.INFO)
+
+    calibration_ms = calibrate()
+    environment = environment_fingerprint(args.mode, args.repeat, calibration_ms)
+    print(f"calibration: {calibration_ms:.2f}ms (ast parse + walk of {CALIBRATION_KB}KB)")
+
+    current: Dict[str, Dict[str, float]] = {}
+    columns = [f"{stage}_ms" for stage in STAGES] + ["workflow_ms", "peak_mb"]
+    headers = [column[:-3] if column.endswith("_ms") else column for column in columns]
+    widths = [max(8, len(header)) for header in headers]
+    print(f"{'case':<22} | " + " | ".join(f"{header:>{width}}" for header, width in zip(headers, widths)))
+    for shape in args.shapes:
+        for size_kb in args.sizes:
+            case = f"{shape}/{size_kb}KB"
+            source = CORPUS_SHAPES[shape](size_kb * 1024)
+            current[case] = measure(source, args.mode, args.repeat)
+            print(f"{case:<22} | " + " | ".join(
+                f"{current[case][column]:>{width}.2f}" for column, width in zip(columns, widths)
+            ))
+    print("(times are best-of-repeat in ms, peak_mb is traced peak during one workflow run)")
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        previous = baseline.get("environment", {})
+        if ("calibration_ms" not in previous
+                or any(previous.get(key) != environment[key] for key in ("python", "implementation", "mode"))):
+            # 절대 시간으로 기록했거나 비교할 수 없는 환경에서 기록한 기존 경우는 버림
+            baseline = {}
+        baseline.setdefault("results", {}).update(normalize(current, calibration_ms))
+        baseline["environment"] = environment
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    baseline_environment = baseline.get("environment", {})
+    baseline_mode = baseline_environment.get("mode")
+    if baseline_mode != args.mode:
+        print(f"Baseline was recorded in {baseline_mode} mode; rerun with --mode {baseline_mode} to compare")
+        return 0
+    mismatched = [
+        f"{key} {baseline_environment.get(key)} (here {environment[key]})"
+        for key in ("python", "implementation") if baseline_environment.get(key) != environment[key]
+    ]
+    if mismatched or "calibration_ms" not in baseline_environment:
+        print(f"Baseline was recorded with {', '.join(mismatched) or 'absolute timings'}; "
+              "skipping comparison (rerun with --update-baseline on this interpreter)")
+        return 0
+    print(
+        f"Comparing against a baseline from {baseline_environment.get('machine')} "
+        f"(calibration {baseline_environment['calibration_ms']:.2f}ms), scaled to this machine"
+    )
+    thresholds = (args.time_tolerance, args.memory_tolerance, args.min_delta_ms)
+    expected = denormalize(baseline.get("results", {}), calibration_ms)
+    regressions = find_regressions(current, expected, *thresholds)
+    suspect_cases = sorted({regression.split(" ", 1)[0] for regression in regressions})
+    if suspect_cases:
+        # 일시적인 지연(다른 프로세스, CPU 스케줄링)과 구분하기 위해 해당 경우만 다시 측정
+        print(f"Re-measuring {len(suspect_cases)} case(s) to confirm: {', '.join(suspect_cases)}")
+        for case in suspect_cases:
+            shape, size = case.split("/")
+            retry = measure(CORPUS_SHAPES[shape](int(size[:-2]) * 1024), args.mode, args.repeat)
+            current[case] = {metric: min(value, retry[metric]) for metric, value in current[case].items()}
+        regressions = find_regressions(current, expected, *thresholds)
+
+    if regressions:
+        print(f"{len(regressions)} regression(s) against baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print("No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
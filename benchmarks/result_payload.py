@@ -0,0 +1,59 @@
+"""큰 리뷰 결과의 응답 페이로드 크기와 직렬화 시간: 기본 경로(Pydantic 모델 + JSONResponse) vs
+PayloadEncoder(orjson / MessagePack, gzip / zstd), fields 선택 여부
+
+실행: python -m benchmarks.result_payload
+"""
+import time
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from benchmarks.corpus import generate_python_source
+from executor import run_review
+from models import ReviewResult
+from serialization import PayloadEncoder, encode_json, encode_msgpack, parse_fields, project_results
+
+SOURCE_KB = [50, 200]
+REPEAT = 10
+
+
+def time_ms(function) -> tuple:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        body = function()
+    return (time.perf_counter() - start) * 1000 / REPEAT, body
+
+
+def main() -> None:
+    encoder = PayloadEncoder(min_compress_bytes=0)
+    print(f"{'source':>6} | {'path':<38} | {'bytes':>9} | {'ms':>7}")
+    for size_kb in SOURCE_KB:
+        results = run_review(generate_python_source(size_kb * 1024), "module.py", "python", "sequential")
+        now = datetime.utcnow()
+        payload = {"review_id": "r", "status": "completed", "results": results,
+                   "created_at": now, "completed_at": now, "agent_status": None}
+
+        def default_path():
+            model = ReviewResult(**payload)
+            return JSONResponse(content=jsonable_encoder(model)).body
+
+        projected = {**payload, "results": project_results(results, parse_fields("security.vulnerabilities"))}
+        cases = [
+            ("pydantic + JSONResponse (before)", default_path),
+            ("orjson", lambda: encode_json(payload)),
+            ("orjson + gzip", lambda: encoder.compress(encode_json(payload), "gzip")[0]),
+            ("orjson + zstd", lambda: encoder.compress(encode_json(payload), "zstd")[0]),
+            ("msgpack", lambda: encode_msgpack(payload)),
+            ("msgpack + zstd", lambda: encoder.compress(encode_msgpack(payload), "zstd")[0]),
+            ("fields=security.vulnerabilities", lambda: encode_json(projected)),
+            ("fields=security.vulnerabilities + zstd",
+             lambda: encoder.compress(encode_json(projected), "zstd")[0]),
+        ]
+        for name, function in cases:
+            elapsed, body = time_ms(function)
+            print(f"{size_kb:>4}KB | {name:<38} | {len(body):>9} | {elapsed:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""저장된 리뷰 수에 따른 목록 조회 비용: 전체 복사 후 필터(list_reviews) vs 인덱스 페이지 조회
+
+실행: python -m benchmarks.review_listing
+"""
+import time
+
+from storage import ShardedInMemoryStorage
+
+STORE_SIZES = [1000, 10000, 100000]
+PAGE_SIZE = 20
+USERS = 50
+REPEAT = 20
+
+
+def build(size: int) -> ShardedInMemoryStorage:
+    storage = ShardedInMemoryStorage()
+    for index in range(size):
+        review_id = f"review-{index}"
+        storage.create_review(review_id, f"user-{index % USERS}")
+        if index % 2 == 0:
+            storage.update_review(review_id, status="completed")
+    return storage
+
+
+def time_ms(function) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        function()
+    return (time.perf_counter() - start) * 1000 / REPEAT
+
+
+def main() -> None:
+    print(f"{'reviews':>8} | {'scan+filter ms':>14} | {'indexed page ms':>15}")
+    for size in STORE_SIZES:
+        storage = build(size)
+
+        def scan():
+            reviews = [r for r in storage.list_reviews("user-7") if r.status == "completed"]
+            return sorted(reviews, key=lambda r: r.created_at, reverse=True)[:PAGE_SIZE]
+
+        def indexed():
+            return storage.list_reviews_page(user_id="user-7", status="completed", limit=PAGE_SIZE)
+
+        print(f"{size:>8} | {time_ms(scan):>14.3f} | {time_ms(indexed):>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""단일 순회 RuleEngine의 규칙 수 대비 순회 비용 측정
+
+실행: python -m benchmarks.rule_engine
+"""
+import ast
+import time
+
+from analyzers.engine import RuleEngine
+from analyzers.suite import AnalysisSuite
+from benchmarks.corpus import generate_python_source
+
+SOURCE_KB = 100
+RULE_COUNTS = [0, 10, 100, 1000]
+REPEAT = 3
+
+# 합성 코퍼스에 등장하지 않는 노드 타입들 (디스패치만 늘어나고 호출은 되지 않는 규칙)
+UNUSED_NODE_TYPES = [ast.Lambda, ast.Yield, ast.Await, ast.Global, ast.Nonlocal, ast.Starred, ast.Set]
+
+
+def time_engine(tree: ast.AST, extra_rules: int) -> float:
+    """기본 규칙 + extra_rules개의 추가 규칙을 등록한 뒤 순회 시간(ms) 측정"""
+    best = float("inf")
+    for _ in range(REPEAT):
+        engine = RuleEngine().add_rules(*AnalysisSuite().rule_sets())
+        for i in range(extra_rules):
+            engine.register(UNUSED_NODE_TYPES[i % len(UNUSED_NODE_TYPES)], lambda node: None)
+        start = time.perf_counter()
+        engine.run(tree)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def main() -> None:
+    tree = ast.parse(generate_python_source(SOURCE_KB * 1024))
+    node_count = sum(1 for _ in ast.walk(tree))
+    print(f"{SOURCE_KB}KB source, {node_count} nodes")
+    print(f"{'extra rules':>11} | {'time ms':>8} | {'ns/node':>8}")
+    for count in RULE_COUNTS:
+        elapsed_ms = time_engine(tree, count)
+        print(f"{count:>11} | {elapsed_ms:>8.2f} | {elapsed_ms * 1e6 / node_count:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""인메모리 저장소와 SQLite(WAL) 저장소의 쓰기/읽기 처리량 및 결과 저장 크기 비교
+
+실행: python -m benchmarks.storage
+"""
+import json
+import os
+import tempfile
+import time
+from uuid import uuid4
+
+from benchmarks.corpus import generate_python_source
+from executor import run_review
+from storage import InMemoryStorage, SQLiteStorage, compress_blob
+
+REVIEW_COUNT = 2000
+READ_ROUNDS = 3
+
+
+def fill(storage, results) -> float:
+    """리뷰 생성 + 진행 상황 갱신 2회 + 완료 기록 (초당 쓰기 호출 수 반환)"""
+    start = time.perf_counter()
+    review_ids = []
+    for _ in range(REVIEW_COUNT):
+        review_id = str(uuid4())
+        storage.create_review(review_id)
+        storage.update_review(review_id, results={"progress": {"completed": 0}})
+        storage.update_review(review_id, results={"progress": {"completed": 1}})
+        storage.update_review(review_id, status="completed", results=results)
+        review_ids.append(review_id)
+    if hasattr(storage, "flush"):
+        storage.flush()
+    elapsed = time.perf_counter() - start
+    return REVIEW_COUNT * 4 / elapsed, review_ids
+
+
+def read_all(storage, review_ids) -> float:
+    """모든 리뷰를 READ_ROUNDS회 조회 (초당 조회 수 반환)"""
+    start = time.perf_counter()
+    for _ in range(READ_ROUNDS):
+        for review_id in review_ids:
+            storage.get_review(review_id)
+    return READ_ROUNDS * len(review_ids) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    results = run_review(generate_python_source(20 * 1024), "module.py", "python", "sequential")
+    raw_size = len(json.dumps(results, default=str).encode("utf-8"))
+
+    print(f"{'backend':>8} | {'writes/s':>9} | {'reads/s':>9}")
+    memory = InMemoryStorage()
+    write_rate, review_ids = fill(memory, results)
+    print(f"{'memory':>8} | {write_rate:>9.0f} | {read_all(memory, review_ids):>9.0f}")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "reviews.db")
+        sqlite = SQLiteStorage(f"sqlite:///{path}")
+        write_rate, review_ids = fill(sqlite, results)
+        print(f"{'sqlite':>8} | {write_rate:>9.0f} | {read_all(sqlite, review_ids):>9.0f}")
+        stats = sqlite.stats()
+        sqlite.close()
+
+        print(f"\nresult blob: {raw_size} bytes JSON -> {len(compress_blob(results))} bytes compressed")
+        print(f"db size: {os.path.getsize(path) / 1024:.0f} KB for {REVIEW_COUNT} reviews, "
+              f"{stats['batches']} write batches, {stats['updates_coalesced']} updates coalesced")
+
+
+if __name__ == "__main__":
+    main()
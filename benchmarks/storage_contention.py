@@ -0,0 +1,65 @@
+"""여러 스레드가 동시에 진행 상황 갱신/조회할 때 단일 잠금 저장소와 잠금 분할 저장소 비교
+
+실행: python -m benchmarks.storage_contention
+"""
+import threading
+import time
+from uuid import uuid4
+
+from benchmarks.corpus import generate_python_source
+from executor import run_review
+from storage import InMemoryStorage, ShardedInMemoryStorage
+
+THREAD_COUNTS = [1, 4, 16]
+REVIEWS_PER_THREAD = 50
+READS_PER_UPDATE = 4
+
+
+def worker(storage, review_ids, all_ids, results, barrier) -> None:
+    """리뷰마다 진행 상황 갱신 5회 + 완료 기록, 갱신마다 다른 리뷰들을 조회 (폴링 흉내)"""
+    barrier.wait()
+    for index, review_id in enumerate(review_ids):
+        for step in range(5):
+            storage.update_review(review_id, results={"progress": {"completed": step}})
+            for offset in range(READS_PER_UPDATE):
+                storage.get_review(all_ids[(index * 7 + offset) % len(all_ids)])
+        storage.update_review(review_id, status="completed", results=results)
+
+
+def run(storage_class, thread_count: int, results) -> float:
+    """초당 저장소 호출 수 반환"""
+    storage = storage_class()
+    id_groups = [[str(uuid4()) for _ in range(REVIEWS_PER_THREAD)] for _ in range(thread_count)]
+    all_ids = [review_id for group in id_groups for review_id in group]
+    for review_id in all_ids:
+        storage.create_review(review_id)
+
+    barrier = threading.Barrier(thread_count + 1)
+    threads = [
+        threading.Thread(target=worker, args=(storage, group, all_ids, results, barrier))
+        for group in id_groups
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    operations = len(all_ids) * (6 + 5 * READS_PER_UPDATE)
+    return operations / elapsed
+
+
+def main() -> None:
+    results = run_review(generate_python_source(20 * 1024), "module.py", "python", "sequential")
+
+    print(f"{'threads':>7} | {'global lock ops/s':>17} | {'sharded ops/s':>13} | {'speedup':>7}")
+    for thread_count in THREAD_COUNTS:
+        baseline = run(InMemoryStorage, thread_count, results)
+        sharded = run(ShardedInMemoryStorage, thread_count, results)
+        print(f"{thread_count:>7} | {baseline:>17.0f} | {sharded:>13.0f} | {sharded / baseline:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""리뷰마다 워크플로우를 컴파일할 때와 시작 시 한 번 컴파일한 그래프를 재사용할 때의 요청당 오버헤드 비교
+
+실행: python -m benchmarks.workflow_compile
+"""
+import time
+
+from workflow import WORKFLOW_MODES, build_code_review_workflow, get_code_review_workflow
+
+REPEAT = 50
+
+
+def main() -> None:
+    print(f"{'mode':>10} | {'compile per review ms':>21} | {'cached lookup ms':>16} | {'saved per review ms':>19}")
+    for mode in WORKFLOW_MODES:
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            build_code_review_workflow(mode)
+        compile_ms = (time.perf_counter() - start) * 1000 / REPEAT
+
+        get_code_review_workflow(mode)
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            get_code_review_workflow(mode)
+        cached_ms = (time.perf_counter() - start) * 1000 / REPEAT
+
+        print(f"{mode:>10} | {compile_ms:>21.3f} | {cached_ms:>16.4f} | {compile_ms - cached_ms:>19.3f}")
+
+
+if __name__ == "__main__":
+    main()
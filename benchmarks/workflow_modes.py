@@ -0,0 +1,35 @@
+"""순차(sequential) / 병렬 fan-out(parallel) 워크플로우의 리뷰당 지연시간 비교
+
+실행: python -m benchmarks.workflow_modes
+"""
+import asyncio
+import time
+
+from benchmarks.corpus import generate_python_source
+from workflow import WORKFLOW_MODES, build_code_review_workflow, create_initial_state
+
+SIZES_KB = [10, 50, 100]
+REPEAT = 3
+
+
+async def time_workflow(workflow, source: str) -> float:
+    """컨텍스트 생성부터 통합까지 리뷰 1회의 최소 지연시간(ms)"""
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        await workflow.ainvoke(create_initial_state(source, "benchmark.py", "python"))
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+async def main() -> None:
+    workflows = {mode: build_code_review_workflow(mode) for mode in WORKFLOW_MODES}
+    print(f"{'size':>6} | " + " | ".join(f"{mode + ' ms':>14}" for mode in WORKFLOW_MODES))
+    for size_kb in SIZES_KB:
+        source = generate_python_source(size_kb * 1024)
+        timings = [await time_workflow(workflows[mode], source) for mode in WORKFLOW_MODES]
+        print(f"{size_kb:>4}KB | " + " | ".join(f"{t:>14.1f}" for t in timings))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,136 @@
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_TYPES = ("memory", "redis", "none")
+
+
+def review_cache_key(code: str, language: str, agents: Iterable[str], analyzer_version: str,
+                     options: Optional[Dict[str, Any]] = None) -> str:
+    """(코드, 언어, 활성 에이전트, 분석기 버전, 결과에 영향을 주는 옵션)의 해시로 만든 콘텐츠 주소 캐시 키"""
+    digest = hashlib.sha256()
+    header = json.dumps(
+        [analyzer_version, language, sorted(agents), options or {}], separators=(",", ":"), sort_keys=True
+    )
+    digest.update(header.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(code.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class InMemoryResultCache:
+    """프로세스 내 리뷰 결과 캐시 (LRU + TTL)
+
+    Redis 백엔드처럼 JSON 문자열로 저장하고 조회마다 새 dict를 돌려주므로, 저장된 리뷰나
+    응답 가공(상세 제거, 스팬 첨부 등)에서 결과를 바꿔도 캐시 항목은 바뀌지 않는다.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: int = 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 결과 조회 (만료 항목은 제거)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+
+        stored_at, payload = entry
+        if self.ttl_seconds and time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            self._stats["expirations"] += 1
+            self._stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return json.loads(payload)
+
+    async def set(self, key: str, results: Dict[str, Any]) -> None:
+        """결과 저장 후 최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거"""
+        self._entries[key] = (time.monotonic(), json.dumps(results, default=str))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "memory", "entries": len(self._entries), "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds, **self._stats}
+
+
+class RedisResultCache:
+    """Redis 프로토콜 리뷰 결과 캐시
+
+    값은 TTL이 걸린 JSON 문자열로 저장하고, 최근 사용 시각을 sorted set에 기록하여
+    최대 항목 수를 넘으면 가장 오래 사용되지 않은 키부터 제거한다.
+    """
+
+    KEY_PREFIX = "review-cache:"
+    LRU_KEY = "review-cache:lru"
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: int = 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    @staticmethod
+    def _client():
+        import database
+        return database.redis_client
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        client = self._client()
+        if client is None:
+            self._stats["misses"] += 1
+            return None
+
+        payload = await client.get(self.KEY_PREFIX + key)
+        if payload is None:
+            # TTL로 만료된 키는 LRU 목록에서도 정리
+            if await client.zrem(self.LRU_KEY, key):
+                self._stats["expirations"] += 1
+            self._stats["misses"] += 1
+            return None
+
+        await client.zadd(self.LRU_KEY, {key: time.time()})
+        self._stats["hits"] += 1
+        return json.loads(payload)
+
+    async def set(self, key: str, results: Dict[str, Any]) -> None:
+        client = self._client()
+        if client is None:
+            return
+
+        await client.set(self.KEY_PREFIX + key, json.dumps(results, default=str), ex=self.ttl_seconds or None)
+        await client.zadd(self.LRU_KEY, {key: time.time()})
+
+        overflow = await client.zcard(self.LRU_KEY) - self.max_entries
+        if overflow > 0:
+            evicted = await client.zpopmin(self.LRU_KEY, overflow)
+            if evicted:
+                await client.delete(*[self.KEY_PREFIX + evicted_key for evicted_key, _ in evicted])
+                self._stats["evictions"] += len(evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "redis", "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds, **self._stats}
+
+
+def create_result_cache(cache_type: str, max_entries: int, ttl_seconds: int):
+    """설정된 백엔드의 결과 캐시 생성 (none이면 None)"""
+    if cache_type not in CACHE_TYPES:
+        raise ValueError(f"Unknown cache type: {cache_type} (expected one of {CACHE_TYPES})")
+    if cache_type == "memory":
+        return InMemoryResultCache(max_entries, ttl_seconds)
+    if cache_type == "redis":
+        return RedisResultCache(max_entries, ttl_seconds)
+    return None
@@ -19,8 +19,77 @@ class Settings(BaseSettings):
     # Logging Configuration
     log_level: str = Field("INFO", env="LOG_LEVEL")
     
-    # Storage Configuration
-    storage_type: str = Field("memory", env="STORAGE_TYPE")
+    # Storage Configuration (sharded: 잠금 분할 인메모리, memory: 단일 잠금 인메모리, sqlite)
+    storage_type: str = Field("sharded", env="STORAGE_TYPE")
+    storage_shards: int = Field(16, env="STORAGE_SHARDS")
+    
+    # Retention Configuration (인메모리 저장소의 완료 리뷰 보존 한도, 0이면 제한 없음)
+    retention_max_entries: int = Field(10000, env="RETENTION_MAX_ENTRIES")
+    retention_max_bytes: int = Field(512 * 1024 * 1024, env="RETENTION_MAX_BYTES")
+    retention_ttl_seconds: int = Field(24 * 3600, env="RETENTION_TTL_SECONDS")  # completed_at 기준
+    retention_spill_url: str = Field("", env="RETENTION_SPILL_URL")  # 예: sqlite:///./evicted_reviews.db
+    database_url: str = Field("sqlite:///./code_reviews.db", env="DATABASE_URL")
+    storage_flush_interval_ms: int = Field(50, env="STORAGE_FLUSH_INTERVAL_MS")
+    storage_batch_size: int = Field(256, env="STORAGE_BATCH_SIZE")
+    
+    # Result Cache Configuration (memory / redis / none)
+    cache_type: str = Field("memory", env="CACHE_TYPE")
+    cache_max_entries: int = Field(1024, env="CACHE_MAX_ENTRIES")
+    cache_ttl_seconds: int = Field(3600, env="CACHE_TTL_SECONDS")
+    redis_url: str = Field("redis://localhost:6379", env="REDIS_URL")
+    
+    # Workflow Configuration (parallel: 분석 에이전트 동시 실행, sequential: 순차 실행)
+    workflow_mode: str = Field("parallel", env="WORKFLOW_MODE")
+    
+    # Analysis Executor (process: 프로세스 풀, inline: 이벤트 루프 프로세스에서 실행)
+    analysis_executor: str = Field("process", env="ANALYSIS_EXECUTOR")
+    analysis_workers: int = Field(0, env="ANALYSIS_WORKERS")  # 0이면 CPU 코어 수
+    # 이 크기 이상인 파일은 최상위 정의 경계에서 나누어 동시에 분석 (process 실행기, 0이면 사용 안 함.
+    # 입력 흐름 분석 비중이 커서 기대 속도 향상이 작으면 나누지 않음, executor.chunk_speedup_bound)
+    chunk_analysis_min_bytes: int = Field(64 * 1024, env="CHUNK_ANALYSIS_MIN_BYTES")
+    
+    # Review Job Queue Configuration (대기열이 가득 차면 429 응답)
+    queue_max_depth: int = Field(100, env="QUEUE_MAX_DEPTH")
+    queue_workers: int = Field(4, env="QUEUE_WORKERS")
+    queue_drain_timeout_seconds: float = Field(30.0, env="QUEUE_DRAIN_TIMEOUT_SECONDS")
+    
+    # Progress Streaming Configuration (SSE)
+    events_keep_alive_seconds: float = Field(15.0, env="EVENTS_KEEP_ALIVE_SECONDS")
+    events_retention_seconds: float = Field(60.0, env="EVENTS_RETENTION_SECONDS")  # 완료 후 이력 보관 시간
+    
+    # Batch Review Configuration
+    batch_max_files: int = Field(200, env="BATCH_MAX_FILES")
+    batch_max_concurrency: int = Field(4, env="BATCH_MAX_CONCURRENCY")
+    
+    # Archive Ingestion Configuration (확장자는 쉼표로 구분)
+    ingest_extensions: str = Field(".py", env="INGEST_EXTENSIONS")
+    ingest_max_file_bytes: int = Field(1024 * 1024, env="INGEST_MAX_FILE_BYTES")
+    ingest_max_archive_bytes: int = Field(512 * 1024 * 1024, env="INGEST_MAX_ARCHIVE_BYTES")
+    ingest_spool_bytes: int = Field(8 * 1024 * 1024, env="INGEST_SPOOL_BYTES")  # 넘으면 디스크로 스풀
+    ingest_concurrency: int = Field(4, env="INGEST_CONCURRENCY")
+    ingest_output_dir: str = Field("review_findings", env="INGEST_OUTPUT_DIR")
+    
+    # Cross-file Analysis (배치/아카이브 리뷰에서 모듈 간 호출을 따라가는 프로젝트 심볼 테이블)
+    project_analysis: bool = Field(True, env="PROJECT_ANALYSIS")
+    project_index_max_bytes: int = Field(64 * 1024 * 1024, env="PROJECT_INDEX_MAX_BYTES")  # 디스크에 풀어 두는 아카이브 소스 합계 상한 (넘으면 파일 단위 분석만)
+    
+    # Finding Aggregation (규칙별 결과 목록 상한, 0이면 무제한. 전체 개수/라인 범위는 finding_groups로 요약)
+    findings_rule_cap: int = Field(50, env="FINDINGS_RULE_CAP")
+    
+    # Result Payload Configuration (Accept-Encoding으로 zstd/gzip 협상, 작은 응답은 압축하지 않음)
+    response_compress_min_bytes: int = Field(1024, env="RESPONSE_COMPRESS_MIN_BYTES")
+    response_gzip_level: int = Field(6, env="RESPONSE_GZIP_LEVEL")
+    response_zstd_level: int = Field(3, env="RESPONSE_ZSTD_LEVEL")
+    
+    # Review Profiling (profile 요청과 프로파일 조회에 같은 값의 X-Admin-Token 헤더 필요, 비어 있으면 프로파일링 비활성)
+    profiling_admin_token: str = Field("", env="PROFILING_ADMIN_TOKEN")
+    
+    # Review Tracing (설정하면 리뷰별 스팬 타임라인을 OTLP/HTTP JSON 수집기로도 전송, 예: http://localhost:4318/v1/traces)
+    otlp_traces_endpoint: str = Field("", env="OTLP_TRACES_ENDPOINT")
+    otlp_service_name: str = Field("code-review", env="OTLP_SERVICE_NAME")
+    
+    # 같은 파일명 재리뷰 시 바뀐 최상위 함수/클래스만 재분석
+    incremental_analysis: bool = Field(True, env="INCREMENTAL_ANALYSIS")
     
     class Config:
         env_file = ".env"
@@ -1,23 +1,59 @@
-import aioredis
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from models import Base
+from config import settings
 import logging
 
+def create_sqlite_engine(url: str):
+    """WAL 모드 SQLite 엔진 생성
+
+    WAL 모드에서는 쓰기 트랜잭션 중에도 읽기가 막히지 않으며,
+    synchronous=NORMAL로 커밋마다의 fsync 비용을 줄인다.
+    """
+    sqlite_engine = create_engine(url, connect_args={"check_same_thread": False})
+
+    @event.listens_for(sqlite_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    return sqlite_engine
+
+def migrate_schema(sqlite_engine) -> None:
+    """기존 데이터베이스를 현재 리뷰 테이블 스키마에 맞춤 (시작 시 create_all 다음에 호출, 여러 번 실행해도 안전)
+
+    create_all은 없는 테이블만 만들고 이미 있는 테이블은 바꾸지 않으므로, 이전 버전이 만든 code_reviews에
+    나중에 모델에 추가된 nullable 컬럼(예: agent_status)과 인덱스(예: 목록 조회용 복합 인덱스)를 없을 때만 만든다.
+    """
+    from models import CodeReviewRecord
+    table = CodeReviewRecord.__table__
+    with sqlite_engine.begin() as connection:
+        existing = {row[1] for row in connection.exec_driver_sql(f"PRAGMA table_info({table.name})")}
+        for column in table.columns:
+            if column.name not in existing:
+                column_type = column.type.compile(dialect=connection.dialect)
+                connection.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}")
+                logging.info(f"Added column {table.name}.{column.name}")
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
 # Database configuration
-DATABASE_URL = "sqlite:///./code_reviews.db"
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+DATABASE_URL = settings.database_url
+engine = create_sqlite_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Redis configuration
-REDIS_URL = "redis://localhost:6379"
+REDIS_URL = settings.redis_url
 redis_client = None
 
-async def init_redis():
+async def init_redis(url: str = REDIS_URL):
     """Initialize Redis connection"""
     global redis_client
     try:
-        redis_client = await aioredis.from_url(REDIS_URL, decode_responses=True)
+        # redis는 CACHE_TYPE=redis일 때만 필요한 선택 의존성
+        from redis import asyncio as aioredis
+        redis_client = await aioredis.from_url(url, decode_responses=True)
         await redis_client.ping()
         logging.info("Redis connection established")
     except Exception as e:
@@ -34,4 +70,5 @@ def get_db():
 
 def create_tables():
     """Create database tables"""
+    from models import Base
     Base.metadata.create_all(bind=engine)
\ No newline at end of file
@@ -0,0 +1,153 @@
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 구독 시점에 진행 채널이 없을 때 저장소 상태로 만드는 스냅샷 이벤트: 리뷰 ID -> (이벤트 타입, 데이터) 또는 None
+SnapshotFn = Callable[[str], Optional[tuple]]
+
+
+def format_sse(event_id: int, event_type: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 메시지 한 건"""
+    payload = json.dumps(data, separators=(",", ":"), default=str)
+    return f"id: {event_id}\nevent: {event_type}\ndata: {payload}\n\n"
+
+
+class ReviewChannel:
+    """리뷰 하나의 진행 이벤트 로그
+
+    이벤트는 발행 시 한 번만 SSE 문자열로 직렬화하여 추가 전용 목록에 쌓고, 구독자는 각자
+    읽은 위치만 기억한다. 새 이벤트는 채널마다 하나인 asyncio.Event로 알리므로 구독자별 큐나
+    복사본이 없고, 대기 중인 구독자는 멈춰 있는 코루틴 하나 외에는 비용이 들지 않는다.
+    """
+
+    __slots__ = ("events", "closed", "subscribers", "_changed")
+
+    def __init__(self):
+        self.events: List[str] = []
+        self.closed = False
+        self.subscribers = 0
+        self._changed = asyncio.Event()
+
+    def append(self, event_type: str, data: Dict[str, Any]) -> None:
+        self.events.append(format_sse(len(self.events) + 1, event_type, data))
+        self.notify()
+
+    def close(self) -> None:
+        self.closed = True
+        self.notify()
+
+    def notify(self) -> None:
+        # 현재 대기 중인 구독자만 깨우고, 다음 대기는 새 Event로
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def wait(self, seen: int) -> None:
+        """seen 이후 이벤트가 생기거나, 채널이 닫히거나, keep-alive 신호가 올 때까지 대기"""
+        if len(self.events) > seen or self.closed:
+            return
+        await self._changed.wait()
+
+
+class ReviewEventBroker:
+    """리뷰 진행 이벤트 발행/구독 (이벤트 루프 안에서만 사용)
+
+    완료된 채널은 retention_seconds 동안 남겨 두어 늦게 접속한 구독자도 전체 이력을 받을 수 있다.
+    keep-alive는 구독자별 타이머 대신 브로커의 heartbeat 태스크 하나가 구독 중인 채널을 깨워서 보낸다.
+    """
+
+    def __init__(self, keep_alive_seconds: float = 15.0, retention_seconds: float = 60.0):
+        self.keep_alive_seconds = keep_alive_seconds
+        self.retention_seconds = retention_seconds
+        self._channels: Dict[str, ReviewChannel] = {}
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._stats = {"events_published": 0, "channels_closed": 0}
+
+    def _channel(self, review_id: str) -> ReviewChannel:
+        channel = self._channels.get(review_id)
+        if channel is None:
+            channel = self._channels[review_id] = ReviewChannel()
+        return channel
+
+    def publish(self, review_id: str, event_type: str, data: Dict[str, Any]) -> None:
+        """진행 이벤트 발행 (구독자 수와 무관하게 직렬화 1회)"""
+        channel = self._channel(review_id)
+        if channel.closed:
+            return
+        channel.append(event_type, data)
+        self._stats["events_published"] += 1
+
+    def close(self, review_id: str, event_type: str, data: Dict[str, Any]) -> None:
+        """마지막 이벤트를 발행하고 채널을 닫음 (구독 스트림도 종료)"""
+        channel = self._channel(review_id)
+        if channel.closed:
+            return
+        channel.append(event_type, data)
+        channel.close()
+        self._stats["events_published"] += 1
+        self._stats["channels_closed"] += 1
+        asyncio.get_running_loop().call_later(self.retention_seconds, self._discard, review_id, channel)
+
+    def _discard(self, review_id: str, channel: ReviewChannel) -> None:
+        if self._channels.get(review_id) is channel:
+            del self._channels[review_id]
+
+    async def _keep_alive(self) -> None:
+        while True:
+            await asyncio.sleep(self.keep_alive_seconds)
+            for channel in list(self._channels.values()):
+                if channel.subscribers and not channel.closed:
+                    channel.notify()
+
+    async def shutdown(self) -> None:
+        """열린 채널을 모두 닫아 구독 스트림을 끝내고 heartbeat 중지"""
+        for channel in self._channels.values():
+            if not channel.closed:
+                channel.close()
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            self._heartbeat = None
+
+    async def subscribe(self, review_id: str, snapshot: SnapshotFn, last_event_id: int = 0) -> AsyncIterator[str]:
+        """SSE 메시지 스트림 (채널이 닫히면 종료, last_event_id 이후부터 재전송)
+
+        진행 채널이 없고 리뷰가 이미 끝났으면(snapshot이 이벤트를 돌려주면) 최종 상태 한 건만 보낸다.
+        """
+        channel = self._channels.get(review_id)
+        if channel is None:
+            final_event = snapshot(review_id)
+            if final_event is not None:
+                event_type, data = final_event
+                yield format_sse(last_event_id + 1, event_type, data)
+                return
+            channel = self._channel(review_id)
+
+        if self._heartbeat is None or self._heartbeat.done():
+            self._heartbeat = asyncio.create_task(self._keep_alive())
+
+        seen = max(last_event_id, 0)
+        channel.subscribers += 1
+        try:
+            while True:
+                await channel.wait(seen)
+                if len(channel.events) > seen:
+                    pending = channel.events[seen:]
+                    seen += len(pending)
+                    yield "".join(pending)
+                elif channel.closed:
+                    return
+                else:
+                    # 프록시가 유휴 연결을 끊지 않도록 주석 라인 전송
+                    yield ": keep-alive\n\n"
+        finally:
+            channel.subscribers -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "channels": len(self._channels),
+            "open_channels": sum(1 for channel in self._channels.values() if not channel.closed),
+            "subscribers": sum(channel.subscribers for channel in self._channels.values()),
+            **self._stats
+        }
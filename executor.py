@@ -0,0 +1,502 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from agents import merge_chunk_results
+from analyzers.chunking import SourceChunk, chunk_file_path, split_module
+from analyzers.context import parse_source
+from analyzers.project import ProjectSnapshot, build_project_snapshot
+from analyzers.taint import TaintAnalyzer
+from metrics import review_metrics
+from profiling import ReviewProfiler
+from tracing import timed_span
+from workflow import (
+    create_initial_state, collect_review_metrics, collect_review_results, get_code_review_workflow,
+    merged_progress_events, node_progress_event, progress_config
+)
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_MODES = ("inline", "process")
+WARM_UP_CODE = "def warm_up():\n    pass\n"
+
+# 청크 분석으로 기대되는 속도 향상(chunk_speedup_bound)이 이보다 작으면 파일 전체를 한 번에 분석
+CHUNK_MIN_SPEEDUP = 1.5
+# 입력 흐름 분석 비중 추정의 지수 이동 평균 가중치
+TAINT_SHARE_SMOOTHING = 0.3
+
+# 진행 이벤트 콜백: 노드 완료 이벤트(workflow.node_progress_event) -> None, 이벤트 루프에서 호출
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+def run_review(code: str, filename: str, language: str, workflow_mode: str,
+               incremental: bool = False, progress_queue=None, progress_key: Optional[str] = None,
+               finding_cap: int = 0, full_findings: bool = False, project=None) -> Dict[str, Any]:
+    """워커 프로세스에서 리뷰 1건 실행
+
+    입력은 문자열(과 기본 타입만 담은 project), 결과는 기본 타입 dict이므로 프로세스 간 pickle 비용이 작다.
+    progress_queue가 주어지면 노드가 끝날 때마다 (progress_key, 이벤트)를 넣고,
+    마지막에 (progress_key, None)으로 이벤트 끝을 알린다.
+    """
+    return run_review_with_metrics(
+        code, filename, language, workflow_mode, incremental, progress_queue, progress_key,
+        finding_cap, full_findings, project=project
+    )[0]
+
+
+def run_review_with_metrics(code: str, filename: str, language: str, workflow_mode: str,
+                            incremental: bool = False, progress_queue=None, progress_key: Optional[str] = None,
+                            finding_cap: int = 0, full_findings: bool = False,
+                            profile: bool = False, project=None, shared_lines=(),
+                            taint: bool = True) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """run_review와 같지만 계측값(workflow.collect_review_metrics)도 함께 반환 (계측은 호출한 프로세스에서 기록)
+
+    shared_lines는 청크(analyzers.chunking.SourceChunk) 분석에서 함께 파싱하는 다른 청크의 import 라인이다.
+    청크는 taint=False로 입력 흐름 분석을 건너뛰고 analyze_module_taint 결과로 병합한다.
+    """
+    config = None
+    if progress_queue is not None:
+        config = progress_config(
+            lambda node, update: progress_queue.put((progress_key, node_progress_event(node, update)))
+        )
+    try:
+        return invoke_review(
+            code, filename, language, workflow_mode, incremental, finding_cap, full_findings, profile, config,
+            project, shared_lines, taint
+        )
+    finally:
+        if progress_queue is not None:
+            progress_queue.put((progress_key, None))
+
+
+def invoke_review(code: str, filename: str, language: str, workflow_mode: str, incremental: bool,
+                  finding_cap: int, full_findings: bool, profile: bool,
+                  config: Optional[Dict[str, Any]] = None, project=None,
+                  shared_lines=(), taint: bool = True) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """현재 스레드에서 워크플로우를 동기 실행하고 (결과, 계측값) 반환
+
+    profile이면 파싱부터 결과 직렬화까지를 cProfile/tracemalloc으로 감싸고 보고서를 계측값의
+    "profile"에 담는다. 모든 노드가 프로파일러가 켜진 스레드에서 실행되도록 sequential 워크플로우를 쓴다.
+    profile이 아니면 프로파일러를 만들지 않는다.
+    """
+    profiler = ReviewProfiler() if profile else None
+    workflow = get_code_review_workflow("sequential" if profile else workflow_mode)
+    spans = []
+    with profiler or nullcontext():
+        with timed_span(spans, "parse"):
+            initial_state = create_initial_state(
+                code, filename, language, incremental, finding_cap, full_findings, project, shared_lines, taint
+            )
+        final_state = workflow.invoke(initial_state, config=config)
+        with timed_span(spans, "serialize"):
+            results = collect_review_results(final_state)
+    run_metrics = _with_stage_spans(collect_review_metrics(initial_state, final_state), spans)
+    if profiler is not None:
+        run_metrics["profile"] = profiler.report()
+    return results, run_metrics
+
+
+def analyze_module_taint(code: str, project=None) -> Optional[Tuple[List[Any], float]]:
+    """모듈 전체의 입력 흐름(taint) 분석 결과와 분석 시간(초, 파싱 제외) (청크 분석 병합용, 청크 경계를 넘는 흐름 포함)
+
+    분석할 수 없으면(구문 오류 등) None을 반환하여 전체 파일로 다시 분석하게 한다.
+    """
+    try:
+        tree = parse_source(code)
+        start = time.perf_counter()
+        vulnerabilities = TaintAnalyzer(project=project).analyze(tree)
+        return vulnerabilities, time.perf_counter() - start
+    except Exception as e:
+        logger.warning(f"Module taint analysis failed: {e}")
+        return None
+
+
+def _with_stage_spans(run_metrics: Dict[str, Any], stage_spans: list) -> Dict[str, Any]:
+    """노드 스팬 앞뒤에 파싱/직렬화 스팬을 붙임"""
+    parse_span, serialize_span = stage_spans
+    run_metrics["spans"] = [parse_span, *run_metrics["spans"], serialize_span]
+    return run_metrics
+
+
+def merge_chunk_metrics(chunk_metrics: List[Dict[str, Any]], stage_spans: list,
+                        taint_seconds: Optional[float] = None) -> Dict[str, Any]:
+    """청크별 계측값 병합
+
+    청크는 동시에 실행되므로 노드별/파싱 시간은 청크 중 최댓값(리뷰가 기다린 시간)으로, 노드별 RSS 증가량은
+    청크(워커 프로세스)별 값의 합으로 하고,
+    청크 스팬에는 청크 번호를 붙여 분할/병합 스팬 사이에 시작 순서로 둔다.
+    taint_seconds는 청크와 함께 실행한 모듈 전체 입력 흐름 분석 시간이다.
+    """
+    node_seconds: Dict[str, float] = {}
+    for run_metrics in chunk_metrics:
+        for node, seconds in run_metrics["node_seconds"].items():
+            node_seconds[node] = max(node_seconds.get(node, 0.0), seconds)
+    node_rss_delta_bytes: Dict[str, int] = {}
+    for run_metrics in chunk_metrics:
+        for node, rss_delta in run_metrics.get("node_rss_delta_bytes", {}).items():
+            node_rss_delta_bytes[node] = node_rss_delta_bytes.get(node, 0) + rss_delta
+    parse_seconds = [m["parse_seconds"] for m in chunk_metrics if m["parse_seconds"] is not None]
+    spans = sorted(
+        (
+            {**span, "attributes": {**span["attributes"], "chunk": index}}
+            for index, run_metrics in enumerate(chunk_metrics) for span in run_metrics["spans"]
+        ),
+        key=lambda span: span["start"]
+    )
+    split_span, merge_span = stage_spans
+    return {
+        "node_seconds": node_seconds,
+        "node_rss_delta_bytes": node_rss_delta_bytes,
+        "parse_seconds": max(parse_seconds) if parse_seconds else None,
+        "taint_seconds": taint_seconds,
+        "spans": [split_span, *spans, merge_span],
+        "chunks": len(chunk_metrics)
+    }
+
+
+def analysis_seconds(run_metrics: Dict[str, Any]) -> float:
+    """리뷰 1건의 분석 구간 길이(초, 첫 스팬 시작부터 마지막 스팬 끝까지)"""
+    spans = run_metrics.get("spans") or []
+    if not spans:
+        return 0.0
+    return max(span["end"] for span in spans) - min(span["start"] for span in spans)
+
+
+def chunk_speedup_bound(taint_share: float, chunks: int, workers: int) -> float:
+    """청크 분석이 파일 전체 분석보다 빨라질 수 있는 최대 배수
+
+    입력 흐름 분석(비중 taint_share)은 모듈 전체를 워커 하나에서 한 번 실행하므로 나눌 수 없고, 나머지 단계만
+    청크 수만큼 나뉜다. 따라서 소요 시간은 max(흐름 분석, 나머지 / 청크 수, 전체 / 워커 수) 이상이다.
+    (분할/병합과 프로세스 간 전송 비용은 제외한 상한)
+    """
+    return 1 / max(taint_share, (1 - taint_share) / chunks, 1 / workers)
+
+
+def warm_up_worker(workflow_mode: str) -> float:
+    """분석기 import, 워크플로우 컴파일, 워밍업 리뷰를 수행하고 컴파일 시간(ms) 반환"""
+    start = time.perf_counter()
+    get_code_review_workflow(workflow_mode)
+    compile_ms = (time.perf_counter() - start) * 1000
+    run_review(WARM_UP_CODE, "warm_up.py", "python", workflow_mode)
+    return compile_ms
+
+
+def _init_worker(workflow_mode: str) -> None:
+    """워커 프로세스 초기화: 무거운 모듈을 미리 로드"""
+    import analyzers  # noqa: F401
+    import agents  # noqa: F401
+    get_code_review_workflow(workflow_mode)
+
+
+class AnalysisExecutor:
+    """분석 단계 실행기
+
+    - inline: 이벤트 루프 프로세스에서 워크플로우를 직접 실행 (노드는 스레드 풀에서 실행)
+    - process: CPU 바운드 분석을 미리 띄워둔 프로세스 풀에서 실행하여 이벤트 루프를 막지 않음
+
+    process 모드에서 chunk_min_bytes(0이면 사용 안 함) 이상인 파일은 최상위 정의 경계에서 청크로 나누어
+    동시에 분석하고 consolidation_agent.merge_chunk_results로 병합한다. 모듈 전체의 입력 흐름 분석은 워커
+    하나에서 청크와 함께 실행되므로 청크는 워커 수보다 하나 적게(최소 2개) 나누고, 그동안 관측한 입력 흐름
+    분석 비중(taint_share)으로 계산한 속도 향상 상한(chunk_speedup_bound)이 CHUNK_MIN_SPEEDUP보다 작으면
+    나누지 않는다.
+    """
+
+    def __init__(self, mode: str = "process", workers: int = 0, workflow_mode: str = "parallel",
+                 incremental: bool = False, finding_cap: int = 0, chunk_min_bytes: int = 0):
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"Unknown analysis executor: {mode} (expected one of {EXECUTOR_MODES})")
+        self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+        self.workflow_mode = workflow_mode
+        self.incremental = incremental
+        self.finding_cap = finding_cap
+        self.chunk_min_bytes = chunk_min_bytes
+        # chunk_min_bytes 이상인 파일의 분석 시간 중 입력 흐름 분석 비중 (지수 이동 평균, 관측 전에는 None)
+        self.taint_share: Optional[float] = None
+        self.compile_ms: Optional[float] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # process 모드 진행 이벤트 전달: 워커 -> 매니저 큐 -> 수신 스레드 -> 이벤트 루프
+        self._manager = None
+        self._progress_queue = None
+        self._progress_thread: Optional[threading.Thread] = None
+        self._listeners: Dict[str, tuple] = {}
+
+    async def start(self) -> None:
+        """실행기 준비: 워크플로우 컴파일 및 워밍업 (process 모드는 모든 워커를 미리 생성)"""
+        if self.mode == "inline":
+            start = time.perf_counter()
+            workflow = get_code_review_workflow(self.workflow_mode)
+            self.compile_ms = (time.perf_counter() - start) * 1000
+            await workflow.ainvoke(create_initial_state(WARM_UP_CODE, "warm_up.py", "python"))
+            return
+
+        context = multiprocessing.get_context("spawn")
+        self._pool = self._create_pool()
+        self._manager = context.Manager()
+        self._progress_queue = self._manager.Queue()
+        self._progress_thread = threading.Thread(target=self._pump_progress, name="review-progress", daemon=True)
+        self._progress_thread.start()
+        # 워커 수만큼 동시에 제출하여 모든 프로세스를 미리 생성/워밍업
+        loop = asyncio.get_running_loop()
+        compile_times = await asyncio.gather(*[
+            loop.run_in_executor(self._pool, warm_up_worker, self.workflow_mode)
+            for _ in range(self.workers)
+        ])
+        self.compile_ms = max(compile_times)
+        logger.info(f"Analysis process pool started with {self.workers} warm workers")
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.workflow_mode,)
+        )
+
+    async def _submit(self, call: Callable[[], Any]) -> Any:
+        """프로세스 풀에서 call 실행
+
+        워커 프로세스가 죽으면(예: OOM kill) 풀 전체가 BrokenProcessPool 상태가 되어 이후 모든 제출이
+        실패하므로, 깨진 풀을 새 풀로 바꾸고 한 번만 다시 시도한다. 같은 풀에서 함께 실패한 리뷰들은
+        풀을 한 번만 교체하며, 다시 실패하면 해당 리뷰만 실패한다.
+        """
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            pool = self._pool
+            if pool is None:
+                raise RuntimeError("Analysis executor has been shut down")
+            try:
+                return await loop.run_in_executor(pool, call)
+            except BrokenProcessPool:
+                if self._pool is pool:
+                    logger.error("Analysis worker process died; replacing the process pool")
+                    self._pool = self._create_pool()
+                    pool.shutdown(wait=False, cancel_futures=True)
+                if attempt:
+                    raise
+
+    def _pump_progress(self) -> None:
+        """매니저 큐의 진행 이벤트를 해당 리뷰를 기다리는 이벤트 루프로 전달 (수신 스레드)"""
+        while True:
+            try:
+                item = self._progress_queue.get()
+            except (EOFError, OSError):
+                return
+            if item is None:
+                return
+            key, event = item
+            listener = self._listeners.get(key)
+            if listener is None:
+                continue
+            loop, on_progress, finished = listener
+            if event is None:
+                loop.call_soon_threadsafe(finished.set)
+            else:
+                loop.call_soon_threadsafe(on_progress, event)
+
+    async def run(self, code: str, filename: str, language: str,
+                  on_progress: Optional[ProgressCallback] = None, full_findings: bool = False,
+                  project=None) -> Dict[str, Any]:
+        """리뷰 1건을 실행하고 저장 가능한 결과 dict 반환
+
+        on_progress가 주어지면 각 노드가 끝나는 즉시 이벤트 루프에서 진행 이벤트로 호출한다.
+        full_findings이면 규칙별 상한으로 잘린 항목까지 결과의 finding_details에 담는다.
+        project(analyzers.project.ProjectContext)가 주어지면 다른 모듈 함수 호출을 요약으로 따라간다.
+        노드별/파싱 시간과 발견 항목 수는 metrics.review_metrics에 기록한다.
+        """
+        return (await self.run_with_metrics(
+            code, filename, language, on_progress, full_findings, project=project
+        ))[0]
+
+    async def run_with_metrics(self, code: str, filename: str, language: str,
+                               on_progress: Optional[ProgressCallback] = None, full_findings: bool = False,
+                               profile: bool = False, project=None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """run과 같지만 리뷰 1건의 계측값도 함께 반환 (profile이면 프로파일 보고서 포함)"""
+        start = time.perf_counter()
+        try:
+            results, run_metrics = await self._run(
+                code, filename, language, on_progress, full_findings, profile, project
+            )
+        except Exception:
+            review_metrics.observe_analysis("failed", time.perf_counter() - start)
+            raise
+        review_metrics.observe_analysis("completed", time.perf_counter() - start, run_metrics)
+        review_metrics.observe_findings(results)
+        return results, run_metrics
+
+    async def build_project(self, files: List[Tuple[str, str]], on_disk: bool = False,
+                            include_graph: bool = False) -> ProjectSnapshot:
+        """여러 파일 리뷰의 프로젝트 인덱스를 만들어 파일별 ProjectContext만 담은 스냅샷 반환
+
+        모듈마다 taint 요약을 계산하는 CPU 바운드 작업이므로 process 모드에서는 워커 하나에서 실행하여
+        이벤트 루프 프로세스의 GIL을 잡지 않는다. on_disk이면 files는 (경로, 소스를 풀어 둔 로컬 파일 경로)이다.
+        모듈 요약 캐시(analyzers.project.module_summary_cache)는 이 작업을 실행한 프로세스의 것을 쓴다.
+        """
+        build = partial(build_project_snapshot, files, on_disk, include_graph)
+        if self.mode == "inline":
+            return await asyncio.to_thread(build)
+        if self._pool is None:
+            raise RuntimeError("Analysis executor has not been started")
+        return await self._submit(build)
+
+    @property
+    def chunk_count(self) -> int:
+        """청크 분석 시 나눌 청크 수 (워커 하나는 모듈 전체 입력 흐름 분석에 씀)"""
+        return max(self.workers - 1, 2)
+
+    def _chunk_eligible(self, code: str, profile: bool) -> bool:
+        """청크 분석 대상 크기의 파일인지 (프로파일링은 한 스레드 실행이 필요하므로 제외)"""
+        return (self.mode == "process" and self.workers > 1 and bool(self.chunk_min_bytes) and not profile
+                and len(code.encode("utf-8")) >= self.chunk_min_bytes)
+
+    def _should_chunk(self) -> bool:
+        """관측한 입력 흐름 분석 비중으로 청크 분석이 충분히 빠를지 판단 (비중을 모르면 청크로 나누어 측정)"""
+        if self.taint_share is None:
+            return True
+        return chunk_speedup_bound(self.taint_share, self.chunk_count, self.workers) >= CHUNK_MIN_SPEEDUP
+
+    def _observe_taint_share(self, taint_seconds: Optional[float], total_seconds: float) -> None:
+        """리뷰 1건의 입력 흐름 분석 비중을 taint_share 추정에 반영"""
+        if taint_seconds is None or total_seconds <= 0:
+            return
+        share = min(taint_seconds / total_seconds, 1.0)
+        if self.taint_share is None:
+            self.taint_share = share
+        else:
+            self.taint_share += TAINT_SHARE_SMOOTHING * (share - self.taint_share)
+
+    async def _run(self, code: str, filename: str, language: str, on_progress: Optional[ProgressCallback],
+                   full_findings: bool, profile: bool, project=None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        if self.mode == "inline":
+            config = None
+            if on_progress is not None:
+                # 노드는 스레드 풀에서 실행되므로 이벤트 루프로 넘겨서 호출
+                config = progress_config(
+                    lambda node, update: loop.call_soon_threadsafe(on_progress, node_progress_event(node, update))
+                )
+            if profile:
+                # 프로파일러가 켜진 스레드에서 모든 노드를 동기 실행 (이벤트 루프는 막지 않음)
+                return await asyncio.to_thread(
+                    invoke_review, code, filename, language, self.workflow_mode, self.incremental,
+                    self.finding_cap, full_findings, True, config, project
+                )
+            workflow = get_code_review_workflow(self.workflow_mode)
+            spans = []
+            with timed_span(spans, "parse"):
+                initial_state = create_initial_state(
+                    code, filename, language, self.incremental, self.finding_cap, full_findings, project
+                )
+            final_state = await workflow.ainvoke(initial_state, config=config)
+            with timed_span(spans, "serialize"):
+                results = collect_review_results(final_state)
+            return results, _with_stage_spans(collect_review_metrics(initial_state, final_state), spans)
+
+        if self._pool is None:
+            raise RuntimeError("Analysis executor has not been started")
+        # 큰 파일은 청크로 나누어 워커들에서 동시에 분석
+        chunk_eligible = self._chunk_eligible(code, profile)
+        if chunk_eligible and self._should_chunk():
+            stage_spans = []
+            with timed_span(stage_spans, "split") as attributes:
+                chunks = await asyncio.to_thread(split_module, code, self.chunk_count)
+                attributes["chunks"] = len(chunks)
+            if chunks:
+                outcome = await self._run_chunks(
+                    code, filename, language, chunks, stage_spans, on_progress, full_findings, project
+                )
+                if outcome is not None:
+                    return outcome
+        outcome = await self._run_whole(code, filename, language, on_progress, full_findings, profile, project)
+        if chunk_eligible:
+            self._observe_taint_share(outcome[1].get("taint_seconds"), analysis_seconds(outcome[1]))
+        return outcome
+
+    async def _run_whole(self, code: str, filename: str, language: str, on_progress: Optional[ProgressCallback],
+                         full_findings: bool, profile: bool, project=None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """파일 전체를 워커 하나에서 분석"""
+        loop = asyncio.get_running_loop()
+        review = partial(
+            run_review_with_metrics, code, filename, language, self.workflow_mode, self.incremental,
+            finding_cap=self.finding_cap, full_findings=full_findings, profile=profile, project=project
+        )
+        if on_progress is None:
+            return await self._submit(review)
+
+        key = uuid4().hex
+        finished = asyncio.Event()
+        self._listeners[key] = (loop, on_progress, finished)
+        try:
+            outcome = await self._submit(partial(review, progress_queue=self._progress_queue, progress_key=key))
+            # 결과보다 늦게 도착할 수 있는 진행 이벤트를 모두 전달한 뒤 반환
+            await finished.wait()
+            return outcome
+        finally:
+            self._listeners.pop(key, None)
+
+    async def _run_chunks(self, code: str, filename: str, language: str, chunks: List[SourceChunk],
+                          stage_spans: list, on_progress: Optional[ProgressCallback], full_findings: bool,
+                          project=None) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """청크를 프로세스 풀에서 동시에 분석하고 결과와 계측값을 병합
+
+        병합 시 개수와 라인 범위가 정확하도록 청크는 규칙별 상한 없이 전체 상세까지 분석한다.
+        노드 단위 진행 이벤트는 청크마다 다르므로 병합된 결과로 노드별 이벤트를 한 번씩 보낸다.
+        청크 경계를 넘는 입력 흐름을 놓치지 않도록 청크는 흐름 분석을 건너뛰고, 모듈 전체의 흐름 분석을
+        워커 하나에서 청크와 함께 한 번 실행하여 병합한다. 병합은 워크플로우의 consolidation 노드가 아니라
+        여기서 청크별 최종 결과(각 청크의 consolidation까지 끝난 결과)를 대상으로 한다.
+        실패한 청크가 있으면(예: 어휘 분할이 문장 중간을 자른 경우) None을 반환하여 전체 파일로 다시 분석하게 한다.
+        """
+        taint_outcome, *outcomes = await asyncio.gather(
+            self._submit(partial(analyze_module_taint, code, project)),
+            *[
+                self._submit(partial(
+                    run_review_with_metrics, chunk.source, chunk_file_path(filename, chunk.index), language,
+                    self.workflow_mode, self.incremental, full_findings=True, project=project,
+                    shared_lines=chunk.shared_lines, taint=False
+                ))
+                for chunk in chunks
+            ]
+        )
+        failed = [
+            chunk.index for chunk, (chunk_results, _) in zip(chunks, outcomes)
+            if not all(chunk_results["summary"].values())
+        ]
+        if failed:
+            logger.warning(f"Chunked analysis of {filename} failed in chunks {failed}; analyzing the whole file")
+            return None
+        if taint_outcome is None:
+            logger.warning(f"Module taint analysis of {filename} failed; analyzing the whole file")
+            return None
+        taint_vulnerabilities, taint_seconds = taint_outcome
+        self._observe_taint_share(
+            taint_seconds, taint_seconds + sum(analysis_seconds(run_metrics) for _, run_metrics in outcomes)
+        )
+        with timed_span(stage_spans, "merge", chunks=len(chunks)):
+            results = merge_chunk_results(
+                [chunk_results for chunk_results, _ in outcomes], code, self.finding_cap, full_findings,
+                taint_vulnerabilities
+            )
+        if on_progress is not None:
+            for event in merged_progress_events(results):
+                on_progress(event)
+        return results, merge_chunk_metrics([run_metrics for _, run_metrics in outcomes], stage_spans, taint_seconds)
+
+    def shutdown(self) -> None:
+        """프로세스 풀 및 진행 이벤트 전달 스레드 종료"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        if self._manager is not None:
+            self._progress_queue.put(None)
+            self._progress_thread.join(timeout=5)
+            self._manager.shutdown()
+            self._manager = None
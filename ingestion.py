@@ -0,0 +1,270 @@
+import asyncio
+import json
+import logging
+import os
+import tarfile
+import tempfile
+import time
+import zipfile
+from typing import Any, Awaitable, Callable, Dict, IO, Iterator, List, Optional, Sequence, Tuple
+
+from metrics import current_rss_bytes
+from utils import ReviewAggregator
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FORMATS = ("tar.gz", "zip")
+
+# 파일 하나를 분석하여 결과 dict를 돌려주는 코루틴 (code, filename, language)
+AnalyzeFn = Callable[[str, str, str], Awaitable[Dict[str, Any]]]
+
+
+def detect_archive_format(filename: str) -> Optional[str]:
+    """파일명 확장자로 아카이브 형식 추정"""
+    name = filename.lower()
+    if name.endswith((".tar.gz", ".tgz")):
+        return "tar.gz"
+    if name.endswith(".zip"):
+        return "zip"
+    return None
+
+
+class RssSampler:
+    """아카이브 1건을 처리하는 동안의 이 프로세스 RSS 증가량
+
+    ru_maxrss는 프로세스 수명 전체의 최대값이라 아카이브별 메모리 사용량을 보여주지 못하므로, 시작 시점
+    RSS와 진행 스냅샷(파일마다)에서 잰 RSS 중 최대값의 차이를 보고한다. process 모드 워커의 RSS는
+    포함하지 않는다. /proc이 없는 환경에서는 None이다.
+    """
+
+    def __init__(self):
+        self.baseline = current_rss_bytes()
+        self.peak = self.baseline
+
+    def sample(self) -> Dict[str, Optional[float]]:
+        rss = current_rss_bytes()
+        if rss is None or self.baseline is None:
+            return {"rss_mb": None, "peak_rss_delta_mb": None}
+        self.peak = max(self.peak, rss)
+        return {
+            "rss_mb": round(rss / (1024 * 1024), 2),
+            "peak_rss_delta_mb": round((self.peak - self.baseline) / (1024 * 1024), 2)
+        }
+
+
+class ArchiveMemberFilter:
+    """확장자/크기 기준으로 리뷰할 아카이브 멤버를 고르고 건너뛴 사유를 집계"""
+
+    def __init__(self, extensions: Sequence[str], max_file_bytes: int):
+        self.extensions = tuple(extension.lower() for extension in extensions)
+        self.max_file_bytes = max_file_bytes
+        self.skipped: Dict[str, int] = {}
+
+    def skip(self, reason: str) -> bool:
+        self.skipped[reason] = self.skipped.get(reason, 0) + 1
+        return False
+
+    def accept(self, path: str, size: int) -> bool:
+        if not path.lower().endswith(self.extensions):
+            return self.skip("extension")
+        if size > self.max_file_bytes:
+            return self.skip("too_large")
+        return True
+
+    def decode(self, data: bytes) -> Optional[str]:
+        try:
+            return data.decode("utf-8")
+        except UnicodeDecodeError:
+            self.skip("not_utf8")
+            return None
+
+
+def iter_archive_members(fileobj: IO[bytes], archive_format: str,
+                         member_filter: ArchiveMemberFilter) -> Iterator[Tuple[str, str, int]]:
+    """아카이브 멤버를 하나씩 읽어 (경로, 소스, 바이트 크기) 생성
+
+    tar.gz는 스트림 모드(r|gz)로 앞에서부터 순서대로 읽고, zip은 중앙 디렉터리만 읽은 뒤
+    멤버를 하나씩 연다. 어느 쪽이든 한 번에 멤버 하나의 내용만 메모리에 올린다.
+    """
+    if archive_format == "tar.gz":
+        with tarfile.open(fileobj=fileobj, mode="r|gz") as archive:
+            for member in archive:
+                # TarFile은 읽은 멤버 정보를 members에 계속 쌓으므로 비워서 메모리를 일정하게 유지
+                archive.members = []
+                if not member.isfile():
+                    continue
+                if not member_filter.accept(member.name, member.size):
+                    continue
+                data = archive.extractfile(member).read()
+                source = member_filter.decode(data)
+                if source is not None:
+                    yield member.name, source, len(data)
+    elif archive_format == "zip":
+        with zipfile.ZipFile(fileobj) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                if not member_filter.accept(info.filename, info.file_size):
+                    continue
+                with archive.open(info) as extracted:
+                    # 선언된 크기를 믿지 않고 상한까지만 읽음
+                    data = extracted.read(member_filter.max_file_bytes + 1)
+                if len(data) > member_filter.max_file_bytes:
+                    member_filter.skip("too_large")
+                    continue
+                source = member_filter.decode(data)
+                if source is not None:
+                    yield info.filename, source, len(data)
+    else:
+        raise ValueError(f"Unknown archive format: {archive_format} (expected one of {ARCHIVE_FORMATS})")
+
+
+class ExtractedArchive:
+    """한 번의 스트리밍 읽기로 리뷰 대상 멤버를 임시 디렉터리에 풀어 둔 아카이브
+
+    프로젝트 심볼 테이블(analyzers.project)은 파일 리뷰보다 먼저 모든 소스가 필요하므로, 아카이브를 두 번
+    읽거나 소스를 모두 메모리에 올리는 대신 멤버를 하나씩 디스크에 쓰고 (경로, 로컬 파일, 크기)만 보관한다.
+    인덱스와 파일 리뷰는 로컬 파일을 하나씩 다시 읽는다. close로 임시 디렉터리를 지운다.
+    """
+
+    def __init__(self, member_filter: ArchiveMemberFilter):
+        self.member_filter = member_filter
+        self._directory = tempfile.TemporaryDirectory(prefix="review-archive-")
+        self.members: List[Tuple[str, str, int]] = []
+        self.total_bytes = 0
+
+    def add(self, path: str, source: str, size: int) -> None:
+        local_path = os.path.join(self._directory.name, f"{len(self.members)}.src")
+        with open(local_path, "w", encoding="utf-8") as file:
+            file.write(source)
+        self.members.append((path, local_path, size))
+        self.total_bytes += size
+
+    def local_files(self, extensions: Sequence[str]) -> List[Tuple[str, str]]:
+        """확장자가 맞는 멤버의 (아카이브 경로, 로컬 파일 경로) 목록"""
+        extensions = tuple(extension.lower() for extension in extensions)
+        return [(path, local_path) for path, local_path, _ in self.members if path.lower().endswith(extensions)]
+
+    def __iter__(self) -> Iterator[Tuple[str, str, int]]:
+        """iter_archive_members처럼 (경로, 소스, 바이트 크기)를 하나씩 생성"""
+        for path, local_path, size in self.members:
+            with open(local_path, encoding="utf-8") as file:
+                yield path, file.read(), size
+
+    def close(self) -> None:
+        self._directory.cleanup()
+
+
+def extract_archive(fileobj: IO[bytes], archive_format: str, extensions: Sequence[str], max_file_bytes: int,
+                    max_total_bytes: int) -> Optional[ExtractedArchive]:
+    """리뷰 대상 멤버를 임시 디렉터리에 풀어 둠 (블로킹, 한 번에 멤버 하나만 메모리에 올림)
+
+    합계가 max_total_bytes를 넘으면 지금까지 푼 파일을 지우고 fileobj를 처음으로 되돌린 뒤 None을 반환한다
+    (이 경우 아카이브에서 바로 스트리밍으로 파일 단위 분석만 한다).
+    """
+    extracted = ExtractedArchive(ArchiveMemberFilter(extensions, max_file_bytes))
+    members = iter_archive_members(fileobj, archive_format, extracted.member_filter)
+    try:
+        for path, source, size in members:
+            if extracted.total_bytes + size > max_total_bytes:
+                break
+            extracted.add(path, source, size)
+        else:
+            return extracted
+    except BaseException:
+        extracted.close()
+        raise
+    finally:
+        members.close()
+    extracted.close()
+    fileobj.seek(0)
+    return None
+
+
+async def ingest_archive(fileobj: IO[bytes], archive_format: str, analyze: AnalyzeFn, findings_path: str,
+                         extensions: Sequence[str], max_file_bytes: int, concurrency: int = 4,
+                         language: str = "python",
+                         on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+                         extracted: Optional[ExtractedArchive] = None) -> Dict[str, Any]:
+    """아카이브를 스트리밍으로 읽으면서 파일 단위로 분석하고 결과를 JSONL로 바로 기록
+
+    동시에 분석 중인 파일은 최대 concurrency개이고, 파일별 결과는 파일에 기록한 뒤 버리며
+    집계는 ReviewAggregator로 누적하므로 저장소 크기와 무관하게 메모리 사용량이 일정하다.
+    스냅샷의 peak_rss_delta_mb는 이 아카이브를 처리하는 동안의 RSS 증가량이다 (RssSampler).
+    extracted(extract_archive)가 주어지면 아카이브를 다시 읽지 않고 풀어 둔 파일을 하나씩 읽는다.
+    """
+    if extracted is not None:
+        member_filter = extracted.member_filter
+        members = iter(extracted)
+    else:
+        member_filter = ArchiveMemberFilter(extensions, max_file_bytes)
+        members = iter_archive_members(fileobj, archive_format, member_filter)
+    aggregator = ReviewAggregator()
+    semaphore = asyncio.Semaphore(concurrency)
+    pending = set()
+    stats = {"files_reviewed": 0, "bytes_reviewed": 0}
+    start = time.perf_counter()
+    rss = RssSampler()
+
+    def snapshot() -> Dict[str, Any]:
+        elapsed = time.perf_counter() - start
+        return {
+            **stats,
+            "files_skipped": dict(member_filter.skipped),
+            "elapsed_seconds": round(elapsed, 3),
+            "files_per_second": round(stats["files_reviewed"] / elapsed, 2) if elapsed > 0 else 0.0,
+            **rss.sample(),
+            "aggregate": aggregator.report()
+        }
+
+    with open(findings_path, "w", encoding="utf-8") as findings:
+
+        async def review_member(path: str, source: str, size: int) -> None:
+            try:
+                entry = {"status": "completed", "results": await analyze(source, path, language)}
+            except Exception as e:
+                logger.error(f"Archive member {path} failed: {e}")
+                entry = {"status": "failed", "results": {"error": str(e)}}
+            finally:
+                semaphore.release()
+
+            findings.write(json.dumps({"filename": path, **entry}, default=str) + "\n")
+            aggregator.add(path, entry)
+            stats["files_reviewed"] += 1
+            stats["bytes_reviewed"] += size
+            if on_progress is not None:
+                on_progress(snapshot())
+
+        try:
+            while True:
+                # 분석 슬롯이 빌 때까지 다음 멤버를 읽지 않음 (읽기와 분석의 backpressure)
+                await semaphore.acquire()
+                member = await asyncio.to_thread(next, members, None)
+                if member is None:
+                    semaphore.release()
+                    break
+                task = asyncio.create_task(review_member(*member))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        finally:
+            members.close()
+            if pending:
+                await asyncio.gather(*pending)
+
+    return snapshot()
+
+
+def findings_file_path(output_dir: str, review_id: str) -> str:
+    """리뷰 ID별 JSONL 결과 파일 경로 (디렉터리는 필요 시 생성)"""
+    os.makedirs(output_dir, exist_ok=True)
+    return os.path.join(output_dir, f"{review_id}.jsonl")
+
+
+def remove_findings_file(output_dir: str, review_id: str) -> None:
+    """리뷰가 저장소에서 삭제/제거되면 JSONL 결과 파일도 삭제 (없으면 무시)"""
+    try:
+        os.remove(os.path.join(output_dir, f"{review_id}.jsonl"))
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.error(f"Failed to remove findings file of review {review_id}: {e}")
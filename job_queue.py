@@ -0,0 +1,172 @@
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+JobFactory = Callable[[], Awaitable[Any]]
+# 작업이 워커에 배정될 때 대기 시간(초)을 받는 콜백
+WaitCallback = Callable[[float], None]
+# drain 제한 시간 안에 끝나지 않아 버려진 작업 ID를 받는 콜백 (워커 종료 후 호출)
+AbandonCallback = Callable[[str], None]
+
+
+class QueueFullError(Exception):
+    """대기열이 가득 차 작업을 받을 수 없음 (retry_after: 재시도 권장 시간(초))"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Review queue is full, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class QueueClosedError(Exception):
+    """종료(drain) 중이라 새 작업을 받지 않음"""
+
+
+class ReviewJobQueue:
+    """최대 깊이와 워커 수가 정해진 리뷰 작업 대기열
+
+    대기 중인 작업은 최대 max_depth개까지만 받고, 넘치면 QueueFullError로 거절하여
+    요청 폭주 시에도 프로세스에 쌓이는 작업량을 제한한다. 작업 처리 시간의 이동 평균으로
+    대기 순번별 예상 대기 시간과 재시도 권장 시간을 계산한다. 큰 업로드처럼 작업을 만들기 전에
+    비용이 드는 요청은 reserve로 자리를 먼저 잡고 submit(reserved=True) 또는 release로 돌려준다.
+    """
+
+    def __init__(self, max_depth: int = 100, workers: int = 4, initial_job_seconds: float = 1.0,
+                 on_wait: Optional[WaitCallback] = None, on_abandon: Optional[AbandonCallback] = None):
+        self.max_depth = max_depth
+        self.workers = max(workers, 1)
+        self.average_job_seconds = initial_job_seconds
+        self.on_wait = on_wait
+        self.on_abandon = on_abandon
+        self._queue: Optional[asyncio.Queue] = None
+        self._waiting: "OrderedDict[str, None]" = OrderedDict()
+        self._workers: List[asyncio.Task] = []
+        self._running: "OrderedDict[str, None]" = OrderedDict()
+        self._in_flight = 0
+        # reserve로 잡아 두었지만 아직 submit하지 않은 자리 수
+        self._reserved = 0
+        self._accepting = False
+        self._stats = {"submitted": 0, "rejected": 0, "completed": 0, "failed": 0}
+
+    async def start(self) -> None:
+        """워커 태스크 시작 (실행 중인 이벤트 루프에서 호출)"""
+        self._queue = asyncio.Queue(maxsize=self.max_depth)
+        self._workers = [asyncio.create_task(self._worker(index)) for index in range(self.workers)]
+        self._accepting = True
+        logger.info(f"Review job queue started (max depth {self.max_depth}, {self.workers} workers)")
+
+    def _check_capacity(self) -> None:
+        """새 작업(또는 예약)을 받을 수 없으면 QueueClosedError/QueueFullError"""
+        if not self._accepting or self._queue is None:
+            raise QueueClosedError("Review queue is not accepting jobs")
+        if self._queue.qsize() + self._reserved >= self.max_depth:
+            self._stats["rejected"] += 1
+            raise QueueFullError(self.retry_after_seconds())
+
+    def reserve(self) -> None:
+        """대기열 자리 하나를 미리 잡음 (가득 찼거나 종료 중이면 submit과 같은 예외)"""
+        self._check_capacity()
+        self._reserved += 1
+
+    def release(self) -> None:
+        """reserve로 잡은 자리를 작업 없이 돌려줌"""
+        self._reserved = max(self._reserved - 1, 0)
+
+    def submit(self, job_id: str, factory: JobFactory, reserved: bool = False) -> int:
+        """작업을 대기열에 넣고 1부터 시작하는 대기 순번 반환
+
+        reserved이면 reserve로 잡아 둔 자리를 사용한다 (예외가 나도 자리는 반환됨).
+        """
+        if reserved:
+            self.release()
+            if not self._accepting or self._queue is None:
+                raise QueueClosedError("Review queue is not accepting jobs")
+        else:
+            self._check_capacity()
+        self._queue.put_nowait((job_id, factory, time.monotonic()))
+        self._waiting[job_id] = None
+        self._stats["submitted"] += 1
+        return len(self._waiting)
+
+    def estimate_wait_seconds(self, position: int) -> float:
+        """순번 position인 작업이 시작될 때까지의 예상 대기 시간(초)"""
+        busy = min(self._in_flight, self.workers)
+        rounds = math.ceil((position - 1 + busy) / self.workers)
+        return round(rounds * self.average_job_seconds, 2)
+
+    def retry_after_seconds(self) -> int:
+        """대기열에 자리 하나가 날 때까지의 예상 시간(초, 최소 1)"""
+        return max(1, math.ceil(self.average_job_seconds / self.workers))
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job_id, factory, enqueued_at = await self._queue.get()
+            self._waiting.pop(job_id, None)
+            self._running[job_id] = None
+            self._in_flight += 1
+            start = time.monotonic()
+            if self.on_wait is not None:
+                self.on_wait(start - enqueued_at)
+            try:
+                await factory()
+                self._stats["completed"] += 1
+            except Exception as e:
+                self._stats["failed"] += 1
+                logger.error(f"Review job {job_id} failed in worker {index}: {e}")
+            finally:
+                elapsed = time.monotonic() - start
+                # 처리 시간 지수 이동 평균 (최근 작업에 가중치)
+                self.average_job_seconds = 0.8 * self.average_job_seconds + 0.2 * elapsed
+                self._running.pop(job_id, None)
+                self._in_flight -= 1
+                self._queue.task_done()
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """새 작업을 막고 대기/실행 중인 작업이 끝날 때까지 기다린 뒤 워커 종료
+
+        timeout 안에 끝나지 않으면 남은 작업을 취소하고, 실행 중이던 작업과 대기 중이던 작업의 ID를
+        on_abandon으로 넘긴 뒤(예: 리뷰를 실패로 기록) False 반환
+        """
+        self._accepting = False
+        if self._queue is None:
+            return True
+
+        drained = True
+        abandoned: List[str] = []
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            drained = False
+            abandoned = [*self._running, *self._waiting]
+            logger.warning(
+                f"Review queue drain timed out with {len(self._waiting)} waiting, {self._in_flight} running"
+            )
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        # 취소된 작업이 더는 상태를 바꾸지 않으므로 워커 종료 후에 알림
+        if self.on_abandon is not None:
+            for job_id in abandoned:
+                try:
+                    self.on_abandon(job_id)
+                except Exception as e:
+                    logger.error(f"Abandon callback failed for review job {job_id}: {e}")
+        return drained
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_depth": self.max_depth,
+            "workers": self.workers,
+            "waiting": len(self._waiting),
+            "in_flight": self._in_flight,
+            "reserved": self._reserved,
+            "accepting": self._accepting,
+            "average_job_seconds": round(self.average_job_seconds, 3),
+            **self._stats
+        }
@@ -1,21 +1,41 @@
 # Multi-Agent Code Review System - Main Application
 # File: main.py
 
+import asyncio
 import logging
+import os
+import secrets
+import tempfile
+import time
 from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
-from fastapi import FastAPI, BackgroundTasks, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Query, Request
+from fastapi.responses import FileResponse, PlainTextResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
 # Import our modules
 from config import settings
 from models import (
-    CodeReviewState, ReviewRequest, ReviewResponse, ReviewResult
+    ReviewRequest, ReviewResponse, ReviewResult, BatchReviewRequest, ReviewFile,
+    ReviewSummary, ReviewListResponse, FindingDetailPage
 )
 from storage import storage
-from workflow import build_code_review_workflow
+from executor import AnalysisExecutor
+from cache import create_result_cache, review_cache_key
+from analyzers import ANALYZER_VERSION, ProjectSnapshot
+from analyzers.project import PROJECT_EXTENSIONS
+from workflow import ANALYSIS_AGENTS, REVIEW_NODES, agent_status_from_summary, without_finding_details
+from utils import aggregate_file_results
+from events import ReviewEventBroker
+from job_queue import ReviewJobQueue, QueueFullError, QueueClosedError
+from ingestion import ARCHIVE_FORMATS, detect_archive_format, extract_archive, findings_file_path, ingest_archive
+from serialization import PayloadEncoder, parse_fields, project_results
+from metrics import review_metrics
+from profiling import pstats_bytes
+from tracing import OtlpTraceExporter, ReviewTrace
 
 # Logging setup
 logging.basicConfig(level=getattr(logging, settings.log_level.upper()))
@@ -36,43 +56,485 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Analysis executor (inline 또는 프로세스 풀)
+analysis_executor = AnalysisExecutor(
+    mode=settings.analysis_executor,
+    workers=settings.analysis_workers,
+    workflow_mode=settings.workflow_mode,
+    incremental=settings.incremental_analysis,
+    finding_cap=settings.findings_rule_cap,
+    chunk_min_bytes=settings.chunk_analysis_min_bytes
+)
+
+# 리뷰 결과 캐시 (콘텐츠 주소 기반)
+result_cache = create_result_cache(
+    settings.cache_type,
+    settings.cache_max_entries,
+    settings.cache_ttl_seconds
+)
+
+# 리뷰 작업 대기열 (최대 깊이/워커 수 제한)
+review_queue = ReviewJobQueue(
+    max_depth=settings.queue_max_depth,
+    workers=settings.queue_workers,
+    on_wait=review_metrics.observe_queue_wait,
+    on_abandon=lambda review_id: fail_abandoned_review(review_id)
+)
+
+# 리뷰 진행 이벤트 브로커 (SSE)
+event_broker = ReviewEventBroker(
+    keep_alive_seconds=settings.events_keep_alive_seconds,
+    retention_seconds=settings.events_retention_seconds
+)
+
+# 프로젝트 인덱스 생성 누계 (모듈 요약 캐시는 인덱스를 만든 워커 프로세스에 있으므로 생성 결과로 집계)
+project_index_stats = {"builds": 0, "failed": 0, "modules": 0, "reused": 0, "computed": 0}
+
+# /metrics 수집 시 읽는 구성 요소 상태 (대기열 깊이, 실행 중 리뷰 수, 캐시 적중 등)
+review_metrics.register_component("queue", review_queue.stats)
+review_metrics.register_component("storage", storage.stats)
+review_metrics.register_component("events", event_broker.stats)
+review_metrics.register_component("module_summaries", lambda: dict(project_index_stats))
+if result_cache is not None:
+    review_metrics.register_component("cache", result_cache.stats)
+
+# 결과 페이로드 인코더 (JSON/MessagePack, zstd/gzip)
+payload_encoder = PayloadEncoder(
+    min_compress_bytes=settings.response_compress_min_bytes,
+    gzip_level=settings.response_gzip_level,
+    zstd_level=settings.response_zstd_level
+)
+
+# 리뷰 타임라인 OTLP 전송 (엔드포인트를 설정한 경우에만)
+trace_exporter = (
+    OtlpTraceExporter(settings.otlp_traces_endpoint, settings.otlp_service_name)
+    if settings.otlp_traces_endpoint else None
+)
+
+# Startup / Shutdown
+@app.on_event("startup")
+async def warm_up_workflow():
+    """워크플로우를 미리 컴파일하고 한 번 실행하여 첫 요청이 비용을 치르지 않도록 함"""
+    app.state.workflow_ready = False
+
+    if settings.cache_type == "redis":
+        from database import init_redis
+        await init_redis(settings.redis_url)
+
+    await analysis_executor.start()
+    await review_queue.start()
+
+    app.state.workflow_compile_ms = analysis_executor.compile_ms
+    app.state.workflow_ready = True
+    logger.info(
+        f"Review workflow ({settings.workflow_mode}, {settings.analysis_executor} executor) "
+        f"compiled in {analysis_executor.compile_ms:.1f}ms; reused for every review"
+    )
+
+@app.on_event("shutdown")
+async def shutdown_executor():
+    """대기열의 남은 작업을 처리한 뒤 분석 프로세스 풀 종료 및 저장소 기록 마무리"""
+    drained = await review_queue.drain(settings.queue_drain_timeout_seconds)
+    logger.info(f"Review queue drained: {drained} ({review_queue.stats()})")
+    await event_broker.shutdown()
+    analysis_executor.shutdown()
+    storage.close()
+
+def result_options(full_findings: bool = False, project=None) -> Dict[str, Any]:
+    """분석 결과 내용에 영향을 주는 옵션 (결과 캐시 키에 포함, project는 import한 다른 모듈 요약의 해시)"""
+    options = {"finding_cap": settings.findings_rule_cap, "full_findings": full_findings}
+    if project is not None:
+        options["project"] = project.digest
+    return options
+
+async def lookup_cached_results(code: str, language: str, full_findings: bool = False,
+                                project=None) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """결과 캐시 조회: (캐시 키, 캐시된 결과 또는 None). 캐시가 꺼져 있으면 (None, None)"""
+    if result_cache is None:
+        return None, None
+    cache_key = review_cache_key(
+        code, language, ANALYSIS_AGENTS, ANALYZER_VERSION, result_options(full_findings, project)
+    )
+    return cache_key, await result_cache.get(cache_key)
+
+async def store_cached_results(cache_key: Optional[str], results: Dict[str, Any]) -> None:
+    """lookup_cached_results가 준 캐시 키로 분석 결과 저장 (캐시가 꺼져 있으면 무시)
+
+    일시적인 실패가 TTL 동안 재사용되지 않도록 모든 에이전트가 성공한 결과만 저장한다.
+    """
+    if cache_key is not None and all((results.get("summary") or {}).values()):
+        await result_cache.set(cache_key, results)
+
+def require_profiling_access(admin_token: Optional[str]) -> None:
+    """X-Admin-Token 헤더가 프로파일링 관리자 토큰과 일치해야 함 (아니면 403)
+
+    프로파일에는 파일 경로와 내부 함수 이름이 담기므로 토큰이 설정되지 않았으면 항상 거절한다.
+    """
+    expected = settings.profiling_admin_token
+    if not expected:
+        raise HTTPException(status_code=403, detail="Profiling is disabled (PROFILING_ADMIN_TOKEN is not set)")
+    if not secrets.compare_digest((admin_token or "").encode(), expected.encode()):
+        raise HTTPException(status_code=403, detail="Profiling requires a valid X-Admin-Token header")
+
+def fail_abandoned_review(review_id: str) -> None:
+    """종료 시 대기열 drain 제한 시간 안에 끝나지 않은 리뷰를 실패로 기록 (끝난 에이전트 결과는 유지)"""
+    review = storage.get_review(review_id)
+    if review is None or review.status != "processing":
+        return
+    error = "Server shut down before the review finished"
+    agent_status = None
+    if review.agent_status is not None:
+        agent_status = {
+            node: "failed" if state == "pending" else state for node, state in review.agent_status.items()
+        }
+    storage.update_review(
+        review_id,
+        status="failed",
+        results={**(review.results or {}), "error": error},
+        agent_status=agent_status
+    )
+    event_broker.close(review_id, "review_failed", {"status": "failed", "error": error})
+
+def queue_rejection(error: Exception) -> HTTPException:
+    """대기열 거절 예외를 응답으로 변환: 가득 차면 429(Retry-After), 종료 중이면 503"""
+    if isinstance(error, QueueFullError):
+        return HTTPException(
+            status_code=429,
+            detail="Review queue is full",
+            headers={"Retry-After": str(error.retry_after)}
+        )
+    return HTTPException(status_code=503, detail="Server is shutting down")
+
+def enqueue_review(review_id: str, factory, message: str, reserved: bool = False) -> ReviewResponse:
+    """리뷰 작업을 대기열에 넣고 대기 순번/예상 대기 시간을 담은 응답 생성
+
+    대기열이 가득 차면 429(Retry-After), 종료 중이면 503으로 거절한다.
+    reserved이면 review_queue.reserve로 미리 잡아 둔 자리를 사용한다.
+    """
+    try:
+        position = review_queue.submit(review_id, factory, reserved=reserved)
+    except (QueueFullError, QueueClosedError) as e:
+        storage.delete_review(review_id)
+        raise queue_rejection(e)
+
+    return ReviewResponse(
+        review_id=review_id,
+        status="processing",
+        message=message,
+        queue_position=position,
+        estimated_wait_seconds=review_queue.estimate_wait_seconds(position)
+    )
+
 # API Endpoints
 @app.post("/api/v1/review", response_model=ReviewResponse)
-async def create_code_review(
-        request: ReviewRequest,
-        background_tasks: BackgroundTasks
-):
-    """Create a new code review"""
+async def create_code_review(request: ReviewRequest, x_admin_token: Optional[str] = Header(None)):
+    """Create a new code review
+
+    With `profile: true` the review runs under cProfile and tracemalloc (sequential workflow, result
+    cache bypassed) and the profile is kept with the review. Requires an `X-Admin-Token` header
+    matching `PROFILING_ADMIN_TOKEN`; profiling is refused while no token is configured.
+    """
+    profile = bool(request.profile)
+    if profile:
+        require_profiling_access(x_admin_token)
     review_id = str(uuid4())
-    storage.create_review(review_id)
+    storage.create_review(review_id, request.user_id or "default")
+
+    # 동일 코드/설정의 이전 결과가 캐시에 있으면 즉시 완료 처리 (프로파일링 요청은 항상 새로 분석)
+    cache_key = None
+    if not profile:
+        cache_key, cached_results = await lookup_cached_results(
+            request.code, request.language, bool(request.full_findings)
+        )
+        if cached_results is not None:
+            storage.update_review(
+                review_id,
+                status="completed",
+                completed_at=datetime.utcnow(),
+                results=cached_results,
+                agent_status=agent_status_from_summary(cached_results.get("summary"))
+            )
+            return ReviewResponse(
+                review_id=review_id,
+                status="completed",
+                message="Code review served from cache"
+            )
     
-    background_tasks.add_task(
-        process_code_review,
+    enqueued_at = time.time()
+    return enqueue_review(
         review_id,
-        request.code,
-        request.filename,
-        request.language
+        lambda: process_code_review(
+            review_id, request.code, request.filename, request.language, cache_key,
+            bool(request.full_findings), profile, enqueued_at
+        ),
+        "Code review queued"
     )
 
-    return ReviewResponse(
+@app.post("/api/v1/review/batch", response_model=ReviewResponse)
+async def create_batch_review(request: BatchReviewRequest):
+    """Create a code review for many files under one review id"""
+    if not request.files:
+        raise HTTPException(status_code=400, detail="At least one file is required")
+    if len(request.files) > settings.batch_max_files:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many files: {len(request.files)} (max {settings.batch_max_files})"
+        )
+    filenames = [review_file.filename for review_file in request.files]
+    if len(set(filenames)) != len(filenames):
+        raise HTTPException(status_code=400, detail="Duplicate filenames in batch")
+
+    review_id = str(uuid4())
+    storage.create_review(review_id, request.user_id or "default")
+    storage.update_review(
+        review_id,
+        files_count=len(request.files),
+        results=batch_results({}, len(request.files))
+    )
+
+    # 배치별 동시 실행 수는 서버 상한을 넘지 않음
+    concurrency = min(request.max_concurrency or settings.batch_max_concurrency, settings.batch_max_concurrency)
+    return enqueue_review(
+        review_id,
+        lambda: process_batch_review(review_id, request.files, max(concurrency, 1)),
+        f"Batch review of {len(request.files)} files queued"
+    )
+
+@app.post("/api/v1/review/archive", response_model=ReviewResponse)
+async def create_archive_review(
+        request: Request,
+        filename: str,
+        archive_format: Optional[str] = None,
+        language: str = "python",
+        user_id: str = "default"
+):
+    """Review a whole repository uploaded as a tar.gz or zip archive (raw request body)"""
+    archive_format = archive_format or detect_archive_format(filename)
+    if archive_format not in ARCHIVE_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported archive format (expected one of {ARCHIVE_FORMATS})"
+        )
+
+    # 업로드를 받기 전에 대기열 자리를 잡아, 가득 찼거나 종료 중이면 본문을 읽지 않고 바로 거절
+    try:
+        review_queue.reserve()
+    except (QueueFullError, QueueClosedError) as e:
+        raise queue_rejection(e)
+
+    # 요청 본문을 청크 단위로 받아 임계값을 넘으면 디스크로 스풀 (아카이브 전체를 메모리에 올리지 않음)
+    spool = tempfile.SpooledTemporaryFile(max_size=settings.ingest_spool_bytes)
+    try:
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > settings.ingest_max_archive_bytes:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Archive too large (max {settings.ingest_max_archive_bytes} bytes)"
+                )
+            spool.write(chunk)
+        spool.seek(0)
+    except BaseException:
+        review_queue.release()
+        spool.close()
+        raise
+
+    review_id = str(uuid4())
+    storage.create_review(review_id, user_id)
+    try:
+        return enqueue_review(
+            review_id,
+            lambda: process_archive_review(review_id, spool, archive_format, language),
+            f"Archive review queued ({received} bytes received)",
+            reserved=True
+        )
+    except HTTPException:
+        spool.close()
+        raise
+
+@app.get(
+    "/api/v1/review/{review_id}/findings",
+    response_class=FileResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}}
+)
+async def get_review_findings(review_id: str):
+    """Download per-file findings of an archive review as JSON Lines"""
+    if not storage.get_review(review_id):
+        raise HTTPException(status_code=404, detail="Review not found")
+    path = os.path.join(settings.ingest_output_dir, f"{review_id}.jsonl")
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="No findings file for this review")
+    return FileResponse(path, media_type="application/x-ndjson", filename=f"{review_id}.jsonl")
+
+@app.get("/api/v1/reviews", response_model=ReviewListResponse)
+async def list_reviews(
+        user_id: Optional[str] = None,
+        status: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        limit: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = None
+):
+    """List reviews newest first with filters and cursor-based pagination"""
+    try:
+        # SQLite 저장소는 대기 중인 쓰기를 기록한 뒤 조회하므로 이벤트 루프 밖에서 실행
+        reviews, next_cursor = await asyncio.to_thread(
+            storage.list_reviews_page,
+            user_id=user_id,
+            status=status,
+            created_after=created_after,
+            created_before=created_before,
+            limit=limit,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return ReviewListResponse(
+        reviews=[
+            ReviewSummary(
+                review_id=review.id,
+                user_id=review.user_id,
+                status=review.status,
+                created_at=review.created_at,
+                completed_at=review.completed_at,
+                files_count=review.files_count
+            )
+            for review in reviews
+        ],
+        next_cursor=next_cursor
+    )
+
+def review_final_event(review_id: str) -> Optional[tuple]:
+    """이미 끝난 리뷰의 최종 이벤트 (진행 중이면 None)"""
+    review = storage.get_review(review_id)
+    if review is None or review.status not in ("completed", "failed"):
+        return None
+    return f"review_{review.status}", {"status": review.status, "completed_at": review.completed_at}
+
+@app.get(
+    "/api/v1/review/{review_id}/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}}
+)
+async def stream_review_events(review_id: str, request: Request):
+    """Stream review progress as Server-Sent Events until the review finishes"""
+    if not storage.get_review(review_id):
+        raise HTTPException(status_code=404, detail="Review not found")
+
+    last_event_id = request.headers.get("last-event-id", "0")
+    return StreamingResponse(
+        event_broker.subscribe(
+            review_id,
+            review_final_event,
+            int(last_event_id) if last_event_id.isdigit() else 0
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.get("/api/v1/review/{review_id}/details", response_model=FindingDetailPage)
+async def get_finding_details(
+    review_id: str,
+    section: str = Query(..., description="Result section, e.g. bugs or tests"),
+    rule: str = Query(..., description="Finding rule, e.g. magic_number"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000)
+):
+    """Page through every finding of one rule, including those cut by the per-rule cap
+
+    Only available for reviews created with `full_findings: true`.
+    """
+    review = storage.get_review(review_id)
+    if not review:
+        raise HTTPException(status_code=404, detail="Review not found")
+
+    result_section = (review.results or {}).get(section)
+    details = result_section.get("finding_details") if isinstance(result_section, dict) else None
+    if details is None:
+        raise HTTPException(status_code=404, detail="Full finding details were not recorded for this section")
+    if rule not in details:
+        raise HTTPException(status_code=404, detail=f"No findings for rule {rule}")
+
+    items = details[rule]
+    next_offset = offset + limit if offset + limit < len(items) else None
+    return FindingDetailPage(
         review_id=review_id,
-        status="processing",
-        message="Code review started"
+        section=section,
+        rule=rule,
+        total=len(items),
+        offset=offset,
+        items=items[offset:offset + limit],
+        next_offset=next_offset
     )
 
-@app.get("/api/v1/review/{review_id}", response_model=ReviewResult)
-async def get_review_status(review_id: str):
-    """Get code review results"""
+@app.get(
+    "/api/v1/review/{review_id}/profile",
+    response_model=None,
+    responses={200: {"content": {"application/json": {}, "application/octet-stream": {}, "text/plain": {}}}}
+)
+async def get_review_profile(
+    review_id: str,
+    format: str = Query("json", pattern="^(json|pstats|collapsed)$"),
+    x_admin_token: Optional[str] = Header(None)
+):
+    """Download the profile of a review created with `profile: true`
+
+    - json: wall time, top functions by cumulative and self time, peak traced memory, top allocation sites
+    - pstats: binary stats file for `python -m pstats` or snakeviz
+    - collapsed: folded stacks (microseconds) for flamegraph.pl / speedscope
+    """
+    require_profiling_access(x_admin_token)
     review = storage.get_review(review_id)
     if not review:
         raise HTTPException(status_code=404, detail="Review not found")
+    profile = (review.metrics or {}).get("profile")
+    if profile is None:
+        raise HTTPException(status_code=404, detail="No profile was recorded for this review")
 
-    return ReviewResult(
-        review_id=review.id,
-        status=review.status,
-        results=review.results or {},
-        created_at=review.created_at,
-        completed_at=review.completed_at
+    if format == "pstats":
+        return Response(
+            pstats_bytes(profile),
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="review-{review_id}.pstats"'}
+        )
+    if format == "collapsed":
+        return PlainTextResponse(profile["collapsed"])
+    return {key: value for key, value in profile.items() if key not in ("pstats", "collapsed")}
+
+@app.get(
+    "/api/v1/review/{review_id}",
+    response_model=None,
+    responses={200: {"model": ReviewResult, "content": {"application/msgpack": {}}}}
+)
+async def get_review_status(
+    review_id: str,
+    request: Request,
+    fields: Optional[str] = Query(None, description="Comma-separated result paths, e.g. security.vulnerabilities,summary")
+):
+    """Get code review results
+
+    The payload is encoded directly (orjson) instead of going through response-model validation,
+    so large results stay cheap; its shape is `ReviewResult`. `fields` limits `results` to the given dotted paths. The body is
+    MessagePack when `Accept: application/msgpack` is sent, and zstd/gzip compressed per
+    `Accept-Encoding`.
+    """
+    review = storage.get_review(review_id)
+    if not review:
+        raise HTTPException(status_code=404, detail="Review not found")
+
+    payload = {
+        "review_id": review.id,
+        "status": review.status,
+        "results": project_results(without_finding_details(review.results or {}), parse_fields(fields)),
+        "created_at": review.created_at,
+        "completed_at": review.completed_at,
+        "agent_status": review.agent_status,
+        "trace": (review.metrics or {}).get("trace")
+    }
+    return payload_encoder.response(
+        payload, request.headers.get("accept"), request.headers.get("accept-encoding")
     )
 
 @app.get("/api/v1/health")
@@ -80,59 +542,310 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
 
+@app.get("/api/v1/cache/stats")
+async def cache_stats():
+    """Result cache hit/miss/eviction counters"""
+    if result_cache is None:
+        return {"backend": "none"}
+    return result_cache.stats()
+
+@app.get("/api/v1/storage/stats")
+async def storage_stats():
+    """Retained review count/bytes and eviction counters of the review store"""
+    return storage.stats()
+
+@app.get("/api/v1/events/stats")
+async def events_stats():
+    """Progress event channels, subscribers and publish counters"""
+    return event_broker.stats()
+
+@app.get("/api/v1/queue/stats")
+async def queue_stats():
+    """Review job queue depth, in-flight jobs and counters"""
+    return review_queue.stats()
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Prometheus text exposition of node/parse/queue/storage latency, findings and component gauges"""
+    return PlainTextResponse(review_metrics.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/api/v1/ready")
+async def readiness_check():
+    """Readiness check endpoint (워크플로우 컴파일/워밍업 완료 여부)"""
+    if not getattr(app.state, "workflow_ready", False):
+        raise HTTPException(status_code=503, detail="Review workflow is warming up")
+
+    return {
+        "status": "ready",
+        "workflow_mode": settings.workflow_mode,
+        "analysis_executor": settings.analysis_executor,
+        "workflow_compile_ms": round(app.state.workflow_compile_ms, 2),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
 # Background Processing
-async def process_code_review(review_id: str, code: str, filename: str, language: str):
+async def process_code_review(review_id: str, code: str, filename: str, language: str,
+                              cache_key: Optional[str] = None, full_findings: bool = False, profile: bool = False,
+                              enqueued_at: Optional[float] = None):
     """Process code review in background"""
     logger.info(f"Processing review {review_id}")
+    trace = ReviewTrace(review_id)
+    analysis_started = time.time()
+    if enqueued_at is not None:
+        trace.add("queue_wait", enqueued_at, analysis_started)
+    event_broker.publish(review_id, "review_started", {"current_phase": "starting"})
+    completion_status: Dict[str, bool] = {}
+    agent_status = {node: "pending" for node in REVIEW_NODES}
+    partial_results: Dict[str, Any] = {}
+    storage.update_review(review_id, agent_status=dict(agent_status))
+
+    def on_progress(event: Dict[str, Any]):
+        # 단계 완료 여부는 누적하여 전송
+        completion_status.update(event["completion_status"])
+        node = event["node"]
+        agent_status[node] = "completed" if event["completion_status"].get(node) else "failed"
+
+        # 끝난 에이전트의 결과를 바로 저장하여 전체 완료 전에도 조회 가능
+        if "result_key" in event:
+            partial_results[event["result_key"]] = event["result"]
+        partial_results["summary"] = dict(completion_status)
+        storage.update_review(review_id, results=dict(partial_results), agent_status=dict(agent_status))
+
+        published = {**event, "completion_status": dict(completion_status)}
+        if "result" in event:
+            published["result"] = without_finding_details({"result": event["result"]})["result"]
+        event_broker.publish(review_id, "node_completed", published)
 
     try:
-        workflow = build_code_review_workflow()
-        
-        initial_state = CodeReviewState(
-            code_content=code,
-            file_path=filename,
-            language=language,
-            current_phase="starting",
-            completion_status={
-                "security": False,
-                "performance": False,
-                "bug_detection": False,
-                "test_generation": False,
-                "consolidation": False
-            },
-            error_log=[],
-            confidence_scores={},
-            messages=[]
-        )
-
-        config = {"configurable": {"thread_id": review_id}}
-        final_state = await workflow.ainvoke(initial_state, config)
-
-        # Update storage with results
-        results = {
-            "security": final_state.get("security_findings").dict() if final_state.get("security_findings") else None,
-            "performance": final_state.get("performance_metrics").dict() if final_state.get("performance_metrics") else None,
-            "bugs": final_state.get("bug_analysis").dict() if final_state.get("bug_analysis") else None,
-            "tests": final_state.get("test_suggestions").dict() if final_state.get("test_suggestions") else None,
-            "summary": final_state.get("completion_status")
-        }
+        # 시작 시 컴파일된 워크플로우로 분석 (process 모드에서는 워커 프로세스에서 실행)
+        results, run_metrics = await analysis_executor.run_with_metrics(
+            code, filename, language, on_progress=on_progress, full_findings=full_findings, profile=profile
+        )
 
+        trace.extend(run_metrics["spans"])
+        with trace.span("storage_write"):
+            storage.update_review(
+                review_id,
+                status="completed",
+                completed_at=datetime.utcnow(),
+                results=results,
+                agent_status=agent_status_from_summary(results["summary"])
+            )
+        # 타임라인(저장 시간 포함)과 프로파일링 요청이면 프로파일을 리뷰 계측값으로 저장
+        store_review_trace(
+            review_id,
+            trace.to_dict(status="completed", findings=trace.finding_count()),
+            {"profile": run_metrics["profile"]} if profile else {}
+        )
+
+        await store_cached_results(cache_key, results)
+
+        event_broker.close(review_id, "review_completed", {"status": "completed", "summary": results["summary"]})
+        logger.info(f"Review {review_id} completed successfully")
+
+    except Exception as e:
+        logger.error(f"Review {review_id} failed: {e}")
+        # 이미 끝난 에이전트의 결과는 남기고, 끝나지 않은 에이전트는 실패로 표시
+        storage.update_review(
+            review_id,
+            status="failed",
+            results={**partial_results, "error": str(e)},
+            agent_status={node: "failed" if state == "pending" else state for node, state in agent_status.items()}
+        )
+        trace.add("analysis", analysis_started, time.time(), error=str(e))
+        store_review_trace(review_id, trace.to_dict(status="failed"))
+        event_broker.close(review_id, "review_failed", {"status": "failed", "error": str(e)})
+
+def store_review_trace(review_id: str, trace: Dict[str, Any], extra_metrics: Optional[Dict[str, Any]] = None):
+    """리뷰 타임라인을 계측값(metrics)으로 저장하고, 설정되어 있으면 OTLP 수집기로 전송 (이벤트 루프는 막지 않음)"""
+    storage.update_review(review_id, metrics={"trace": trace, **(extra_metrics or {})})
+    if trace_exporter is not None:
+        asyncio.get_running_loop().run_in_executor(None, trace_exporter.export, trace)
+
+def batch_results(file_results: Dict[str, Dict[str, Any]], total: int,
+                  project: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """배치 리뷰의 저장용 결과 (파일별 결과 + 진행 상황 + 집계 리포트 + 프로젝트 호출 그래프)"""
+    aggregate = aggregate_file_results(file_results)
+    results = {
+        "files": file_results,
+        "progress": {
+            "total": total,
+            "completed": aggregate["files_completed"],
+            "failed": aggregate["files_failed"]
+        },
+        "aggregate": aggregate
+    }
+    if project is not None:
+        results["project"] = project
+    return results
+
+async def build_project_index(files: List[Tuple[str, str]], on_disk: bool = False,
+                              include_graph: bool = False) -> Optional[ProjectSnapshot]:
+    """여러 파일 리뷰의 프로젝트 심볼 테이블 (분석 실행기에서 생성, 비활성화되었거나 실패하면 파일 단위 분석만)
+
+    on_disk이면 files는 (경로, 소스를 풀어 둔 로컬 파일 경로)이다.
+    """
+    if not settings.project_analysis:
+        return None
+    try:
+        snapshot = await analysis_executor.build_project(files, on_disk, include_graph)
+    except Exception as e:
+        project_index_stats["failed"] += 1
+        logger.error(f"Project index build failed: {e}")
+        return None
+    project_index_stats["builds"] += 1
+    project_index_stats["modules"] += snapshot.summary["modules"]
+    project_index_stats["reused"] += snapshot.summary["summaries_reused"]
+    project_index_stats["computed"] += snapshot.summary["summaries_computed"]
+    return snapshot
+
+async def analyze_with_cache(code: str, filename: str, language: str,
+                             project_index: Optional[ProjectSnapshot] = None) -> Dict[str, Any]:
+    """결과 캐시를 먼저 조회하고, 없으면 분석 실행기로 분석 후 캐시에 저장
+
+    project_index가 주어지면 이 파일이 import한 다른 모듈의 함수 요약을 함께 넘긴다.
+    """
+    project = project_index.context_for(filename) if project_index is not None else None
+    cache_key, cached_results = await lookup_cached_results(code, language, project=project)
+    if cached_results is not None:
+        return cached_results
+
+    results = await analysis_executor.run(code, filename, language, project=project)
+    await store_cached_results(cache_key, results)
+    return results
+
+async def process_batch_review(review_id: str, files: List[ReviewFile], concurrency: int):
+    """Process batch review in background"""
+    logger.info(f"Processing batch review {review_id} ({len(files)} files, concurrency {concurrency})")
+    event_broker.publish(review_id, "review_started", {"current_phase": "starting", "files": len(files)})
+
+    semaphore = asyncio.Semaphore(concurrency)
+    file_results: Dict[str, Dict[str, Any]] = {
+        review_file.filename: {"status": "pending"} for review_file in files
+    }
+    # 모듈 간 호출을 따라가기 위한 프로젝트 심볼 테이블 (모듈 요약은 내용 해시로 캐시되어 리뷰 사이에 재사용)
+    project_index = await build_project_index([
+        (review_file.filename, review_file.code) for review_file in files
+        if (review_file.language or "python") == "python"
+    ], include_graph=True)
+    project = project_index.report(include_graph=True) if project_index is not None else None
+
+    async def review_one(review_file: ReviewFile):
+        async with semaphore:
+            file_results[review_file.filename] = {"status": "processing"}
+            try:
+                results = await analyze_with_cache(
+                    review_file.code, review_file.filename, review_file.language, project_index
+                )
+                file_results[review_file.filename] = {"status": "completed", "results": results}
+            except Exception as e:
+                logger.error(f"Batch review {review_id} file {review_file.filename} failed: {e}")
+                file_results[review_file.filename] = {"status": "failed", "results": {"error": str(e)}}
+
+        # 파일 하나가 끝날 때마다 부분 결과 저장 (폴링 시 바로 확인 가능)
+        partial = batch_results(dict(file_results), len(files), project)
+        storage.update_review(review_id, results=partial)
+        event_broker.publish(review_id, "file_completed", {
+            "filename": review_file.filename,
+            "status": file_results[review_file.filename]["status"],
+            "progress": partial["progress"]
+        })
+
+    try:
+        await asyncio.gather(*[review_one(review_file) for review_file in files])
         storage.update_review(
             review_id,
             status="completed",
             completed_at=datetime.utcnow(),
-            results=results
+            results=batch_results(file_results, len(files), project)
         )
+        event_broker.close(review_id, "review_completed", {"status": "completed"})
+        logger.info(f"Batch review {review_id} completed")
 
-        logger.info(f"Review {review_id} completed successfully")
+    except Exception as e:
+        logger.error(f"Batch review {review_id} failed: {e}")
+        storage.update_review(
+            review_id,
+            status="failed",
+            results={"error": str(e)}
+        )
+        event_broker.close(review_id, "review_failed", {"status": "failed", "error": str(e)})
+
+async def process_archive_review(review_id: str, archive, archive_format: str, language: str):
+    """Process archive review in background"""
+    logger.info(f"Processing archive review {review_id} ({archive_format})")
+    findings_path = findings_file_path(settings.ingest_output_dir, review_id)
+    event_broker.publish(review_id, "review_started", {"current_phase": "starting"})
+
+    def on_progress(snapshot: Dict[str, Any]):
+        storage.update_review(
+            review_id,
+            files_count=snapshot["files_reviewed"],
+            results={"ingestion": snapshot, "findings_url": f"/api/v1/review/{review_id}/findings"}
+        )
+        event_broker.publish(review_id, "ingestion_progress", {
+            key: value for key, value in snapshot.items() if key != "aggregate"
+        })
+
+    extensions = [extension.strip() for extension in settings.ingest_extensions.split(",") if extension.strip()]
+    extracted = None
+    try:
+        project_index = None
+        if settings.project_analysis and language == "python":
+            # 아카이브를 한 번만 읽어 리뷰 대상 파일을 디스크에 풀고, 그 파일들로 워커에서 프로젝트 심볼 테이블 생성
+            extracted = await asyncio.to_thread(
+                extract_archive, archive, archive_format, extensions,
+                settings.ingest_max_file_bytes, settings.project_index_max_bytes
+            )
+            if extracted is None:
+                logger.info(f"Archive review {review_id}: sources exceed the project index limit, reviewing files only")
+            else:
+                project_index = await build_project_index(extracted.local_files(PROJECT_EXTENSIONS), on_disk=True)
+
+        async def analyze(code: str, filename: str, language: str) -> Dict[str, Any]:
+            return await analyze_with_cache(code, filename, language, project_index)
+
+        summary = await ingest_archive(
+            archive,
+            archive_format,
+            analyze,
+            findings_path,
+            extensions=extensions,
+            max_file_bytes=settings.ingest_max_file_bytes,
+            concurrency=max(settings.ingest_concurrency, 1),
+            language=language,
+            on_progress=on_progress,
+            extracted=extracted
+        )
+        storage.update_review(
+            review_id,
+            status="completed",
+            completed_at=datetime.utcnow(),
+            files_count=summary["files_reviewed"],
+            results={
+                "ingestion": summary,
+                "findings_url": f"/api/v1/review/{review_id}/findings",
+                **({"project": project_index.report()} if project_index is not None else {})
+            }
+        )
+        logger.info(
+            f"Archive review {review_id} completed: {summary['files_reviewed']} files, "
+            f"{summary['files_per_second']} files/sec, peak RSS delta {summary['peak_rss_delta_mb']} MB"
+        )
+        event_broker.close(review_id, "review_completed", {"status": "completed", "files_reviewed": summary["files_reviewed"]})
 
     except Exception as e:
-        logger.error(f"Review {review_id} failed: {e}")
+        logger.error(f"Archive review {review_id} failed: {e}")
         storage.update_review(
             review_id,
             status="failed",
             results={"error": str(e)}
         )
+        event_broker.close(review_id, "review_failed", {"status": "failed", "error": str(e)})
+    finally:
+        if extracted is not None:
+            extracted.close()
+        archive.close()
 
 # Main Entry Point
 if __name__ == "__main__":
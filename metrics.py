@@ -0,0 +1,202 @@
+import resource
+import threading
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# 노드/리뷰 단위 지연 시간 버킷(초)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# 저장소 호출은 대부분 마이크로초 단위
+STORAGE_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05, 0.1)
+# 노드 단위 RSS 증가량 버킷(바이트, 64KB ~ 1GB)
+MEMORY_BUCKETS = tuple(float(64 * 1024 * 4 ** exponent) for exponent in range(8))
+
+# 결과 섹션 -> 발견 항목 목록 키 (심각도가 있으면 심각도별로 집계)
+FINDING_LISTS = {
+    "security": "vulnerabilities",
+    "performance": "issues",
+    "bugs": "bugs",
+    "tests": "test_cases"
+}
+
+# 수집 시점에 읽는 구성 요소 통계: 이름 -> stats() dict를 돌려주는 함수
+StatsFn = Callable[[], Dict[str, Any]]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """레이블별 누적 카운터"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = list(self._values.items())
+        for labels, value in values:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """레이블별 히스토그램
+
+    관측 시에는 버킷 위치 하나만 증가시키고(누적 합은 수집 시 계산) 관측 비용을 작게 유지한다.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # 레이블 -> [버킷별 개수(+Inf 포함), 합계]
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = [(labels, list(counts), total) for labels, (counts, total) in self._series.items()]
+        for labels, counts, total in snapshot:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                le = bound if bound == "+Inf" else _format_value(bound)
+                bucket_labels = _format_labels(self.labelnames, labels, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+def current_rss_bytes() -> Optional[int]:
+    """현재 RSS (Linux /proc 기준, 없으면 None)"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class ReviewMetrics:
+    """리뷰 파이프라인 계측값과 Prometheus 텍스트 형식 출력
+
+    노드/파싱/저장소/대기열 시간은 발생 시점에 히스토그램 버킷 하나만 증가시키고, 대기열 깊이나
+    캐시 적중 같은 상태값은 수집(scrape) 시점에만 각 구성 요소의 stats()를 읽어 만든다.
+    """
+
+    def __init__(self):
+        self.node_duration = Histogram(
+            "code_review_node_duration_seconds", "Workflow node (agent) execution time", ("node",)
+        )
+        self.node_rss_delta = Histogram(
+            "code_review_node_rss_delta_bytes", "Process RSS growth while a workflow node (agent) ran",
+            ("node",), MEMORY_BUCKETS
+        )
+        self.parse_duration = Histogram("code_review_parse_duration_seconds", "Source parse and context build time")
+        self.analysis_duration = Histogram(
+            "code_review_analysis_duration_seconds", "Whole-review analysis time by outcome", ("status",)
+        )
+        self.queue_wait = Histogram("code_review_queue_wait_seconds", "Time a review job waited in the queue")
+        self.storage_duration = Histogram(
+            "code_review_storage_operation_seconds", "Storage call latency", ("operation",), STORAGE_BUCKETS
+        )
+        self.findings = Counter(
+            "code_review_findings_total", "Findings reported by analyses", ("section", "severity")
+        )
+        self._metrics = [
+            self.node_duration, self.node_rss_delta, self.parse_duration, self.analysis_duration,
+            self.queue_wait, self.storage_duration, self.findings
+        ]
+        self._components: Dict[str, StatsFn] = {}
+
+    def register_component(self, name: str, stats: StatsFn) -> None:
+        """수집 시 stats()의 숫자 항목을 code_review_<name>_<key> 게이지로 출력"""
+        self._components[name] = stats
+
+    def observe_analysis(self, status: str, seconds: float, run_metrics: Optional[Dict[str, Any]] = None) -> None:
+        """리뷰 1건의 분석 결과 계측 (run_metrics: workflow.collect_review_metrics)"""
+        self.analysis_duration.observe(seconds, status)
+        if not run_metrics:
+            return
+        for node, node_seconds in run_metrics.get("node_seconds", {}).items():
+            self.node_duration.observe(node_seconds, node)
+        for node, rss_delta in run_metrics.get("node_rss_delta_bytes", {}).items():
+            self.node_rss_delta.observe(rss_delta, node)
+        if run_metrics.get("parse_seconds") is not None:
+            self.parse_duration.observe(run_metrics["parse_seconds"])
+
+    def observe_findings(self, results: Dict[str, Any]) -> None:
+        for section, list_key in FINDING_LISTS.items():
+            findings = (results.get(section) or {}).get(list_key) or []
+            severities: Dict[str, int] = {}
+            for finding in findings:
+                severity = str(finding.get("severity", "none")).lower()
+                severities[severity] = severities.get(severity, 0) + 1
+            for severity, count in severities.items():
+                self.findings.inc(section, severity, amount=count)
+
+    def observe_queue_wait(self, seconds: float) -> None:
+        self.queue_wait.observe(seconds)
+
+    def observe_storage(self, operation: str, seconds: float) -> None:
+        self.storage_duration.observe(seconds, operation)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식(0.0.4)"""
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+
+        for component, stats in self._components.items():
+            try:
+                values = stats()
+            except Exception as e:
+                lines.append(f"# {component} stats unavailable: {e}")
+                continue
+            for key, value in values.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                name = f"code_review_{component}_{key}"
+                lines.append(f"# TYPE {name} gauge")
+                lines.append(f"{name} {_format_value(value)}")
+
+        rss = current_rss_bytes()
+        if rss is not None:
+            lines.extend(["# TYPE process_resident_memory_bytes gauge", f"process_resident_memory_bytes {rss}"])
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        lines.extend(["# TYPE process_max_resident_memory_bytes gauge", f"process_max_resident_memory_bytes {peak}"])
+        return "\n".join(lines) + "\n"
+
+
+# 전역 계측 인스턴스
+review_metrics = ReviewMetrics()
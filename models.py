@@ -1,6 +1,16 @@
-from typing import Dict, List, Optional
-from pydantic import BaseModel
+import operator
+from typing import Annotated, Any, Dict, List, Optional
+from pydantic import BaseModel, Field
 from datetime import datetime
+from sqlalchemy import Column, DateTime, Index, Integer, LargeBinary, String, Text
+from sqlalchemy.orm import declarative_base
+
+# SQLAlchemy Base (database.create_tables에서 사용)
+Base = declarative_base()
+
+def merge_dicts(left: Optional[dict], right: Optional[dict]) -> dict:
+    """LangGraph 상태 리듀서: 병렬 노드가 반환한 dict 변경분을 병합"""
+    return {**(left or {}), **(right or {})}
 
 # Pydantic Models
 class SecurityVulnerability(BaseModel):
@@ -42,11 +52,24 @@ class BugReport(BaseModel):
     fix_suggestion: str
     confidence: float
 
+# 규칙 하나로 묶은 발견 항목 요약 (line_ranges: [시작, 끝] 연속 라인 범위)
+class FindingGroup(BaseModel):
+    rule: str
+    count: int
+    first_line: int
+    last_line: int
+    line_ranges: List[List[int]]
+    # 규칙별 상한으로 항목/범위 일부가 생략되었는지
+    truncated: bool = False
+
 class BugAnalysis(BaseModel):
     bugs: List[BugReport]
     code_smells: List[str]
     maintainability_score: float
     technical_debt_items: List[str]
+    finding_groups: List[FindingGroup] = []
+    # 전체 상세 모드에서만: 규칙 -> 잘리지 않은 전체 항목 (별도 페이지 조회)
+    finding_details: Optional[Dict[str, List[str]]] = None
 
 class TestSuggestion(BaseModel):
     test_type: str
@@ -62,6 +85,8 @@ class TestGenerationResult(BaseModel):
     setup_instructions: str
     coverage_estimate: float
     framework_recommendations: List[str]
+    finding_groups: List[FindingGroup] = []
+    finding_details: Optional[Dict[str, List[str]]] = None
 
 class CodeReviewState(BaseModel):
     code_content: str
@@ -72,21 +97,50 @@ class CodeReviewState(BaseModel):
     bug_analysis: Optional[BugAnalysis] = None
     test_suggestions: Optional[TestGenerationResult] = None
     current_phase: str
-    completion_status: Dict[str, bool]
-    error_log: List[str]
-    confidence_scores: Dict[str, float]
-    messages: List[str]
+    # 병렬 fan-out 노드들이 동시에 갱신하는 필드는 리듀서로 병합
+    completion_status: Annotated[Dict[str, bool], merge_dicts]
+    error_log: Annotated[List[str], operator.add]
+    confidence_scores: Annotated[Dict[str, float], merge_dicts]
+    messages: Annotated[List[str], operator.add]
+    # 노드별 실행 시간(초, 계측용)
+    node_seconds: Annotated[Dict[str, float], merge_dicts] = Field(default_factory=dict)
+    # 노드 실행 전후의 프로세스 RSS 증가량(바이트, 계측용. 병렬 모드에서는 동시에 실행된 노드의 할당이 함께 잡힘)
+    node_rss_delta_bytes: Annotated[Dict[str, int], merge_dicts] = Field(default_factory=dict)
+    # 노드별 실행 스팬 (tracing.make_span, 시작/종료 시각과 발견 항목 수)
+    node_spans: Annotated[Dict[str, Dict[str, Any]], merge_dicts] = Field(default_factory=dict)
+    # 규칙별 발견 항목 상한 (0이면 무제한)과 전체 상세 보관 여부
+    finding_cap: int = 0
+    full_findings: bool = False
+    # 리뷰 단위 공유 분석 컨텍스트 (analyzers.context.AnalysisContext, 직렬화 제외)
+    analysis_context: Optional[Any] = Field(default=None, exclude=True, repr=False)
 
 # API Models
 class ReviewRequest(BaseModel):
     code: str
     filename: str
     language: Optional[str] = "python"
+    user_id: Optional[str] = "default"
+    # 규칙별 상한으로 잘린 항목까지 보관 (GET /api/v1/review/{id}/details로 페이지 조회)
+    full_findings: Optional[bool] = False
+    # cProfile/tracemalloc으로 실행하여 프로파일을 리뷰와 함께 저장 (GET /api/v1/review/{id}/profile)
+    profile: Optional[bool] = False
+
+class ReviewFile(BaseModel):
+    code: str
+    filename: str
+    language: Optional[str] = "python"
+
+class BatchReviewRequest(BaseModel):
+    files: List[ReviewFile]
+    max_concurrency: Optional[int] = None
+    user_id: Optional[str] = "default"
 
 class ReviewResponse(BaseModel):
     review_id: str
     status: str
     message: str
+    queue_position: Optional[int] = None
+    estimated_wait_seconds: Optional[float] = None
 
 class ReviewResult(BaseModel):
     review_id: str
@@ -94,6 +148,31 @@ class ReviewResult(BaseModel):
     results: dict
     created_at: datetime
     completed_at: Optional[datetime] = None
+    # 에이전트(노드)별 상태: pending / completed / failed
+    agent_status: Optional[Dict[str, str]] = None
+    # 스팬 타임라인: 대기열 대기, 파싱, 노드별 실행, 직렬화, 저장 (tracing.ReviewTrace)
+    trace: Optional[Dict[str, Any]] = None
+
+class ReviewSummary(BaseModel):
+    review_id: str
+    user_id: str
+    status: str
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+    files_count: int = 1
+
+class ReviewListResponse(BaseModel):
+    reviews: List[ReviewSummary]
+    next_cursor: Optional[str] = None
+
+class FindingDetailPage(BaseModel):
+    review_id: str
+    section: str
+    rule: str
+    total: int
+    offset: int
+    items: List[str]
+    next_offset: Optional[int] = None
 
 # In-memory storage model
 class InMemoryCodeReview(BaseModel):
@@ -104,4 +183,24 @@ class InMemoryCodeReview(BaseModel):
     completed_at: Optional[datetime] = None
     results: Optional[dict] = None
     metrics: Optional[dict] = None
-    files_count: int = 1
\ No newline at end of file
+    files_count: int = 1
+    agent_status: Optional[Dict[str, str]] = None
+
+# Persistent storage model (SQLite)
+class CodeReviewRecord(Base):
+    __tablename__ = "code_reviews"
+    __table_args__ = (
+        # 사용자+상태 필터의 최신순 목록 조회용 복합 인덱스
+        Index("ix_code_reviews_user_status_created", "user_id", "status", "created_at"),
+    )
+
+    id = Column(String, primary_key=True)
+    user_id = Column(String, nullable=False, index=True)
+    status = Column(String, nullable=False, index=True)
+    created_at = Column(DateTime, nullable=False, index=True)
+    completed_at = Column(DateTime, nullable=True)
+    files_count = Column(Integer, nullable=False, default=1)
+    # results/metrics는 zlib 압축 JSON으로 저장
+    results = Column(LargeBinary, nullable=True)
+    metrics = Column(LargeBinary, nullable=True)
+    agent_status = Column(Text, nullable=True)  # JSON
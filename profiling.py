@@ -0,0 +1,154 @@
+import base64
+import cProfile
+import marshal
+import os
+import threading
+import time
+import tracemalloc
+from typing import Any, Dict, List, Tuple
+
+# pstats 키: (파일, 라인, 함수명)
+FunctionKey = Tuple[str, int, str]
+
+# 접힌 스택(collapsed) 출력에서 따라갈 최대 호출 깊이
+MAX_STACK_DEPTH = 64
+
+# tracemalloc은 프로세스 전역이므로 한 프로세스에서 프로파일링 실행은 한 번에 하나씩
+_profile_lock = threading.Lock()
+
+
+def _short_path(filename: str) -> str:
+    """마지막 두 경로 요소만 남김 (예: pydantic/main.py)"""
+    parts = filename.replace(os.sep, "/").split("/")
+    return "/".join(parts[-2:])
+
+
+def _function_label(key: FunctionKey) -> str:
+    filename, lineno, name = key
+    if filename == "~":
+        # 내장 함수 ("<built-in method ...>")
+        return name
+    return f"{_short_path(filename)}:{lineno}({name})"
+
+
+def collapsed_stacks(stats: Dict[FunctionKey, tuple]) -> str:
+    """pstats 통계를 flamegraph용 접힌 스택 텍스트("a;b;c 마이크로초")로 변환
+
+    cProfile은 호출자-피호출자 간선만 기록하므로 근사치이다. 호출자가 없는 함수에서 시작해 간선을
+    따라가며, 경로의 누적 시간을 호출자 누적 시간 중 그 간선이 차지하는 비율로 나누어 배분한다
+    (전체 합은 보존). 1마이크로초 미만 경로와 재귀 호출은 더 따라가지 않는다.
+    """
+    callees: Dict[FunctionKey, List[Tuple[FunctionKey, float, float]]] = {}
+    roots = []
+    for function, (_, _, _, cumulative_time, callers) in stats.items():
+        if not callers:
+            roots.append((function, cumulative_time))
+        for caller, (_, _, edge_self, edge_cumulative) in callers.items():
+            callees.setdefault(caller, []).append((function, edge_self, edge_cumulative))
+
+    lines: Dict[str, int] = {}
+    # (경로, 이 경로에서 마지막 함수의 누적 시간)
+    stack: List[Tuple[List[FunctionKey], float]] = [([root], cumulative) for root, cumulative in roots]
+    while stack:
+        path, path_cumulative = stack.pop()
+        function = path[-1]
+        total_cumulative = stats[function][3]
+        share = path_cumulative / total_cumulative if total_cumulative > 0 else 0.0
+        # 이 경로에 배분된 자체 시간
+        self_micros = int(stats[function][2] * share * 1_000_000)
+        if self_micros > 0:
+            key = ";".join(_function_label(frame) for frame in path)
+            lines[key] = lines.get(key, 0) + self_micros
+        if len(path) >= MAX_STACK_DEPTH:
+            continue
+        for callee, _, edge_cumulative in callees.get(function, []):
+            callee_cumulative = edge_cumulative * share
+            if callee not in path and callee_cumulative >= 1e-6:
+                stack.append((path + [callee], callee_cumulative))
+    return "\n".join(f"{key} {micros}" for key, micros in sorted(lines.items())) + "\n"
+
+
+class ReviewProfiler:
+    """리뷰 1건을 cProfile과 tracemalloc으로 감싸 실행하고 결과를 저장 가능한 dict로 만든다
+
+    cProfile은 활성화한 스레드만 기록하므로, 감싼 구간의 노드는 같은 스레드에서 실행되어야 한다
+    (sequential 워크플로우). tracemalloc은 프로세스 전체 할당을 추적하므로 같은 프로세스의
+    프로파일링 실행은 순서대로 처리한다.
+    """
+
+    def __init__(self, top: int = 30, traceback_frames: int = 1):
+        self.top = top
+        self.traceback_frames = traceback_frames
+        self._profiler = cProfile.Profile()
+        self._started_tracemalloc = False
+        self._wall_seconds = 0.0
+        self._snapshot = None
+        self._peak_bytes = 0
+
+    def __enter__(self) -> "ReviewProfiler":
+        _profile_lock.acquire()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.traceback_frames)
+            self._started_tracemalloc = True
+        tracemalloc.reset_peak()
+        self._start = time.perf_counter()
+        self._profiler.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._profiler.disable()
+        self._wall_seconds = time.perf_counter() - self._start
+        self._peak_bytes = tracemalloc.get_traced_memory()[1]
+        self._snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>")
+        ))
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        _profile_lock.release()
+
+    def report(self) -> Dict[str, Any]:
+        """요약(상위 함수/할당 위치)과 원본(pstats marshal, 접힌 스택)
+
+        top_cumulative는 호출 경로 전체 비용, top_self는 함수 자체 비용(파싱, 분석 규칙, 모델 생성 등
+        실제로 시간을 쓰는 곳) 순위이다.
+        """
+        self._profiler.create_stats()
+        stats = self._profiler.stats
+
+        def ranked(index: int) -> List[Dict[str, Any]]:
+            entries = sorted(stats.items(), key=lambda item: item[1][index], reverse=True)[:self.top]
+            return [
+                {
+                    "function": _function_label(function),
+                    "calls": calls,
+                    "self_seconds": round(total_time, 6),
+                    "cumulative_seconds": round(cumulative_time, 6)
+                }
+                for function, (_, calls, total_time, cumulative_time, _) in entries
+            ]
+
+        allocations = [
+            {
+                "location": f"{_short_path(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+                "size_bytes": stat.size,
+                "count": stat.count
+            }
+            for stat in self._snapshot.statistics("lineno")[:self.top]
+        ]
+        return {
+            "wall_seconds": round(self._wall_seconds, 6),
+            "top_cumulative": ranked(3),
+            "top_self": ranked(2),
+            "peak_traced_bytes": self._peak_bytes,
+            "top_allocations": allocations,
+            # pstats.Stats로 읽을 수 있는 marshal 형식 (JSON 저장을 위해 base64)
+            "pstats": base64.b64encode(marshal.dumps(stats)).decode("ascii"),
+            "collapsed": collapsed_stacks(stats)
+        }
+
+
+def pstats_bytes(profile: Dict[str, Any]) -> bytes:
+    """저장된 프로파일에서 pstats 파일 내용 복원 (python -m pstats, snakeviz 등으로 열 수 있음)"""
+    return base64.b64decode(profile["pstats"])
+
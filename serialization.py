@@ -0,0 +1,144 @@
+import gzip
+import json
+import logging
+from datetime import date, time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi.responses import Response
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 표준 json 사용
+    orjson = None
+
+try:
+    import ormsgpack
+except ImportError:  # 선택 의존성: 없으면 MessagePack 응답 미지원
+    ormsgpack = None
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성: 없으면 gzip만 협상
+    zstandard = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+
+def parse_fields(fields: Optional[str]) -> List[Tuple[str, ...]]:
+    """쉼표로 구분된 점 표기 경로 목록 파싱 (예: "security.vulnerabilities,summary")"""
+    if not fields:
+        return []
+    return [tuple(part for part in path.strip().split(".") if part) for path in fields.split(",") if path.strip()]
+
+
+def _project(value: Any, paths: List[Tuple[str, ...]]) -> Any:
+    # 경로가 끝난(빈) 항목이 있으면 해당 값 전체를 포함
+    if any(not path for path in paths):
+        return value
+    if isinstance(value, list):
+        return [_project(item, paths) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    children: Dict[str, List[Tuple[str, ...]]] = {}
+    for path in paths:
+        children.setdefault(path[0], []).append(path[1:])
+    return {key: _project(value[key], rest) for key, rest in children.items() if key in value}
+
+
+def project_results(results: Dict[str, Any], fields: Sequence[Tuple[str, ...]]) -> Dict[str, Any]:
+    """결과 dict에서 요청한 경로만 남긴 사본 (목록 안의 dict에는 남은 경로를 원소마다 적용, 없는 경로는 생략)"""
+    if not fields:
+        return results
+    return _project(results, list(fields))
+
+
+def _encode_default(value: Any) -> Any:
+    """기본 직렬화가 지원하지 않는 값: 날짜/시각은 ISO 8601 (orjson과 같은 형식), 그 밖에는 문자열"""
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_json(data: Any) -> bytes:
+    """JSON 직렬화 (orjson이 있으면 사용). datetime은 설치된 패키지와 무관하게 ISO 8601 문자열"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_encode_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":"), default=_encode_default, ensure_ascii=False).encode("utf-8")
+
+
+def encode_msgpack(data: Any) -> bytes:
+    return ormsgpack.packb(data, default=_encode_default, option=ormsgpack.OPT_NON_STR_KEYS)
+
+
+def _accepted(header: Optional[str]) -> Dict[str, float]:
+    """Accept / Accept-Encoding 헤더를 {값: q} 로 파싱"""
+    accepted: Dict[str, float] = {}
+    for item in (header or "").split(","):
+        value, _, params = item.strip().partition(";")
+        if not value:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, number = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(number)
+                except ValueError:
+                    quality = 0.0
+        accepted[value.strip().lower()] = quality
+    return accepted
+
+
+def negotiate_media_type(accept: Optional[str]) -> str:
+    """MessagePack을 명시적으로 요청했고 지원 가능하면 MessagePack, 아니면 JSON"""
+    if ormsgpack is None:
+        return JSON_MEDIA_TYPE
+    accepted = _accepted(accept)
+    for media_type in MSGPACK_MEDIA_TYPES:
+        if accepted.get(media_type, 0) > 0 and accepted[media_type] >= accepted.get(JSON_MEDIA_TYPE, 0):
+            return MSGPACK_MEDIA_TYPES[0]
+    return JSON_MEDIA_TYPE
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """응답 압축 방식 선택 (같은 q면 zstd 우선, 지원 불가 시 None)"""
+    accepted = _accepted(accept_encoding)
+    candidates = ["zstd", "gzip"] if zstandard is not None else ["gzip"]
+    best, best_quality = None, 0.0
+    for encoding in candidates:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class PayloadEncoder:
+    """결과 페이로드를 협상된 형식(JSON/MessagePack)과 압축(zstd/gzip)으로 인코딩"""
+
+    def __init__(self, min_compress_bytes: int = 1024, gzip_level: int = 6, zstd_level: int = 3):
+        self.min_compress_bytes = min_compress_bytes
+        self.gzip_level = gzip_level
+        self.zstd_level = zstd_level
+        self._zstd = zstandard.ZstdCompressor(level=zstd_level) if zstandard is not None else None
+
+    def compress(self, body: bytes, encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+        """min_compress_bytes 미만이면 압축하지 않음"""
+        if encoding is None or len(body) < self.min_compress_bytes:
+            return body, None
+        if encoding == "zstd":
+            return self._zstd.compress(body), "zstd"
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0), "gzip"
+
+    def response(self, data: Any, accept: Optional[str] = None,
+                 accept_encoding: Optional[str] = None) -> Response:
+        media_type = negotiate_media_type(accept)
+        body = encode_msgpack(data) if media_type != JSON_MEDIA_TYPE else encode_json(data)
+        body, encoding = self.compress(body, negotiate_encoding(accept_encoding))
+        headers = {"Vary": "Accept, Accept-Encoding"}
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type=media_type, headers=headers)
@@ -1,18 +1,209 @@
-from typing import Dict, Optional
-from models import InMemoryCodeReview
-from datetime import datetime
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.sqlite import insert
+from config import settings
+from database import create_sqlite_engine, migrate_schema
+from ingestion import remove_findings_file
+from metrics import review_metrics
+from models import Base, InMemoryCodeReview, CodeReviewRecord
+from datetime import datetime, timezone
+import base64
+import json
+import logging
 import threading
+import time
+import zlib
+
+logger = logging.getLogger(__name__)
+
+STORAGE_TYPES = ("memory", "sharded", "sqlite")
+
+FINISHED_STATUSES = ("completed", "failed")
+
+# 이탈 콜백: (제거된 리뷰, 사유) -> None. 사유는 max_entries / max_bytes / ttl
+EvictionCallback = Callable[[InMemoryCodeReview, str], None]
+# 삭제 콜백: 리뷰 ID -> None. 리뷰가 저장소에서 완전히 사라질 때(삭제, 보조 저장소 없이 제거) 호출
+RemovalCallback = Callable[[str], None]
+
+
+# 리뷰 크기 근사: 고정 크기 필드 + 결과/메트릭 필드의 직렬화 크기
+REVIEW_BASE_BYTES = 256
+REVIEW_PAYLOAD_FIELDS = ("results", "metrics")
+
+
+def estimate_payload_bytes(payload: Optional[dict]) -> int:
+    """결과/메트릭 필드 하나의 직렬화 크기"""
+    return len(json.dumps(payload, separators=(",", ":"), default=str)) if payload else 0
+
+
+# 인덱스 키: (created_at, 리뷰 ID) 오름차순 정렬
+IndexKey = Tuple[datetime, str]
+
+
+def encode_cursor(key: IndexKey) -> str:
+    """페이지 커서 (마지막으로 반환한 리뷰의 인덱스 키)"""
+    created_at, review_id = key
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{review_id}".encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> IndexKey:
+    """잘못된 커서는 ValueError"""
+    try:
+        created_at, review_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|", 1)
+        return datetime.fromisoformat(created_at), review_id
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """저장된 시각(naive UTC)과 비교할 수 있도록 변환"""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class ReviewIndex:
+    """user_id / status / created_at 보조 인덱스
+
+    필터 조합(전체, 사용자, 상태, 사용자+상태)마다 (created_at, 리뷰 ID) 정렬 목록을 유지하므로
+    목록 조회는 이진 탐색 후 한 페이지만 잘라내어 전체 리뷰 수가 아닌 페이지 크기에 비례한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._all: List[IndexKey] = []
+        self._by_user: Dict[str, List[IndexKey]] = {}
+        self._by_status: Dict[str, List[IndexKey]] = {}
+        self._by_user_status: Dict[Tuple[str, str], List[IndexKey]] = {}
+
+    def _buckets(self, review: InMemoryCodeReview):
+        return (
+            (self._by_user, review.user_id),
+            (self._by_status, review.status),
+            (self._by_user_status, (review.user_id, review.status))
+        )
+
+    def add(self, review: InMemoryCodeReview) -> None:
+        with self._lock:
+            self._insert(review)
+
+    def _insert(self, review: InMemoryCodeReview) -> None:
+        key = (review.created_at, review.id)
+        insort(self._all, key)
+        for index, bucket in self._buckets(review):
+            insort(index.setdefault(bucket, []), key)
+
+    @staticmethod
+    def _discard(keys: List[IndexKey], key: IndexKey) -> None:
+        position = bisect_left(keys, key)
+        if position < len(keys) and keys[position] == key:
+            del keys[position]
+
+    def remove(self, review: InMemoryCodeReview) -> None:
+        with self._lock:
+            self._delete(review)
+
+    def _delete(self, review: InMemoryCodeReview) -> None:
+        key = (review.created_at, review.id)
+        self._discard(self._all, key)
+        for index, bucket in self._buckets(review):
+            keys = index.get(bucket)
+            if keys is not None:
+                self._discard(keys, key)
+                if not keys:
+                    del index[bucket]
+
+    def update(self, old: InMemoryCodeReview, new: InMemoryCodeReview) -> None:
+        """상태(또는 사용자)가 바뀐 경우에만 인덱스 이동 (중간 상태가 page()에 보이지 않도록 한 번의 잠금으로)"""
+        if old.status != new.status or old.user_id != new.user_id:
+            with self._lock:
+                self._delete(old)
+                self._insert(new)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._all.clear()
+            self._by_user.clear()
+            self._by_status.clear()
+            self._by_user_status.clear()
+
+    def page(self, user_id: Optional[str] = None, status: Optional[str] = None,
+             created_after: Optional[datetime] = None, created_before: Optional[datetime] = None,
+             limit: int = 20, cursor: Optional[IndexKey] = None) -> Tuple[List[str], Optional[IndexKey]]:
+        """최신순 한 페이지의 리뷰 ID와 다음 페이지 커서 키 (마지막 페이지면 None)
+
+        created_after는 포함, created_before는 제외 경계이다.
+        """
+        with self._lock:
+            if user_id and status:
+                keys = self._by_user_status.get((user_id, status), [])
+            elif user_id:
+                keys = self._by_user.get(user_id, [])
+            elif status:
+                keys = self._by_status.get(status, [])
+            else:
+                keys = self._all
+
+            low = bisect_left(keys, (created_after, "")) if created_after else 0
+            high = len(keys)
+            if created_before:
+                high = bisect_left(keys, (created_before, ""))
+            if cursor:
+                high = min(high, bisect_left(keys, cursor))
+            start = max(low, high - limit)
+            page = keys[start:high][::-1]
+
+        next_key = page[-1] if page and start > low else None
+        return [review_id for _, review_id in page], next_key
+
 
 class InMemoryStorage:
-    """인메모리 저장소 클래스"""
+    """인메모리 저장소 클래스
+
+    완료(또는 실패)된 리뷰에는 보존 정책을 적용한다.
+    - max_entries: 보관할 완료 리뷰 최대 개수
+    - max_bytes: 결과 크기로 근사한 최대 보관 바이트
+    - ttl_seconds: completed_at 이후 보관 시간
+    한도를 넘으면 가장 오래 조회되지 않은 리뷰부터 제거하고(LRU), on_evict 콜백으로 넘겨
+    보조 저장소로 옮길 수 있다. secondary가 있으면 메모리에 없는 리뷰는 보조 저장소에서 조회한다.
+    (0이면 해당 한도 없음) 리뷰가 삭제되거나 보조 저장소 없이 제거되면 on_remove로 리뷰 ID를 알려
+    리뷰에 딸린 파일(아카이브 리뷰의 JSONL 결과)을 정리하게 한다.
+    """
+
+    backend = "memory"
     
-    def __init__(self):
+    def __init__(self, max_entries: int = 0, max_bytes: int = 0, ttl_seconds: int = 0,
+                 on_evict: Optional[EvictionCallback] = None, secondary=None,
+                 on_remove: Optional[RemovalCallback] = None):
         self._storage: Dict[str, InMemoryCodeReview] = {}
         self._lock = threading.Lock()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.on_evict = on_evict
+        self.secondary = secondary
+        self.on_remove = on_remove
+        # 보존 정책 상태 (완료 리뷰만): 리뷰 ID -> 근사 바이트 (조회 순서 LRU), 리뷰 ID -> completed_at (완료 순서)
+        self._retained: "OrderedDict[str, int]" = OrderedDict()
+        # 리뷰 ID -> 결과/메트릭 필드별 근사 바이트 (바뀐 필드만 다시 재기 위해 보관)
+        self._payload_bytes: Dict[str, Dict[str, int]] = {}
+        self._completion_order: "OrderedDict[str, datetime]" = OrderedDict()
+        self._retained_bytes = 0
+        self._retention_lock = threading.Lock()
+        self._evictions = {"max_entries": 0, "max_bytes": 0, "ttl": 0}
+        self._evict_callback_errors = 0
+        # 목록 조회용 보조 인덱스 (리뷰 잠금 안에서 갱신)
+        self._index = ReviewIndex()
+
+    def _lock_for(self, review_id: str) -> threading.Lock:
+        return self._lock
     
     def create_review(self, review_id: str, user_id: str = "default") -> InMemoryCodeReview:
         """새로운 코드 리뷰 생성"""
-        with self._lock:
+        with self._lock_for(review_id):
             review = InMemoryCodeReview(
                 id=review_id,
                 user_id=user_id,
@@ -20,32 +211,42 @@ class InMemoryStorage:
                 created_at=datetime.utcnow()
             )
             self._storage[review_id] = review
+            self._index.add(review)
             return review
     
     def get_review(self, review_id: str) -> Optional[InMemoryCodeReview]:
         """코드 리뷰 조회"""
-        with self._lock:
-            return self._storage.get(review_id)
+        with self._lock_for(review_id):
+            review = self._storage.get(review_id)
+        return self._after_read(review_id, review)
     
     def update_review(self, review_id: str, **kwargs) -> Optional[InMemoryCodeReview]:
         """코드 리뷰 업데이트"""
-        with self._lock:
-            review = self._storage.get(review_id)
+        with self._lock_for(review_id):
+            current = review = self._storage.get(review_id)
             if review:
                 # Pydantic 모델의 copy 메서드 사용하여 업데이트
                 updated_data = review.dict()
                 updated_data.update(kwargs)
-                self._storage[review_id] = InMemoryCodeReview(**updated_data)
-                return self._storage[review_id]
-            return None
+                review = InMemoryCodeReview(**updated_data)
+                self._storage[review_id] = review
+                self._index.update(current, review)
+        if review:
+            self._track(review, kwargs)
+            return review
+        # 제거와 경합한 갱신은 이탈 콜백이 보조 저장소로 옮긴 리뷰에 반영
+        return self.secondary.update_review(review_id, **kwargs) if self.secondary is not None else None
     
     def delete_review(self, review_id: str) -> bool:
         """코드 리뷰 삭제"""
-        with self._lock:
-            if review_id in self._storage:
-                del self._storage[review_id]
-                return True
-            return False
+        with self._lock_for(review_id):
+            review = self._storage.pop(review_id, None)
+            if review is not None:
+                self._index.remove(review)
+        self._untrack(review_id)
+        if review is not None:
+            self._removed(review_id)
+        return review is not None
     
     def list_reviews(self, user_id: Optional[str] = None) -> list:
         """코드 리뷰 목록 조회"""
@@ -59,6 +260,545 @@ class InMemoryStorage:
         """모든 데이터 삭제 (테스트용)"""
         with self._lock:
             self._storage.clear()
+            self._index.clear()
+        self._clear_retention()
+
+    def list_reviews_page(self, user_id: Optional[str] = None, status: Optional[str] = None,
+                          created_after: Optional[datetime] = None, created_before: Optional[datetime] = None,
+                          limit: int = 20, cursor: Optional[str] = None) -> Tuple[List[InMemoryCodeReview], Optional[str]]:
+        """인덱스를 이용한 최신순 페이지 조회 (비용은 페이지 크기에 비례)
+
+        반환값은 (리뷰 목록, 다음 페이지 커서). 잘못된 커서는 ValueError.
+        """
+        review_ids, next_key = self._index.page(
+            user_id=user_id,
+            status=status,
+            created_after=to_naive_utc(created_after),
+            created_before=to_naive_utc(created_before),
+            limit=limit,
+            cursor=decode_cursor(cursor) if cursor else None
+        )
+        # 인덱스 조회 이후 제거된 리뷰는 건너뜀
+        reviews = [review for review in map(self._storage.get, review_ids) if review is not None]
+        return reviews, encode_cursor(next_key) if next_key else None
+
+    def _removed(self, review_id: str) -> None:
+        if self.on_remove is not None:
+            try:
+                self.on_remove(review_id)
+            except Exception as e:
+                logger.error(f"Removal callback failed for review {review_id}: {e}")
+
+    def close(self):
+        """종료 시 보조 저장소 정리"""
+        if self.secondary is not None:
+            self.secondary.close()
+
+    # 보존 정책
+    def _after_read(self, review_id: str, review: Optional[InMemoryCodeReview]) -> Optional[InMemoryCodeReview]:
+        """조회 후처리: TTL 만료 확인, LRU 순서 갱신, 메모리에 없으면 보조 저장소 조회"""
+        if review is None:
+            return self.secondary.get_review(review_id) if self.secondary is not None else None
+
+        if self.ttl_seconds and review.completed_at is not None and \
+                (datetime.utcnow() - review.completed_at).total_seconds() > self.ttl_seconds:
+            self._evict([(review_id, "ttl")])
+            return self.secondary.get_review(review_id) if self.secondary is not None else None
+
+        # 조회 경로는 보존 잠금을 기다리지 않음 (경합 중이면 LRU 갱신만 건너뜀)
+        if self._retention_lock.acquire(blocking=False):
+            try:
+                if review_id in self._retained:
+                    self._retained.move_to_end(review_id)
+            finally:
+                self._retention_lock.release()
+        return review
+
+    def _track(self, review: InMemoryCodeReview, changed: Iterable[str] = REVIEW_PAYLOAD_FIELDS) -> None:
+        """완료된 리뷰를 보존 정책 대상에 등록하고 한도를 넘은 리뷰 제거
+
+        결과/메트릭 크기는 리뷰가 처음 완료될 때 재고, 이후 갱신에서는 바뀐 필드(changed)만 다시 잰다.
+        바이트 한도가 없으면 결과 직렬화 비용을 들여 크기를 재지 않는다.
+        """
+        if review.status not in FINISHED_STATUSES:
+            return
+        sizes = None
+        if self.max_bytes:
+            known = self._payload_bytes.get(review.id)
+            sizes = {
+                field: known[field] if known is not None and field not in changed
+                else estimate_payload_bytes(getattr(review, field))
+                for field in REVIEW_PAYLOAD_FIELDS
+            }
+        size = REVIEW_BASE_BYTES + sum(sizes.values()) if sizes is not None else 0
+        with self._retention_lock:
+            if sizes is not None:
+                self._payload_bytes[review.id] = sizes
+            self._retained_bytes += size - self._retained.get(review.id, 0)
+            self._retained[review.id] = size
+            self._retained.move_to_end(review.id)
+            if review.completed_at is not None and review.id not in self._completion_order:
+                self._completion_order[review.id] = review.completed_at
+            victims = self._select_victims()
+        self._evict(victims)
+
+    def _untrack(self, review_id: str) -> None:
+        with self._retention_lock:
+            self._forget(review_id)
+
+    def _forget(self, review_id: str) -> None:
+        """호출자가 _retention_lock을 잡은 상태에서 보존 정책 상태에서 리뷰 제거"""
+        self._retained_bytes -= self._retained.pop(review_id, 0)
+        self._payload_bytes.pop(review_id, None)
+        self._completion_order.pop(review_id, None)
+
+    def _clear_retention(self) -> None:
+        with self._retention_lock:
+            self._retained.clear()
+            self._payload_bytes.clear()
+            self._completion_order.clear()
+            self._retained_bytes = 0
+
+    def _select_victims(self) -> List[tuple]:
+        """호출자가 _retention_lock을 잡은 상태에서 제거할 (리뷰 ID, 사유) 목록 선택"""
+        victims = []
+
+        def drop(review_id: str, reason: str) -> None:
+            self._forget(review_id)
+            victims.append((review_id, reason))
+
+        if self.ttl_seconds:
+            now = datetime.utcnow()
+            while self._completion_order:
+                review_id, completed_at = next(iter(self._completion_order.items()))
+                if (now - completed_at).total_seconds() <= self.ttl_seconds:
+                    break
+                drop(review_id, "ttl")
+        while self.max_entries and len(self._retained) > self.max_entries:
+            drop(next(iter(self._retained)), "max_entries")
+        while self.max_bytes and self._retained_bytes > self.max_bytes and self._retained:
+            drop(next(iter(self._retained)), "max_bytes")
+        return victims
+
+    def _evict(self, victims: List[tuple]) -> None:
+        """선택된 리뷰를 저장소에서 제거하고 이탈 콜백 호출 (보존 잠금 밖에서 호출)
+
+        이탈 콜백은 리뷰 잠금 안에서 호출하므로, 같은 리뷰의 갱신은 메모리에서 리뷰를 찾거나
+        콜백이 옮긴 보조 저장소에서 찾는다 (제거와 경합한 갱신이 사라지지 않음).
+        """
+        for review_id, reason in victims:
+            with self._lock_for(review_id):
+                review = self._storage.pop(review_id, None)
+                if review is None:
+                    continue
+                self._index.remove(review)
+                if self.on_evict is not None:
+                    try:
+                        self.on_evict(review, reason)
+                    except Exception as e:
+                        self._evict_callback_errors += 1
+                        logger.error(f"Eviction callback failed for review {review_id}: {e}")
+            with self._retention_lock:
+                self._forget(review_id)
+                self._evictions[reason] += 1
+            if self.secondary is None:
+                self._removed(review_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """보관 중인 리뷰 수/근사 바이트와 사유별 제거 횟수"""
+        with self._retention_lock:
+            retained_entries = len(self._retained)
+            retained_bytes = self._retained_bytes
+        return {
+            "backend": self.backend,
+            "entries": len(self._storage),
+            "retained_entries": retained_entries,
+            "retained_bytes": retained_bytes if self.max_bytes else None,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "evictions": dict(self._evictions),
+            "evict_callback_errors": self._evict_callback_errors,
+            "secondary": self.secondary.stats() if self.secondary is not None else None
+        }
+
+
+class ShardedInMemoryStorage(InMemoryStorage):
+    """잠금 분할(lock striping) 인메모리 저장소 클래스
+
+    - 쓰기: 리뷰 ID 해시로 고른 샤드 잠금만 잡으므로 서로 다른 리뷰의 갱신은 경합하지 않음
+    - 읽기: 저장된 모델은 교체만 되고 변경되지 않으므로(copy-on-write) 잠금 없이 조회
+    - 갱신: 얕은 복사 후 바뀐 필드만 검증하여 전체 모델(결과 포함)을 다시 만들거나 검증하지 않음
+    """
+
+    backend = "sharded"
+
+    def __init__(self, shards: int = 16, **retention):
+        super().__init__(**retention)
+        self._locks = [threading.Lock() for _ in range(max(shards, 1))]
+
+    def _lock_for(self, review_id: str) -> threading.Lock:
+        return self._locks[hash(review_id) % len(self._locks)]
+
+    def get_review(self, review_id: str) -> Optional[InMemoryCodeReview]:
+        """코드 리뷰 조회 (잠금 없음: dict 조회는 원자적이고 저장된 모델은 불변으로 취급)"""
+        return self._after_read(review_id, self._storage.get(review_id))
+
+    def update_review(self, review_id: str, **kwargs) -> Optional[InMemoryCodeReview]:
+        """코드 리뷰 업데이트 (바뀐 필드만 검증한 새 모델로 교체)"""
+        with self._lock_for(review_id):
+            current = review = self._storage.get(review_id)
+            if review:
+                review = review.model_copy()
+                for field, value in kwargs.items():
+                    InMemoryCodeReview.__pydantic_validator__.validate_assignment(review, field, value)
+                self._storage[review_id] = review
+                self._index.update(current, review)
+        if review:
+            self._track(review, kwargs)
+            return review
+        # 제거와 경합한 갱신은 이탈 콜백이 보조 저장소로 옮긴 리뷰에 반영
+        return self.secondary.update_review(review_id, **kwargs) if self.secondary is not None else None
+
+    def list_reviews(self, user_id: Optional[str] = None) -> list:
+        """코드 리뷰 목록 조회 (dict 복사는 원자적이므로 잠금 없음)"""
+        reviews = list(self._storage.copy().values())
+        if user_id:
+            reviews = [r for r in reviews if r.user_id == user_id]
+        return reviews
+
+    def clear_all(self):
+        """모든 데이터 삭제 (테스트용)"""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            self._storage.clear()
+            self._index.clear()
+        finally:
+            for lock in self._locks:
+                lock.release()
+        self._clear_retention()
+
+
+def compress_blob(value: Optional[dict]) -> Optional[bytes]:
+    """dict를 압축 JSON 바이트로 변환"""
+    if value is None:
+        return None
+    return zlib.compress(json.dumps(value, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def decompress_blob(blob: Optional[bytes]) -> Optional[dict]:
+    if blob is None:
+        return None
+    return json.loads(zlib.decompress(blob))
+
+
+class SQLiteStorage:
+    """SQLite(WAL) 영구 저장소 클래스
+
+    쓰기는 리뷰별 최신 상태만 대기 목록에 모아 두었다가 (진행 상황처럼 잦은 갱신은 하나로 합쳐짐)
+    백그라운드 스레드가 flush_interval마다 또는 batch_size개가 쌓이면 한 트랜잭션으로 기록한다.
+    조회는 대기 목록을 먼저 확인하므로 기록 전에도 최신 상태가 보인다.
+    results/metrics는 zlib 압축 JSON으로 저장한다. 삭제된 리뷰는 on_remove로 알린다.
+    """
+
+    def __init__(self, database_url: str, flush_interval: float = 0.05, batch_size: int = 256,
+                 on_remove: Optional[RemovalCallback] = None):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.on_remove = on_remove
+        self._engine = create_sqlite_engine(database_url)
+        Base.metadata.create_all(bind=self._engine)
+        migrate_schema(self._engine)
+
+        table = CodeReviewRecord.__table__
+        self._table = table
+        self._select = select(table)
+        self._delete = delete(table)
+        upsert = insert(table)
+        self._upsert = upsert.on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_={column.name: upsert.excluded[column.name] for column in table.columns if column.name != "id"}
+        )
+
+        # 리뷰 ID -> 기록 대기 중인 최신 상태 (None이면 삭제 대기)
+        self._pending: Dict[str, Optional[InMemoryCodeReview]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._stats = {"batches": 0, "rows_written": 0, "rows_deleted": 0, "updates_coalesced": 0}
+        self._writer = threading.Thread(target=self._write_loop, name="sqlite-storage-writer", daemon=True)
+        self._writer.start()
+
+    # 변환
+    @staticmethod
+    def _to_row(review: InMemoryCodeReview) -> Dict[str, Any]:
+        return {
+            "id": review.id,
+            "user_id": review.user_id,
+            "status": review.status,
+            "created_at": review.created_at,
+            "completed_at": review.completed_at,
+            "files_count": review.files_count,
+            "results": compress_blob(review.results),
+            "metrics": compress_blob(review.metrics),
+            "agent_status": json.dumps(review.agent_status) if review.agent_status is not None else None
+        }
+
+    @staticmethod
+    def _from_row(row) -> InMemoryCodeReview:
+        # 저장소가 직접 기록한 행이므로 재검증 없이 모델 생성
+        return InMemoryCodeReview.model_construct(
+            id=row.id,
+            user_id=row.user_id,
+            status=row.status,
+            created_at=row.created_at,
+            completed_at=row.completed_at,
+            files_count=row.files_count,
+            results=decompress_blob(row.results),
+            metrics=decompress_blob(row.metrics),
+            agent_status=json.loads(row.agent_status) if row.agent_status is not None else None
+        )
+
+    def _load(self, review_id: str) -> Optional[InMemoryCodeReview]:
+        with self._engine.connect() as connection:
+            row = connection.execute(self._select.where(self._table.c.id == review_id)).first()
+        return self._from_row(row) if row is not None else None
+
+    # 쓰기 대기 목록
+    def _stage(self, review_id: str, review: Optional[InMemoryCodeReview]) -> None:
+        """호출자가 self._lock을 잡은 상태에서 기록 대기 목록에 반영"""
+        if review_id in self._pending:
+            self._stats["updates_coalesced"] += 1
+        self._pending[review_id] = review
+        if len(self._pending) >= self.batch_size:
+            self._wake.set()
+
+    def _write_loop(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"SQLite storage flush failed: {e}")
+
+    def flush(self) -> int:
+        """대기 중인 변경을 한 트랜잭션으로 기록하고 기록한 건수 반환"""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch = dict(self._pending)
+
+            upserts = [self._to_row(review) for review in batch.values() if review is not None]
+            deletes = [review_id for review_id, review in batch.items() if review is None]
+            with self._engine.begin() as connection:
+                if upserts:
+                    connection.execute(self._upsert, upserts)
+                if deletes:
+                    connection.execute(self._delete.where(self._table.c.id.in_(deletes)))
+
+            with self._lock:
+                # 기록하는 동안 다시 바뀌지 않은 항목만 대기 목록에서 제거
+                for review_id, review in batch.items():
+                    if review_id in self._pending and self._pending[review_id] is review:
+                        del self._pending[review_id]
+                self._stats["batches"] += 1
+                self._stats["rows_written"] += len(upserts)
+                self._stats["rows_deleted"] += len(deletes)
+            return len(batch)
+
+    # 저장소 인터페이스 (InMemoryStorage와 동일)
+    def create_review(self, review_id: str, user_id: str = "default") -> InMemoryCodeReview:
+        """새로운 코드 리뷰 생성"""
+        review = InMemoryCodeReview(
+            id=review_id,
+            user_id=user_id,
+            status="processing",
+            created_at=datetime.utcnow()
+        )
+        with self._lock:
+            self._stage(review_id, review)
+        return review
+
+    def get_review(self, review_id: str) -> Optional[InMemoryCodeReview]:
+        """코드 리뷰 조회"""
+        with self._lock:
+            if review_id in self._pending:
+                return self._pending[review_id]
+        return self._load(review_id)
+
+    def update_review(self, review_id: str, **kwargs) -> Optional[InMemoryCodeReview]:
+        """코드 리뷰 업데이트 (바뀐 필드만 검증한 새 모델을 기록 대기 목록에 반영)
+
+        DB 조회는 잠금 밖에서 한다. 조회하는 동안 기록(flush)이 있었으면 같은 리뷰의 다른 갱신이
+        그 사이 기록되었을 수 있으므로 다시 조회한다.
+        """
+        while True:
+            with self._lock:
+                if review_id in self._pending:
+                    return self._apply_update(review_id, self._pending[review_id], kwargs)
+                batches = self._stats["batches"]
+            loaded = self._load(review_id)
+            with self._lock:
+                if review_id not in self._pending and self._stats["batches"] == batches:
+                    return self._apply_update(review_id, loaded, kwargs)
+
+    def _apply_update(self, review_id: str, review: Optional[InMemoryCodeReview],
+                      changes: Dict[str, Any]) -> Optional[InMemoryCodeReview]:
+        """호출자가 self._lock을 잡은 상태에서 얕은 복사 후 바뀐 필드만 검증하여 기록 대기 목록에 반영"""
+        if review is None:
+            return None
+        review = review.model_copy()
+        for field, value in changes.items():
+            InMemoryCodeReview.__pydantic_validator__.validate_assignment(review, field, value)
+        self._stage(review_id, review)
+        return review
+
+    def put_review(self, review: InMemoryCodeReview) -> None:
+        """리뷰 전체를 그대로 저장 (인메모리 저장소에서 밀려난 리뷰 보관용)"""
+        with self._lock:
+            self._stage(review.id, review)
+
+    def delete_review(self, review_id: str) -> bool:
+        """코드 리뷰 삭제"""
+        with self._lock:
+            exists = self._pending[review_id] is not None if review_id in self._pending \
+                else self._load(review_id) is not None
+            if exists:
+                self._stage(review_id, None)
+        if exists and self.on_remove is not None:
+            try:
+                self.on_remove(review_id)
+            except Exception as e:
+                logger.error(f"Removal callback failed for review {review_id}: {e}")
+        return exists
+
+    def list_reviews(self, user_id: Optional[str] = None) -> List[InMemoryCodeReview]:
+        """코드 리뷰 목록 조회"""
+        self.flush()
+        query = self._select
+        if user_id:
+            query = query.where(self._table.c.user_id == user_id)
+        with self._engine.connect() as connection:
+            return [self._from_row(row) for row in connection.execute(query)]
+
+    def list_reviews_page(self, user_id: Optional[str] = None, status: Optional[str] = None,
+                          created_after: Optional[datetime] = None, created_before: Optional[datetime] = None,
+                          limit: int = 20, cursor: Optional[str] = None) -> Tuple[List[InMemoryCodeReview], Optional[str]]:
+        """(user_id, status, created_at) 인덱스를 이용한 키셋 페이지 조회 (결과 blob은 읽지 않음)"""
+        self.flush()
+        table = self._table
+        query = select(
+            table.c.id, table.c.user_id, table.c.status, table.c.created_at,
+            table.c.completed_at, table.c.files_count
+        )
+        if user_id:
+            query = query.where(table.c.user_id == user_id)
+        if status:
+            query = query.where(table.c.status == status)
+        if created_after:
+            query = query.where(table.c.created_at >= to_naive_utc(created_after))
+        if created_before:
+            query = query.where(table.c.created_at < to_naive_utc(created_before))
+        if cursor:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+            query = query.where(tuple_(table.c.created_at, table.c.id) < tuple_(cursor_created_at, cursor_id))
+        query = query.order_by(table.c.created_at.desc(), table.c.id.desc()).limit(limit + 1)
+
+        with self._engine.connect() as connection:
+            rows = connection.execute(query).all()
+        reviews = [InMemoryCodeReview.model_construct(**row._mapping) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor((reviews[-1].created_at, reviews[-1].id))
+        return reviews, next_cursor
+
+    def clear_all(self):
+        """모든 데이터 삭제 (테스트용)"""
+        with self._flush_lock, self._lock:
+            self._pending.clear()
+            with self._engine.begin() as connection:
+                connection.execute(self._delete)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"backend": "sqlite", "pending": len(self._pending), **self._stats}
+
+    def close(self):
+        """기록 스레드를 멈추고 남은 변경을 모두 기록"""
+        self._closed = True
+        self._wake.set()
+        self._writer.join()
+        self.flush()
+        self._engine.dispose()
+
+
+def create_storage(storage_type: str):
+    """설정된 백엔드의 저장소 생성"""
+    if storage_type not in STORAGE_TYPES:
+        raise ValueError(f"Unknown storage type: {storage_type} (expected one of {STORAGE_TYPES})")
+    # 저장소에서 사라진 아카이브 리뷰의 JSONL 결과 파일 삭제
+    on_remove = partial(remove_findings_file, settings.ingest_output_dir)
+    if storage_type == "sqlite":
+        return SQLiteStorage(
+            settings.database_url,
+            flush_interval=settings.storage_flush_interval_ms / 1000,
+            batch_size=settings.storage_batch_size,
+            on_remove=on_remove
+        )
+
+    retention = {
+        "max_entries": settings.retention_max_entries,
+        "max_bytes": settings.retention_max_bytes,
+        "ttl_seconds": settings.retention_ttl_seconds,
+        "on_remove": on_remove
+    }
+    if settings.retention_spill_url:
+        # 메모리에서 밀려난 리뷰를 SQLite로 옮기고, 이후 조회는 SQLite에서 처리
+        spill = SQLiteStorage(
+            settings.retention_spill_url,
+            flush_interval=settings.storage_flush_interval_ms / 1000,
+            batch_size=settings.storage_batch_size
+        )
+        retention.update(on_evict=lambda review, reason: spill.put_review(review), secondary=spill)
+
+    if storage_type == "sharded":
+        return ShardedInMemoryStorage(settings.storage_shards, **retention)
+    return InMemoryStorage(**retention)
+
+class TimedStorage:
+    """저장소 호출마다 소요 시간을 observe(operation, seconds)로 보고하는 래퍼 (그 외 속성은 그대로 위임)"""
+
+    OPERATIONS = (
+        "create_review", "get_review", "update_review", "delete_review",
+        "list_reviews", "list_reviews_page", "put_review"
+    )
+
+    def __init__(self, inner, observe: Callable[[str, float], None]):
+        self._inner = inner
+        self._observe = observe
+        for operation in self.OPERATIONS:
+            method = getattr(inner, operation, None)
+            if method is not None:
+                setattr(self, operation, self._timed(operation, method))
+
+    def _timed(self, operation: str, method):
+        observe = self._observe
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                observe(operation, time.perf_counter() - start)
+        timed.__name__ = operation
+        return timed
+
+    def __getattr__(self, name: str):
+        return getattr(self._inner, name)
 
-# 전역 저장소 인스턴스
-storage = InMemoryStorage()
\ No newline at end of file
+# 전역 저장소 인스턴스 (호출 지연 시간은 metrics.review_metrics에 기록)
+storage = TimedStorage(create_storage(settings.storage_type), review_metrics.observe_storage)
\ No newline at end of file
@@ -0,0 +1,91 @@
+import textwrap
+
+import pytest
+
+from agents import merge_chunk_results
+from analyzers.chunking import chunk_file_path, split_module
+from benchmarks.corpus import generate_python_source
+from executor import analyze_module_taint, chunk_speedup_bound, run_review_with_metrics
+from workflow import ANALYSIS_AGENTS, merged_progress_events
+
+CROSS_CHUNK_SOURCE = textwrap.dedent("""
+    import os
+    import sys
+
+    TARGET = sys.argv[1]
+
+
+    def run_cmd(cmd):
+        # TODO: quote the command
+        os.system(cmd)
+
+
+    def slow_sum(values):
+        total = 0
+        for value in values:
+            for other in values:
+                total += value * other
+        return total
+
+
+    def handler():
+        run_cmd(input())
+        print(eval(TARGET))
+
+
+    class Worker:
+        def start(self):
+            run_cmd(TARGET)
+""")
+
+
+def review(source, finding_cap=0, full_findings=False):
+    return run_review_with_metrics(
+        source, "module.py", "python", "sequential", finding_cap=finding_cap, full_findings=full_findings
+    )[0]
+
+
+def chunked_review(source, chunks, finding_cap=0, full_findings=False):
+    parts = split_module(source, chunks)
+    assert len(parts) == chunks
+    results = [
+        run_review_with_metrics(
+            part.source, chunk_file_path("module.py", part.index), "python", "sequential",
+            full_findings=True, shared_lines=part.shared_lines, taint=False
+        )[0]
+        for part in parts
+    ]
+    taint_vulnerabilities, _ = analyze_module_taint(source)
+    return merge_chunk_results(results, source, finding_cap, full_findings, taint_vulnerabilities)
+
+
+@pytest.mark.parametrize("finding_cap, full_findings", [(0, False), (3, False), (3, True)])
+def test_chunked_results_match_whole_file(finding_cap, full_findings):
+    source = generate_python_source(20 * 1024)
+    assert chunked_review(source, 3, finding_cap, full_findings) == review(source, finding_cap, full_findings)
+
+
+def test_flows_across_chunk_boundaries_are_kept():
+    merged = chunked_review(CROSS_CHUNK_SOURCE, 3)
+    assert merged == review(CROSS_CHUNK_SOURCE)
+    flows = {(v["type"], v["line_number"]) for v in merged["security"]["vulnerabilities"]}
+    assert {("Command Injection", 10), ("Code Injection", 23)} <= flows
+
+
+def test_merged_progress_events_follow_agent_names():
+    merged = chunked_review(CROSS_CHUNK_SOURCE, 2)
+    events = merged_progress_events(merged)
+    assert [event["node"] for event in events] == [*ANALYSIS_AGENTS, "consolidation"]
+    keys = {event["node"]: event.get("result_key") for event in events}
+    assert keys == {"security": "security", "performance": "performance", "bug_detection": "bugs",
+                    "test_generation": "tests", "consolidation": None}
+    assert all(event["result"] == merged[event["result_key"]] for event in events if "result_key" in event)
+
+
+def test_chunk_speedup_bound():
+    # 흐름 분석 비중이 크면 나머지 단계를 나누어도 흐름 분석 시간이 하한
+    assert chunk_speedup_bound(0.5, 3, 4) == pytest.approx(2.0)
+    assert chunk_speedup_bound(0.8, 3, 4) == pytest.approx(1.25)
+    # 흐름 분석이 작으면 청크 수 또는 워커 수가 한계
+    assert chunk_speedup_bound(0.1, 3, 4) == pytest.approx(1 / 0.3)
+    assert chunk_speedup_bound(0.0, 2, 2) == pytest.approx(2.0)
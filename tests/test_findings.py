@@ -0,0 +1,59 @@
+from analyzers.findings import FindingCollector
+
+
+def collect(findings, cap=0, keep_details=False):
+    collector = FindingCollector(cap, keep_details)
+    for rule, lineno in findings:
+        collector.add(rule, lineno, f"{rule} at line {lineno}")
+    return collector
+
+
+def test_groups_merge_consecutive_lines():
+    collector = collect([("todo", 3), ("todo", 4), ("todo", 5), ("todo", 9), ("todo", 4), ("print", 7)])
+    todo, printed = collector.groups()
+    assert (todo.rule, todo.count, todo.first_line, todo.last_line) == ("todo", 5, 3, 9)
+    assert todo.line_ranges == [[3, 5], [9, 9]]
+    assert not todo.truncated
+    assert (printed.rule, printed.count, printed.line_ranges) == ("print", 1, [[7, 7]])
+
+
+def test_cap_truncates_items_and_ranges_but_not_counts():
+    collector = collect([("todo", line) for line in (1, 3, 5, 6)] + [("print", 10)], cap=2)
+    assert collector.items == ["todo at line 1", "todo at line 3", "print at line 10"]
+    assert collector.total == 5
+    todo, printed = collector.groups()
+    assert todo.count == 4
+    assert todo.line_ranges == [[1, 1], [3, 3]]
+    assert (todo.first_line, todo.last_line) == (1, 6)
+    assert todo.truncated
+    assert not printed.truncated
+
+
+def test_details_only_in_full_mode():
+    assert collect([("todo", 1)]).details() is None
+    details = collect([("todo", 1), ("todo", 2)], cap=1, keep_details=True).details()
+    assert details == {"todo": ["todo at line 1", "todo at line 2"]}
+
+
+def test_merged_matches_single_collector():
+    findings = [("todo", 1), ("todo", 2), ("print", 4), ("todo", 3), ("todo", 8), ("print", 9), ("todo", 9)]
+    chunks = [findings[:3], findings[3:]]
+    parts = [
+        (part.groups(), part.details())
+        for part in (collect(chunk, keep_details=True) for chunk in chunks)
+    ]
+    whole = collect(findings, cap=2, keep_details=True)
+    merged = FindingCollector.merged(parts, cap=2, keep_details=True, rule_order=("todo", "print"))
+    assert merged.total == whole.total
+    assert [group.model_dump() for group in merged.groups()] == [group.model_dump() for group in whole.groups()]
+    assert merged.details() == whole.details()
+    # 청크 경계(라인 2-3)를 넘는 연속 라인은 하나의 범위로 합쳐짐
+    assert merged.groups()[0].line_ranges == [[1, 3], [8, 9]]
+    assert merged.items == ["todo at line 1", "todo at line 2", "print at line 4", "print at line 9"]
+
+
+def test_merged_orders_unknown_rules_last():
+    parts = [(collect([("extra", 1), ("todo", 2)]).groups(), None)]
+    merged = FindingCollector.merged(parts, rule_order=("todo",))
+    assert [group.rule for group in merged.groups()] == ["todo", "extra"]
+    assert merged.items == []
@@ -0,0 +1,88 @@
+import re
+
+from metrics import ReviewMetrics
+
+SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{([a-zA-Z_][a-zA-Z0-9_]*="[^"]*"(,[a-zA-Z_][a-zA-Z0-9_]*="[^"]*")*)?\})? (\S+)$')
+
+
+def parse(text):
+    """노출 형식을 (메트릭 유형, 샘플 목록)으로 읽으면서 형식을 검사"""
+    assert text.endswith("\n")
+    types, samples = {}, []
+    for line in text.splitlines():
+        if line.startswith("# TYPE "):
+            _, _, name, kind = line.split(" ")
+            assert name not in types, f"duplicate TYPE for {name}"
+            types[name] = kind
+        elif line.startswith("#"):
+            continue
+        else:
+            match = SAMPLE.match(line)
+            assert match, f"malformed sample line: {line!r}"
+            name, labels, value = match.group(1), match.group(3) or "", match.group(5)
+            base = re.sub(r"_(bucket|sum|count)$", "", name)
+            family = base if types.get(base) == "histogram" else name
+            assert family in types, f"sample {name} before its TYPE line"
+            samples.append((name, dict(re.findall(r'(\w+)="([^"]*)"', labels)), float(value)))
+    return types, samples
+
+
+def test_histogram_buckets_are_cumulative():
+    metrics = ReviewMetrics()
+    for seconds in (0.0005, 0.01, 0.01, 3.0, 100.0):
+        metrics.node_duration.observe(seconds, "security")
+    types, samples = parse(metrics.render())
+    assert types["code_review_node_duration_seconds"] == "histogram"
+
+    buckets = [
+        (labels["le"], value) for name, labels, value in samples
+        if name == "code_review_node_duration_seconds_bucket" and labels["node"] == "security"
+    ]
+    assert buckets[-1] == ("+Inf", 5)
+    counts = [value for _, value in buckets]
+    assert counts == sorted(counts)
+    # le는 경계값을 포함
+    assert dict(buckets)["0.01"] == 3
+    assert dict(buckets)["0.001"] == 1
+    assert dict(buckets)["30"] == 4
+
+    totals = {name: value for name, labels, value in samples if labels.get("node") == "security"}
+    assert totals["code_review_node_duration_seconds_count"] == 5
+    assert abs(totals["code_review_node_duration_seconds_sum"] - 103.0205) < 1e-9
+
+
+def test_run_metrics_findings_and_components():
+    metrics = ReviewMetrics()
+    metrics.register_component("queue", lambda: {"depth": 2, "max_depth": 10, "accepting": True, "mode": "fifo"})
+    metrics.register_component("broken", lambda: 1 / 0)
+    metrics.observe_analysis("completed", 0.2, {
+        "node_seconds": {"security": 0.05, "performance": 0.01},
+        "node_rss_delta_bytes": {"security": 70000},
+        "parse_seconds": 0.003
+    })
+    metrics.observe_findings({
+        "security": {"vulnerabilities": [{"severity": "HIGH"}, {"severity": "HIGH"}, {"severity": "LOW"}]},
+        "tests": {"test_cases": [{}]}
+    })
+    types, samples = parse(metrics.render())
+
+    values = {(name, tuple(sorted(labels.items()))): value for name, labels, value in samples}
+    assert values[("code_review_findings_total", (("section", "security"), ("severity", "high")))] == 2
+    assert values[("code_review_findings_total", (("section", "tests"), ("severity", "none")))] == 1
+    assert values[("code_review_analysis_duration_seconds_count", (("status", "completed"),))] == 1
+    assert values[("code_review_parse_duration_seconds_count", ())] == 1
+    assert values[("code_review_node_rss_delta_bytes_count", (("node", "security"),))] == 1
+
+    # 숫자 항목만 게이지로 출력하고 bool/문자열과 실패한 구성 요소는 건너뜀
+    assert types["code_review_queue_depth"] == "gauge"
+    assert values[("code_review_queue_max_depth", ())] == 10
+    assert "code_review_queue_accepting" not in types
+    assert "code_review_queue_mode" not in types
+    assert not any(name.startswith("code_review_broken") for name in types)
+    assert types["process_max_resident_memory_bytes"] == "gauge"
+
+
+def test_empty_registry_renders_help_and_type_only():
+    types, samples = parse(ReviewMetrics().render())
+    assert types["code_review_findings_total"] == "counter"
+    assert all(name.startswith("process_") for name, _, _ in samples)
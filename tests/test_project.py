@@ -0,0 +1,97 @@
+import ast
+import pickle
+import textwrap
+
+from analyzers.project import ProjectIndex, build_project_snapshot
+from analyzers.taint import TaintAnalyzer
+
+HELPERS = """
+import os
+
+def run_cmd(cmd):
+    os.system(cmd)
+
+def safe(cmd):
+    return len(cmd)
+"""
+
+
+def project(files):
+    return [(path, textwrap.dedent(source)) for path, source in files.items()]
+
+
+def flows(index, path, source):
+    vulnerabilities = TaintAnalyzer(project=index.context_for(path)).analyze(ast.parse(textwrap.dedent(source)))
+    return [(v.type, v.line_number) for v in vulnerabilities]
+
+
+def test_package_reexport_resolves_to_defining_module():
+    files = {
+        "repo-main/pkg/__init__.py": "from .helpers import run_cmd as run\n",
+        "repo-main/pkg/helpers.py": HELPERS,
+        "repo-main/app.py": "from pkg import run\n\ndef handler():\n    run(input())\n",
+        "repo-main/other.py": "import pkg\n\ndef handler():\n    pkg.run(input())\n",
+    }
+    index = ProjectIndex.build(project(files), cache=None)
+
+    exported = index.lookup("pkg.run")
+    assert exported is not None and exported is index.lookup("pkg.helpers.run_cmd")
+    assert index.lookup("pkg.safe") is None
+
+    for path in ("repo-main/app.py", "repo-main/other.py"):
+        assert flows(index, path, files[path]) == [("Command Injection", 4)]
+
+
+def test_reexport_chain_through_nested_packages():
+    files = {
+        "pkg/__init__.py": "from .sub import run_cmd\n",
+        "pkg/sub/__init__.py": "from pkg.sub.impl import run_cmd\n",
+        "pkg/sub/impl.py": HELPERS,
+        "main.py": "from pkg import run_cmd\n\ndef handler():\n    run_cmd(input())\n    run_cmd('ls')\n",
+    }
+    index = ProjectIndex.build(project(files), cache=None)
+    assert index.lookup("pkg.run_cmd") is index.lookup("pkg.sub.impl.run_cmd")
+    assert flows(index, "main.py", files["main.py"]) == [("Command Injection", 4)]
+    assert index.report()["cross_module_calls"] >= 1
+
+
+def test_unresolved_import_gives_no_context():
+    files = {
+        "pkg/__init__.py": "from .missing import run_cmd\n",
+        "main.py": "from pkg import run_cmd\n\ndef handler():\n    run_cmd(input())\n",
+    }
+    index = ProjectIndex.build(project(files), cache=None)
+    assert index.lookup("pkg.run_cmd") is None
+    assert index.context_for("main.py") is None
+
+
+def test_snapshot_is_picklable_and_keeps_contexts():
+    files = {
+        "pkg/__init__.py": "from .helpers import run_cmd\n",
+        "pkg/helpers.py": HELPERS,
+        "app.py": "from pkg import run_cmd\n\ndef handler():\n    run_cmd(input())\n",
+    }
+    snapshot = pickle.loads(pickle.dumps(build_project_snapshot(project(files), include_graph=True)))
+    context = snapshot.context_for("app.py")
+    assert context is not None and context.function("pkg.run_cmd") is not None
+    assert snapshot.report()["modules"] == 3
+    assert "call_graph" in snapshot.report(include_graph=True)
+    vulnerabilities = TaintAnalyzer(project=context).analyze(ast.parse(dict(project(files))["app.py"]))
+    assert [(v.type, v.line_number) for v in vulnerabilities] == [("Command Injection", 4)]
+
+
+def test_on_disk_build_matches_in_memory(tmp_path):
+    files = {
+        "pkg/__init__.py": "from .helpers import run_cmd\n",
+        "pkg/helpers.py": HELPERS,
+        "app.py": "from pkg import run_cmd\n\ndef handler():\n    run_cmd(input())\n",
+    }
+    local_files = []
+    for index, (path, source) in enumerate(project(files)):
+        local_path = tmp_path / f"{index}.src"
+        local_path.write_text(source, encoding="utf-8")
+        local_files.append((path, str(local_path)))
+    on_disk = ProjectIndex.build(local_files, cache=None, on_disk=True)
+    in_memory = ProjectIndex.build(project(files), cache=None)
+    assert on_disk.context_for("app.py").symbols == in_memory.context_for("app.py").symbols
+    assert all(entry.source is None for entry in on_disk.modules.values())
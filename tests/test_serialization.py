@@ -0,0 +1,30 @@
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+
+import serialization
+
+PAYLOAD = {
+    "review_id": "r-1",
+    "created_at": datetime(2025, 1, 25, 10, 0, 0, 435041),
+    "completed_at": datetime(2025, 1, 25, 10, 0, 1),
+    "aware": datetime(2025, 1, 25, 10, 0, 0, 1, tzinfo=timezone.utc),
+    "offset": datetime(2025, 1, 25, 19, 0, tzinfo=timezone(timedelta(hours=9))),
+    "day": date(2025, 1, 25),
+    "clock": time(10, 0, 0, 5),
+    "results": {"summary": {"security": True}, "score": 7.5, "text": "한글", "lines": [1, 2, None]},
+    "counts": {3: "three"},
+}
+
+
+@pytest.mark.skipif(serialization.orjson is None, reason="orjson not installed")
+def test_json_fallback_matches_orjson(monkeypatch):
+    fast = serialization.encode_json(PAYLOAD)
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert serialization.encode_json(PAYLOAD) == fast
+
+
+def test_json_fallback_uses_iso_8601(monkeypatch):
+    monkeypatch.setattr(serialization, "orjson", None)
+    encoded = serialization.encode_json({"created_at": datetime(2025, 1, 25, 10, 0, tzinfo=timezone.utc)})
+    assert encoded == b'{"created_at":"2025-01-25T10:00:00+00:00"}'
@@ -0,0 +1,123 @@
+import ast
+import textwrap
+
+from analyzers.taint import TaintAnalyzer
+
+
+def flows(source):
+    vulnerabilities = TaintAnalyzer().analyze(ast.parse(textwrap.dedent(source)))
+    return sorted((v.type, v.line_number, v.description) for v in vulnerabilities)
+
+
+def test_source_reaches_sink_directly():
+    assert flows("""
+        import os
+
+        def handler():
+            name = input()
+            command = "ls " + name
+            os.system(command)
+    """) == [("Command Injection", 7, "Untrusted input from input() (line 5) reaches os.system")]
+
+
+def test_import_alias_and_required_keyword():
+    assert flows("""
+        from subprocess import run
+
+        def handler(request):
+            target = request.args["path"]
+            run(target, shell=True)
+            run(target)
+    """) == [("Command Injection", 6,
+              "Untrusted input from parameter request (line 4) reaches subprocess.run (+1 more tainted flows)")]
+
+
+def test_sanitizer_and_overwrite_clear_taint():
+    assert flows("""
+        import os
+        import shlex
+
+        def handler():
+            name = input()
+            os.system("ls " + shlex.quote(name))
+            os.system(str(int(name)))
+            name = "fixed"
+            os.system(name)
+    """) == []
+
+
+def test_only_tainted_branch_is_reported():
+    assert flows("""
+        import os
+
+        def handler(flag):
+            value = "safe"
+            if flag:
+                value = input()
+            os.system(value)
+            os.system("echo")
+    """) == [("Command Injection", 8, "Untrusted input from input() (line 7) reaches os.system")]
+
+
+def test_interprocedural_parameter_sink():
+    assert flows("""
+        import os
+
+        def helper(cmd):
+            os.system(cmd)
+
+        def handler():
+            helper(input())
+            helper("ls")
+    """) == [("Command Injection", 5,
+              "Untrusted input from input() (line 8) reaches os.system through helper() called at line 8")]
+
+
+def test_interprocedural_return_and_sanitizing_helper():
+    assert flows("""
+        import sqlite3
+
+        def read_name():
+            return input()
+
+        def clean(value):
+            return int(value)
+
+        def handler(cursor):
+            cursor.execute("SELECT " + read_name())
+            cursor.execute("SELECT " + str(clean(read_name())))
+    """) == [("SQL Injection", 11, "Untrusted input from input() (line 5) reaches cursor.execute")]
+
+
+def test_method_call_through_self():
+    assert flows("""
+        import os
+
+        class Runner:
+            def run(self, cmd):
+                os.system(cmd)
+
+            def handle(self):
+                self.run(input())
+    """) == [("Command Injection", 6,
+              "Untrusted input from input() (line 9) reaches os.system through Runner.run() called at line 9")]
+
+
+def test_module_level_taint_seeds_functions():
+    assert flows("""
+        import os
+        import sys
+
+        TARGET = sys.argv[1]
+        SAFE = "ls"
+
+        def run_target():
+            os.system(TARGET)
+
+        def run_shadowed():
+            TARGET = "ls"
+            os.system(TARGET)
+
+        def run_safe():
+            os.system(SAFE)
+    """) == [("Command Injection", 9, "Untrusted input from sys.argv (line 5) reaches os.system")]
@@ -0,0 +1,48 @@
+from tracing import OtlpTraceExporter, ReviewTrace, make_span, timed_span
+
+
+def test_make_span_drops_empty_attributes():
+    span = make_span("security", 10.0, 10.25, findings=3, succeeded=None)
+    assert span == {"name": "security", "start": 10.0, "end": 10.25, "duration_ms": 250.0,
+                    "attributes": {"findings": 3}}
+
+
+def test_timed_span_records_attributes_added_inside():
+    spans = []
+    with timed_span(spans, "split", chunks=0) as attributes:
+        attributes["chunks"] = 3
+    (span,) = spans
+    assert span["name"] == "split"
+    assert span["attributes"] == {"chunks": 3}
+    assert span["end"] >= span["start"]
+
+
+def test_timeline_is_ordered_and_covers_all_spans():
+    trace = ReviewTrace("r-1")
+    trace.add("storage_write", 5.0, 5.5)
+    trace.extend([make_span("parse", 2.0, 2.5), make_span("security", 2.5, 4.0, findings=2)])
+    trace.add("queue_wait", 1.0, 2.0)
+    trace.extend([make_span("tests", 2.5, 3.0, findings=1)])
+
+    timeline = trace.to_dict(status="completed")
+    assert [span["name"] for span in timeline["spans"]] == ["queue_wait", "parse", "security", "tests", "storage_write"]
+    assert (timeline["name"], timeline["start"], timeline["end"]) == ("review", 1.0, 5.5)
+    assert timeline["duration_ms"] == 4500.0
+    assert timeline["attributes"] == {"status": "completed"}
+    assert timeline["review_id"] == "r-1" and timeline["trace_id"] == trace.trace_id
+    assert trace.finding_count() == 3
+
+
+def test_otlp_payload_parents_spans_to_review():
+    trace = ReviewTrace("r-2")
+    trace.add("parse", 1.0, 1.5, bytes=120)
+    timeline = trace.to_dict(status="completed")
+    (root, child) = OtlpTraceExporter("http://localhost:4318/v1/traces").payload(timeline)[
+        "resourceSpans"][0]["scopeSpans"][0]["spans"]
+
+    assert "parentSpanId" not in root
+    assert child["parentSpanId"] == root["spanId"]
+    assert root["traceId"] == child["traceId"] == trace.trace_id
+    assert child["startTimeUnixNano"] == "1000000000" and child["endTimeUnixNano"] == "1500000000"
+    assert {"key": "bytes", "value": {"intValue": "120"}} in child["attributes"]
+    assert {"key": "review.id", "value": {"stringValue": "r-2"}} in root["attributes"]
@@ -0,0 +1,144 @@
+import json
+import logging
+import os
+import time
+import urllib.request
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+# 스팬: {"name", "start", "end"(epoch 초), "duration_ms", "attributes"}
+Span = Dict[str, Any]
+
+
+def make_span(name: str, start: float, end: float, **attributes: Any) -> Span:
+    """스팬 dict 생성 (값이 None인 속성은 생략)"""
+    return {
+        "name": name,
+        "start": round(start, 6),
+        "end": round(end, 6),
+        "duration_ms": round((end - start) * 1000, 3),
+        "attributes": {key: value for key, value in attributes.items() if value is not None}
+    }
+
+
+@contextmanager
+def timed_span(spans: List[Span], name: str, **attributes: Any) -> Iterator[Dict[str, Any]]:
+    """감싼 구간을 스팬으로 spans에 추가 (넘겨받은 attributes dict에 속성을 더할 수 있음)
+
+    시작 시각은 epoch 기준(프로세스 간 비교 가능), 길이는 perf_counter로 잰다.
+    """
+    start = time.time()
+    started = time.perf_counter()
+    try:
+        yield attributes
+    finally:
+        spans.append(make_span(name, start, start + time.perf_counter() - started, **attributes))
+
+
+class ReviewTrace:
+    """리뷰 1건의 스팬 타임라인 (대기열 대기, 파싱, 노드별 실행, 직렬화, 저장)"""
+
+    def __init__(self, review_id: str):
+        self.review_id = review_id
+        self.trace_id = uuid4().hex
+        self.spans: List[Span] = []
+
+    def add(self, name: str, start: float, end: float, **attributes: Any) -> None:
+        self.spans.append(make_span(name, start, end, **attributes))
+
+    def extend(self, spans: List[Span]) -> None:
+        self.spans.extend(spans)
+
+    def span(self, name: str, **attributes: Any):
+        return timed_span(self.spans, name, **attributes)
+
+    def finding_count(self) -> int:
+        """노드 스팬에 기록된 발견 항목 수 합계"""
+        return sum(span["attributes"].get("findings", 0) for span in self.spans)
+
+    def to_dict(self, **attributes: Any) -> Dict[str, Any]:
+        """저장/응답용 타임라인 (스팬은 시작 순서)"""
+        spans = sorted(self.spans, key=lambda span: span["start"])
+        start = spans[0]["start"] if spans else time.time()
+        end = max((span["end"] for span in spans), default=start)
+        return {
+            "trace_id": self.trace_id,
+            "review_id": self.review_id,
+            **make_span("review", start, end, **attributes),
+            "spans": spans
+        }
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+def _unix_nanos(seconds: float) -> str:
+    return str(int(seconds * 1_000_000_000))
+
+
+class OtlpTraceExporter:
+    """리뷰 타임라인을 OTLP/HTTP(JSON) 수집기로 전송 (예: http://localhost:4318/v1/traces)
+
+    표준 라이브러리만 사용하며, 전송 실패는 로그만 남기고 리뷰 처리에는 영향을 주지 않는다.
+    """
+
+    def __init__(self, endpoint: str, service_name: str = "code-review", timeout: float = 2.0):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+
+    def payload(self, trace: Dict[str, Any]) -> Dict[str, Any]:
+        """타임라인을 OTLP resourceSpans로 변환 (review 스팬이 나머지 스팬의 부모)"""
+        root_id = os.urandom(8).hex()
+
+        def otlp_span(span: Span, span_id: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+            encoded = {
+                "traceId": trace["trace_id"],
+                "spanId": span_id,
+                "name": span["name"],
+                "kind": 1,
+                "startTimeUnixNano": _unix_nanos(span["start"]),
+                "endTimeUnixNano": _unix_nanos(span["end"]),
+                "attributes": _otlp_attributes(attributes)
+            }
+            if parent_id is not None:
+                encoded["parentSpanId"] = parent_id
+            return encoded
+
+        spans = [otlp_span(trace, root_id, None, {**trace["attributes"], "review.id": trace["review_id"]})]
+        spans.extend(otlp_span(span, os.urandom(8).hex(), root_id, span["attributes"]) for span in trace["spans"])
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": _otlp_attributes({"service.name": self.service_name})},
+                "scopeSpans": [{"scope": {"name": "code-review"}, "spans": spans}]
+            }]
+        }
+
+    def export(self, trace: Dict[str, Any]) -> bool:
+        """타임라인 1건 전송 (블로킹, 이벤트 루프에서는 스레드로 호출)"""
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json.dumps(self.payload(trace)).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return 200 <= response.status < 300
+        except Exception as e:
+            logger.error(f"OTLP trace export to {self.endpoint} failed: {e}")
+            return False
@@ -53,4 +53,84 @@ def summarize_findings(state) -> str:
     if summary_parts:
         return " and ".join(summary_parts) + " were found."
     else:
-        return "No issues were found."
\ No newline at end of file
+        return "No issues were found."
+
+class ReviewAggregator:
+    """파일별 리뷰 결과를 하나씩 받아 배치 전체 리포트를 누적 집계합니다.
+
+    개별 결과는 보관하지 않으므로 파일 수와 무관하게 메모리 사용량이 일정합니다.
+    """
+
+    TOP_RISKY_FILES = 5
+
+    def __init__(self):
+        self.completed = 0
+        self.failed = 0
+        self.severity_counts: Dict[str, int] = {}
+        self.totals = {"vulnerabilities": 0, "performance_issues": 0, "bugs": 0, "test_cases": 0}
+        self.score_sums = {"security_score": 0.0, "complexity_score": 0.0, "maintainability_score": 0.0}
+        self.score_counts = {name: 0 for name in self.score_sums}
+        self.file_risks: List[tuple] = []
+
+    def _add_score(self, name: str, section: Dict[str, Any]) -> None:
+        if name in section:
+            self.score_sums[name] += section[name]
+            self.score_counts[name] += 1
+
+    def add(self, filename: str, entry: Dict[str, Any]) -> None:
+        """파일 하나의 {status, results} 항목을 집계에 반영"""
+        if entry.get("status") == "failed":
+            self.failed += 1
+            return
+        if entry.get("status") != "completed":
+            return
+        self.completed += 1
+        results = entry.get("results") or {}
+
+        security = results.get("security") or {}
+        vulnerabilities = security.get("vulnerabilities", [])
+        self.totals["vulnerabilities"] += len(vulnerabilities)
+        for vulnerability in vulnerabilities:
+            severity = vulnerability["severity"]
+            self.severity_counts[severity] = self.severity_counts.get(severity, 0) + 1
+        self._add_score("security_score", security)
+
+        performance = results.get("performance") or {}
+        self.totals["performance_issues"] += len(performance.get("issues", []))
+        self._add_score("complexity_score", performance)
+
+        bugs = results.get("bugs") or {}
+        self.totals["bugs"] += len(bugs.get("bugs", []))
+        self._add_score("maintainability_score", bugs)
+
+        tests = results.get("tests") or {}
+        self.totals["test_cases"] += len(tests.get("test_cases", []))
+
+        # 취약점이 많은 상위 파일만 유지
+        if vulnerabilities:
+            self.file_risks.append((len(vulnerabilities), security.get("overall_risk", "UNKNOWN"), filename))
+            self.file_risks.sort(key=lambda item: item[0], reverse=True)
+            del self.file_risks[self.TOP_RISKY_FILES:]
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "files_completed": self.completed,
+            "files_failed": self.failed,
+            "totals": dict(self.totals),
+            "vulnerabilities_by_severity": dict(self.severity_counts),
+            "average_scores": {
+                name: round(self.score_sums[name] / self.score_counts[name], 2) if self.score_counts[name] else None
+                for name in self.score_sums
+            },
+            "riskiest_files": [
+                {"filename": filename, "vulnerabilities": count, "overall_risk": risk}
+                for count, risk, filename in self.file_risks
+            ]
+        }
+
+def aggregate_file_results(file_results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """파일별 리뷰 결과를 배치 전체 리포트로 집계합니다."""
+    aggregator = ReviewAggregator()
+    for filename, entry in file_results.items():
+        aggregator.add(filename, entry)
+    return aggregator.report()
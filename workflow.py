@@ -1,6 +1,12 @@
-from typing import Dict, Any
-from langgraph.graph import StateGraph, END
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+from langgraph.graph import StateGraph, START, END
 from models import CodeReviewState
+from metrics import FINDING_LISTS, current_rss_bytes
+from tracing import make_span
+from analyzers.context import build_analysis_context
+from analyzers.incremental import unit_findings_cache
 from agents import (
     security_analysis_agent,
     performance_analysis_agent,
@@ -9,82 +15,232 @@ from agents import (
     consolidation_agent
 )
 
+# 서로의 결과를 읽지 않는 독립 분석 노드 (실행 순서 유지)
+ANALYSIS_AGENTS = {
+    "security": security_analysis_agent,
+    "performance": performance_analysis_agent,
+    "bug_detection": bug_detection_agent,
+    "test_generation": test_generation_agent
+}
+
+WORKFLOW_MODES = ("parallel", "sequential")
+
+# 리뷰를 구성하는 전체 노드 (에이전트별 상태 보고 단위)
+REVIEW_NODES = [*ANALYSIS_AGENTS, "consolidation"]
+
+# 상태 필드 -> 저장/전송 결과 키
+RESULT_FIELDS = {
+    "security_findings": "security",
+    "performance_metrics": "performance",
+    "bug_analysis": "bugs",
+    "test_suggestions": "tests"
+}
+
+# 분석 에이전트 -> 결과를 담는 상태 필드
+AGENT_RESULT_FIELDS = {
+    "security": "security_findings",
+    "performance": "performance_metrics",
+    "bug_detection": "bug_analysis",
+    "test_generation": "test_suggestions"
+}
+
+# 노드 완료 콜백: (노드 이름, 노드가 반환한 상태 변경분) -> None
+NodeCompleteCallback = Callable[[str, Dict[str, Any]], None]
+
+def create_initial_state(code: str, filename: str, language: str, incremental: bool = False,
+                         finding_cap: int = 0, full_findings: bool = False, project=None,
+                         shared_lines=(), taint: bool = True) -> CodeReviewState:
+    """리뷰 시작 상태 생성 (공유 분석 컨텍스트 포함)
+
+    incremental이면 같은 파일명의 이전 리뷰에서 바뀐 최상위 단위만 다시 분석한다.
+    finding_cap은 규칙별로 결과 목록에 남길 항목 수(0이면 무제한), full_findings이면
+    잘린 항목까지 finding_details에 보관한다. project(analyzers.project.ProjectContext)는
+    여러 파일 리뷰에서 이 파일이 import한 다른 모듈의 함수 요약이다. shared_lines는 청크 분석에서
+    다른 청크 소속이지만 함께 파싱하는 공유 import 라인이다 (analyzers.chunking.SourceChunk).
+    taint가 False이면 입력 흐름 분석을 건너뛴다 (청크는 모듈 전체 분석 결과로 병합).
+    """
+    unit_cache = unit_findings_cache if incremental else None
+    return CodeReviewState(
+        code_content=code,
+        file_path=filename,
+        language=language,
+        current_phase="starting",
+        completion_status={phase: False for phase in REVIEW_NODES},
+        error_log=[],
+        confidence_scores={},
+        messages=[],
+        finding_cap=finding_cap,
+        full_findings=full_findings,
+        analysis_context=build_analysis_context(
+            code, filename, unit_cache, project, shared_lines, taint
+        )
+    )
+
+def collect_review_results(final_state: Dict[str, Any]) -> Dict[str, Any]:
+    """최종 상태에서 저장/전송 가능한(pickle 가능한) 결과 dict 추출"""
+    results = {
+        key: final_state.get(field).dict() if final_state.get(field) else None
+        for field, key in RESULT_FIELDS.items()
+    }
+    results["summary"] = final_state.get("completion_status")
+    return results
+
+def collect_review_metrics(initial_state: CodeReviewState, final_state: Dict[str, Any]) -> Dict[str, Any]:
+    """리뷰 1건의 계측값 (노드별 실행 시간과 RSS 증가량, 파싱/입력 흐름 분석 시간(초), 시작 순서의 노드 스팬)"""
+    context = initial_state.analysis_context
+    return {
+        "node_seconds": dict(final_state.get("node_seconds") or {}),
+        "node_rss_delta_bytes": dict(final_state.get("node_rss_delta_bytes") or {}),
+        "parse_seconds": context.parse_seconds if context is not None else None,
+        "taint_seconds": context.taint_seconds if context is not None else None,
+        "spans": sorted((final_state.get("node_spans") or {}).values(), key=lambda span: span["start"])
+    }
+
+def without_finding_details(results: Dict[str, Any]) -> Dict[str, Any]:
+    """결과 dict에서 에이전트별 finding_details(전체 상세 항목)를 뺀 사본 (상세는 별도 페이지로 조회)"""
+    return {
+        key: {name: value for name, value in section.items() if name != "finding_details"}
+        if isinstance(section, dict) and "finding_details" in section else section
+        for key, section in results.items()
+    }
+
+def node_progress_event(node: str, update: Dict[str, Any]) -> Dict[str, Any]:
+    """노드 하나의 상태 변경분을 전송 가능한 진행 이벤트로 변환"""
+    event = {
+        "node": node,
+        "current_phase": update.get("current_phase", node),
+        "completion_status": dict(update.get("completion_status") or {})
+    }
+    for field, key in RESULT_FIELDS.items():
+        if update.get(field) is not None:
+            event["result_key"] = key
+            event["result"] = update[field].dict()
+    if update.get("error_log"):
+        event["errors"] = list(update["error_log"])
+    return event
+
+def merged_progress_events(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """병합된 결과를 노드 순서의 진행 이벤트로 변환 (청크 분석처럼 노드 단위 이벤트를 그대로 전달할 수 없을 때)"""
+    summary = results.get("summary") or {}
+    events = []
+    for node in ANALYSIS_AGENTS:
+        key = RESULT_FIELDS[AGENT_RESULT_FIELDS[node]]
+        event = {"node": node, "current_phase": node, "completion_status": {node: bool(summary.get(node))}}
+        if results.get(key) is not None:
+            event["result_key"] = key
+            event["result"] = results[key]
+        events.append(event)
+    events.append({
+        "node": "consolidation",
+        "current_phase": "completed",
+        "completion_status": {"consolidation": bool(summary.get("consolidation"))}
+    })
+    return events
+
+def agent_status_from_summary(summary: Optional[Dict[str, bool]]) -> Dict[str, str]:
+    """최종 completion_status로 에이전트별 상태(completed / failed) 구성 (캐시 적중 등 진행 이벤트가 없을 때)"""
+    summary = summary or {}
+    return {node: "completed" if summary.get(node) else "failed" for node in REVIEW_NODES}
+
+def progress_config(on_node_complete: Optional[NodeCompleteCallback]) -> Optional[Dict[str, Any]]:
+    """노드 완료 콜백을 실행 설정(config)으로 전달 (컴파일된 그래프는 공유하고 콜백만 리뷰별로 다름)"""
+    if on_node_complete is None:
+        return None
+    return {"configurable": {"on_node_complete": on_node_complete}}
+
+def _finding_count(update: Dict[str, Any]) -> Optional[int]:
+    """노드 결과의 발견 항목 수 (결과 섹션이 없는 노드는 None)"""
+    for field, key in RESULT_FIELDS.items():
+        if update.get(field) is not None:
+            return len(getattr(update[field], FINDING_LISTS[key], None) or [])
+    return None
+
+def _report_progress(name: str, agent):
+    """에이전트를 감싸 실행 시간/RSS 증가량/스팬을 node_seconds/node_rss_delta_bytes/node_spans에 기록하고,
+    노드가 끝나는 즉시 설정의 콜백으로 변경분을 알림
+
+    병렬 모드에서는 같은 슈퍼스텝의 노드 출력이 스텝이 끝나야 함께 스트리밍되므로,
+    노드 안에서 직접 알려야 먼저 끝난 에이전트의 결과를 바로 내보낼 수 있다.
+    """
+    def node(state: CodeReviewState, config) -> Dict[str, Any]:
+        started_at = time.time()
+        rss_before = current_rss_bytes()
+        start = time.perf_counter()
+        update = agent(state)
+        elapsed = time.perf_counter() - start
+        rss_after = current_rss_bytes()
+        update["node_seconds"] = {name: elapsed}
+        if rss_before is not None and rss_after is not None:
+            update["node_rss_delta_bytes"] = {name: max(rss_after - rss_before, 0)}
+        update["node_spans"] = {name: make_span(
+            name, started_at, started_at + elapsed,
+            findings=_finding_count(update), succeeded=(update.get("completion_status") or {}).get(name)
+        )}
+        on_node_complete = (config or {}).get("configurable", {}).get("on_node_complete")
+        if on_node_complete is not None:
+            on_node_complete(name, update)
+        return update
+    node.__name__ = getattr(agent, "__name__", name)
+    return node
+
 def should_continue(state: CodeReviewState) -> str:
-    """워크플로우 계속 여부 결정"""
-    # 모든 단계가 완료되었는지 확인
-    required_phases = ["security", "performance", "bug_detection", "test_generation"]
-    completed_phases = [phase for phase in required_phases if state.completion_status.get(phase, False)]
-    
-    if len(completed_phases) < len(required_phases):
-        # 다음 미완료 단계로 이동
-        next_phase = next(phase for phase in required_phases if not state.completion_status.get(phase, False))
+    """워크플로우 계속 여부 결정
+
+    실패한 에이전트(completion_status가 False)도 다시 실행하지 않도록 성공 여부가 아니라
+    실행 여부(노드 래퍼가 기록하는 node_seconds)로 다음 단계를 고른다. 실패는 통합 단계에서 반영된다.
+    """
+    # 아직 실행하지 않은 다음 단계로 이동
+    next_phase = next((phase for phase in ANALYSIS_AGENTS if phase not in state.node_seconds), None)
+    if next_phase is not None:
         state.current_phase = next_phase
         return next_phase
-    else:
-        # 모든 단계 완료, 통합 단계로
-        state.current_phase = "consolidation"
-        return "consolidation"
+    # 모든 단계 실행 완료, 통합 단계로
+    state.current_phase = "consolidation"
+    return "consolidation"
+
+def build_code_review_workflow(mode: str = "parallel") -> StateGraph:
+    """코드 리뷰 워크플로우 구성
+
+    - parallel: 네 분석 노드를 동시에 실행(fan-out)한 뒤 consolidation에서 합류(fan-in)
+    - sequential: should_continue 조건부 라우팅으로 한 노드씩 순차 실행
+    """
+    if mode not in WORKFLOW_MODES:
+        raise ValueError(f"Unknown workflow mode: {mode} (expected one of {WORKFLOW_MODES})")
 
-def build_code_review_workflow() -> StateGraph:
-    """코드 리뷰 워크플로우 구성"""
     workflow = StateGraph(CodeReviewState)
     
     # 노드 추가
-    workflow.add_node("security", security_analysis_agent)
-    workflow.add_node("performance", performance_analysis_agent)
-    workflow.add_node("bug_detection", bug_detection_agent)
-    workflow.add_node("test_generation", test_generation_agent)
-    workflow.add_node("consolidation", consolidation_agent)
-    
-    # 시작점 설정
-    workflow.set_entry_point("security")
-    
-    # 엣지 추가 (조건부 라우팅)
-    workflow.add_conditional_edges(
-        "security",
-        should_continue,
-        {
-            "performance": "performance",
-            "bug_detection": "bug_detection",
-            "test_generation": "test_generation",
-            "consolidation": "consolidation"
-        }
-    )
+    for name, agent in ANALYSIS_AGENTS.items():
+        workflow.add_node(name, _report_progress(name, agent))
+    workflow.add_node("consolidation", _report_progress("consolidation", consolidation_agent))
     
-    workflow.add_conditional_edges(
-        "performance",
-        should_continue,
-        {
-            "security": "security",
-            "bug_detection": "bug_detection",
-            "test_generation": "test_generation",
-            "consolidation": "consolidation"
-        }
-    )
-    
-    workflow.add_conditional_edges(
-        "bug_detection",
-        should_continue,
-        {
-            "security": "security",
-            "performance": "performance",
-            "test_generation": "test_generation",
-            "consolidation": "consolidation"
-        }
-    )
-    
-    workflow.add_conditional_edges(
-        "test_generation",
-        should_continue,
-        {
-            "security": "security",
-            "performance": "performance",
-            "bug_detection": "bug_detection",
-            "consolidation": "consolidation"
-        }
-    )
+    if mode == "parallel":
+        # fan-out: 모든 분석 노드를 시작점에 연결
+        for name in ANALYSIS_AGENTS:
+            workflow.add_edge(START, name)
+        # fan-in: 모든 분석 노드가 끝나면 통합 단계 실행 (상태는 리듀서로 병합)
+        workflow.add_edge(list(ANALYSIS_AGENTS), "consolidation")
+    else:
+        # 시작점 설정
+        workflow.set_entry_point("security")
+        
+        # 엣지 추가 (조건부 라우팅)
+        for name in ANALYSIS_AGENTS:
+            workflow.add_conditional_edges(
+                name,
+                should_continue,
+                {phase: phase for phase in [*ANALYSIS_AGENTS, "consolidation"] if phase != name}
+            )
     
     # 통합 단계는 종료로
     workflow.add_edge("consolidation", END)
     
-    return workflow.compile()
\ No newline at end of file
+    return workflow.compile()
+
+@lru_cache()
+def get_code_review_workflow(mode: str = "parallel"):
+    """모드별로 한 번만 컴파일된 워크플로우를 캐시하여 반환
+
+    컴파일된 그래프는 체크포인터 없이 불변이므로 동시 리뷰 간에 안전하게 공유된다.
+    """
+    return build_code_review_workflow(mode)
\ No newline at end of file